@@ -10,6 +10,7 @@ from apps.models import (
     Image,
     Keyword,
     KeywordClickLog,
+    KeywordPopularity,
     User,
     UserInterest,
 )
@@ -139,8 +140,15 @@ class KeywordClickLogAdmin(admin.ModelAdmin):
     search_fields = ("user__email", "user__nickname", "keyword__title")
 
 
+@admin.register(KeywordPopularity)
+class KeywordPopularityAdmin(admin.ModelAdmin):
+    list_display = ("keyword", "click_count", "score", "snapshot_at")
+    ordering = ("-score",)
+    search_fields = ("keyword__title",)
+
+
 @admin.register(ClovaStudioLog)
 class ClovaStudioLogAdmin(admin.ModelAdmin):
-    list_display = ("id", "keyword", "status", "response_time_ms", "requested_at")
+    list_display = ("id", "keyword", "status", "response_time_ms", "prompt_tokens", "queue_wait_ms", "requested_at")
     list_filter = ("status",)
     search_fields = ("keyword__title",)
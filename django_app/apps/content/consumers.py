@@ -0,0 +1,27 @@
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+
+from apps.utils.generation_jobs import user_group
+
+
+class GenerationJobConsumer(AsyncJsonWebsocketConsumer):
+    """
+    Clova 생성 잡 완료 알림 (ws/generation/?token=<access token>)
+    - 연결한 사용자의 잡이 끝나면 {"type": "generation.job", "job": {...}} 을 전달
+    - 인증 실패 시 4401 로 연결 종료
+    """
+
+    async def connect(self):
+        user = self.scope.get("user")
+        if user is None or not user.is_authenticated:
+            await self.close(code=4401)
+            return
+        self.group_name = user_group(user.id)
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+
+    async def disconnect(self, code):
+        if getattr(self, "group_name", None):
+            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def generation_job(self, event):
+        await self.send_json({"type": "generation.job", "job": event["job"]})
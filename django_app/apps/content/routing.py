@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .consumers import GenerationJobConsumer
+
+websocket_urlpatterns = [
+    path("ws/generation/", GenerationJobConsumer.as_asgi()),
+]
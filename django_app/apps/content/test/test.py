@@ -0,0 +1,49 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.models import User
+from apps.utils.generation_jobs import JOB_PENDING_TIMEOUT, job_cache_key
+
+
+class GenerateJobSubmitAPITest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create(email="u@example.com", social_id="1", nickname="u", provider="kakao")
+        self.client.force_authenticate(self.user)
+        self.url = reverse("content:generation_job_submit")
+
+    @patch("apps.content.views_generation_job_proxy.requests.post")
+    def test_invalid_keyword_id_returns_400(self, post):
+        for body in ({}, {"keyword_id": ""}, {"keyword_id": "abc"}, {"keyword_id": [1]}):
+            response = self.client.post(self.url, body, format="json")
+            self.assertEqual(response.status_code, 400, body)
+        post.assert_not_called()
+
+    @patch("apps.content.views_generation_job_proxy.requests.post")
+    def test_submit_forwards_int_keyword_id(self, post):
+        post.return_value.status_code = 202
+        post.return_value.json.return_value = {"job_id": "j1", "status": "queued"}
+
+        response = self.client.post(self.url, {"keyword_id": "7"}, format="json")
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(post.call_args.kwargs["json"], {"keyword_id": 7, "user_id": self.user.id})
+        self.assertEqual(cache.get(job_cache_key("j1"))["status"], "queued")
+
+    @patch("apps.content.views_generation_job_proxy.time.time")
+    @patch("apps.content.views_generation_job_proxy.requests.post")
+    def test_stale_pending_job_is_reported_failed(self, post, now):
+        post.return_value.status_code = 202
+        post.return_value.json.return_value = {"job_id": "j2", "status": "pending", "user_id": self.user.id}
+        now.return_value = 1000.0
+        self.client.post(self.url, {"keyword_id": 7}, format="json")
+        status_url = reverse("content:generation_job_status", args=["j2"])
+
+        self.assertEqual(self.client.get(status_url).json()["status"], "pending")
+        now.return_value = 1000.0 + JOB_PENDING_TIMEOUT + 1
+        self.assertEqual(self.client.get(status_url).json()["status"], "failed")
@@ -4,14 +4,28 @@ from .views_fetch_article_job_proxy import (
     ArticleJobStartAPIView,
     ArticleJobStatusAPIView,
 )
-from .views_generate_proxy import GenerateProxyAPIView
+from .views_generate_proxy import GenerateProxyAPIView, GenerateStreamProxyAPIView
+from .views_generation_job_proxy import (
+    GenerateJobSubmitAPIView,
+    GenerationJobStatusAPIView,
+    RegenerateJobSubmitAPIView,
+)
 from .views_regenerate_proxy import RegenerateProxyAPIView
 
 app_name = "content"
 
 urlpatterns = [
     path("generate/", GenerateProxyAPIView.as_view(), name="generate"),
+    path("generate/stream/", GenerateStreamProxyAPIView.as_view(), name="generate_stream"),
     path("regenerate/<int:post_id>/", RegenerateProxyAPIView.as_view(), name="regenerate"),
+    #  생성 잡 (즉시 job_id 반환 → ws/generation/ 알림 또는 폴링)
+    path("generate/jobs/", GenerateJobSubmitAPIView.as_view(), name="generation_job_submit"),
+    path("generate/jobs/<str:job_id>/", GenerationJobStatusAPIView.as_view(), name="generation_job_status"),
+    path(
+        "regenerate/<int:post_id>/jobs/",
+        RegenerateJobSubmitAPIView.as_view(),
+        name="regeneration_job_submit",
+    ),
     #  기사 수집 잡 프록시
     path(
         "articles/job/start/",
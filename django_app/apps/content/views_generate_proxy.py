@@ -1,6 +1,8 @@
 import os
 
 import requests
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
 from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -45,5 +47,70 @@ class GenerateProxyAPIView(APIView):
             )
 
         if r.status_code >= 400:
-            return Response(data, status=r.status_code)
+            response = Response(data, status=r.status_code)
+            # Clova 대기열 초과(503) 시 재시도 시점 전달
+            if r.headers.get("Retry-After"):
+                response["Retry-After"] = r.headers["Retry-After"]
+            return response
         return Response(data, status=200)
+
+
+async def _relay_sse(r: requests.Response):
+    """FastAPI SSE 응답을 받은 그대로 전달 (ASGI 에서는 청크 도착 즉시 클라이언트로 흘려보냄)"""
+    chunks = r.iter_content(chunk_size=None)
+    read = sync_to_async(next, thread_sensitive=False)
+    try:
+        while (chunk := await read(chunks, None)) is not None:
+            yield chunk
+    finally:
+        r.close()
+
+
+class GenerateStreamProxyAPIView(APIView):
+    """
+    Clova 콘텐츠 스트리밍 생성 프록시 (text/event-stream)
+    - event: title / paragraph (단락 HTML) / done (post_id) / error
+    - 클라이언트 연결이 끊겨도 FastAPI 쪽 생성/저장은 끝까지 진행됨
+    """
+
+    permission_classes = [IsUser]
+
+    def post(self, request):
+        keyword_id = request.data.get("keyword_id")
+        if keyword_id in (None, ""):
+            return Response({"detail": "keyword_id is required"}, status=400)
+        try:
+            keyword_id = int(keyword_id)
+        except (TypeError, ValueError):
+            return Response({"detail": "keyword_id must be an integer"}, status=400)
+
+        url = f"{FASTAPI_BASE}/api/v1/internal/generate-clova-post/stream"
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "text/event-stream",
+            "X-Internal-Secret": INTERNAL_SECRET,
+        }
+        payload = {
+            "keyword_id": keyword_id,
+            "user_id": int(request.user.id),
+        }
+
+        try:
+            # 연결 5초, 청크 사이 대기 90초 (Clova 단락 생성 간격 기준)
+            r = requests.post(url, json=payload, headers=headers, stream=True, timeout=(5, 90))
+        except requests.RequestException as e:
+            return Response({"status": "fail", "error_message": str(e)}, status=502)
+
+        if r.status_code >= 400:
+            try:
+                data = r.json()
+            except ValueError:
+                data = {"status": "fail", "error_message": "invalid json from fastapi"}
+            finally:
+                r.close()
+            return Response(data, status=r.status_code)
+
+        response = StreamingHttpResponse(_relay_sse(r), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # nginx 버퍼링 해제
+        return response
@@ -0,0 +1,98 @@
+import os
+import time
+
+import requests
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.utils.generation_jobs import JOB_CACHE_TTL, JOB_PENDING_TIMEOUT, job_cache_key
+from apps.utils.permissions import IsAdmin, IsUser
+
+FASTAPI_BASE = os.getenv("FASTAPI_BASE", "http://127.0.0.1:8001")
+INTERNAL_SECRET = os.getenv("INTERNAL_SECRET") or os.getenv("INTERNAL_SECRET_KEY") or ""
+
+# 잡 등록만 하므로 Clova 응답을 기다리지 않음 (연결 3초, 응답 5초)
+SUBMIT_TIMEOUT = (3, 5)
+
+
+def _submit_job(payload: dict) -> Response:
+    """FastAPI 잡 큐에 등록하고 job_id 를 바로 반환 (완료는 ws/generation/ 또는 폴링으로 확인)"""
+    url = f"{FASTAPI_BASE}/api/v1/internal/generate-clova-post/jobs"
+    headers = {"X-Internal-Secret": INTERNAL_SECRET}
+    try:
+        r = requests.post(url, json=payload, headers=headers, timeout=SUBMIT_TIMEOUT)
+    except requests.RequestException as e:
+        return Response({"status": "fail", "error_message": str(e)}, status=502)
+
+    try:
+        data = r.json()
+    except ValueError:
+        return Response({"status": "fail", "error_message": "invalid json from fastapi"}, status=502)
+
+    if r.status_code >= 400:
+        response = Response(data, status=r.status_code)
+        if r.headers.get("Retry-After"):
+            response["Retry-After"] = r.headers["Retry-After"]
+        return response
+
+    # 완료 콜백이 먼저 도착했을 수 있으므로 add (이미 있으면 덮어쓰지 않음)
+    cache.add(job_cache_key(data["job_id"]), {**data, "submitted_at": time.time()}, JOB_CACHE_TTL)
+    return Response(
+        {
+            "job_id": data["job_id"],
+            "status": data["status"],
+            "status_url": reverse("content:generation_job_status", args=[data["job_id"]]),
+            "ws_url": "/ws/generation/",
+        },
+        status=status.HTTP_202_ACCEPTED,
+    )
+
+
+class GenerateJobSubmitAPIView(APIView):
+    """Clova 콘텐츠 생성 잡 등록 (202 + job_id)"""
+
+    permission_classes = [IsUser]
+
+    def post(self, request):
+        keyword_id = request.data.get("keyword_id")
+        if keyword_id in (None, ""):
+            return Response({"detail": "keyword_id is required"}, status=400)
+        try:
+            keyword_id = int(keyword_id)
+        except (TypeError, ValueError):
+            return Response({"detail": "keyword_id must be an integer"}, status=400)
+        return _submit_job({"keyword_id": keyword_id, "user_id": int(request.user.id)})
+
+
+class RegenerateJobSubmitAPIView(APIView):
+    """Clova 콘텐츠 재생성 잡 등록 (관리자, 202 + job_id)"""
+
+    permission_classes = [IsAdmin]
+
+    def post(self, request, post_id: int):
+        return _submit_job({"post_id": post_id, "user_id": int(request.user.id)})
+
+
+class GenerationJobStatusAPIView(APIView):
+    """
+    생성 잡 상태 조회 (폴링용)
+    - Django 캐시만 조회 (FastAPI 호출 없음)
+    - 본인 잡만 조회 가능
+    - JOB_PENDING_TIMEOUT 이 지나도 완료 콜백이 없으면 failed 로 응답 (FastAPI 재시작으로 잡이 사라진 경우)
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, job_id: str):
+        job = cache.get(job_cache_key(job_id))
+        if not job or job.get("user_id") != request.user.id:
+            return Response({"detail": "job not found"}, status=404)
+        if (
+            job.get("status") in ("pending", "running")
+            and time.time() - job.get("submitted_at", 0) > JOB_PENDING_TIMEOUT
+        ):
+            job = {**job, "status": "failed", "error": "생성 잡이 제한 시간 내에 완료되지 않았습니다."}
+        return Response(job, status=200)
@@ -49,4 +49,8 @@ class RegenerateProxyAPIView(APIView):
                 status=502,
             )
 
-        return Response(data, status=r.status_code if r.status_code >= 400 else 200)
+        response = Response(data, status=r.status_code if r.status_code >= 400 else 200)
+        # Clova 대기열 초과(503) 시 재시도 시점 전달
+        if r.headers.get("Retry-After"):
+            response["Retry-After"] = r.headers["Retry-After"]
+        return response
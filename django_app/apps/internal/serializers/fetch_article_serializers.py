@@ -47,5 +47,5 @@ class ScrapedArticleCreateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Article
-        fields = ["keyword_id", "title", "content", "origin_link"]
+        fields = ["keyword_id", "title", "content", "condensed_content", "origin_link"]
         list_serializer_class = ScrapedArticleListSerializer
@@ -3,7 +3,7 @@ import logging
 from django.utils import timezone
 from rest_framework import serializers
 
-from apps.models import GeneratedPost
+from apps.models import ClovaStudioLog, GeneratedPost
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +12,10 @@ logger = logging.getLogger(__name__)
 class ArticleWithImagesSerializer(serializers.Serializer):
     keyword_title = serializers.CharField(source="title")
     content = serializers.CharField()
+    condensed_content = serializers.CharField(allow_null=True)
     image_urls = serializers.ListField(child=serializers.URLField(), max_length=3)
+    stored_paths = serializers.ListField(child=serializers.CharField(allow_null=True), max_length=3)
+    variant_widths = serializers.ListField(child=serializers.ListField(child=serializers.IntegerField()), max_length=3)
 
 
 # 생성 컨텐츠 저장 007
@@ -38,6 +41,18 @@ class ClovaFailLogSerializer(serializers.Serializer):
     response_time_ms = serializers.IntegerField(required=False)
 
 
+# 버퍼링된 Clova 로그 일괄 저장
+class ClovaLogBulkItemSerializer(serializers.Serializer):
+    keyword_id = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=ClovaStudioLog.ClovaStatus.choices)
+    error_message = serializers.CharField(required=False, allow_null=True, allow_blank=True)
+    response_time_ms = serializers.IntegerField(required=False, allow_null=True)
+    prompt_tokens = serializers.IntegerField(required=False, allow_null=True)
+    completion_tokens = serializers.IntegerField(required=False, allow_null=True)
+    queue_wait_ms = serializers.IntegerField(required=False, allow_null=True)
+    requested_at = serializers.DateTimeField(required=False)
+
+
 class InternalGeneratedPostDetailSerializer(serializers.ModelSerializer):
     """clova로 생성된 콘텐츠 조회"""
 
@@ -0,0 +1,41 @@
+from rest_framework import serializers
+
+from apps.models import ClovaStudioLog
+
+
+# 생성 컨텍스트 조회 (기존 글 + 기사 + 이미지 한 번에)
+class GenerationContextRequestSerializer(serializers.Serializer):
+    keyword_id = serializers.IntegerField(required=False)
+    user_id = serializers.IntegerField(required=False)
+    post_id = serializers.IntegerField(required=False, help_text="재생성 시 대상 글 ID (keyword_id 대신)")
+    use_draft = serializers.BooleanField(default=False)
+
+    def validate(self, attrs):
+        if not attrs.get("post_id") and not (attrs.get("keyword_id") and attrs.get("user_id")):
+            raise serializers.ValidationError("post_id 또는 keyword_id + user_id 가 필요합니다.")
+        return attrs
+
+
+# 생성 결과 커밋 (글 저장 + Clova 로그, 한 트랜잭션)
+class GenerationCommitSerializer(serializers.Serializer):
+    keyword_id = serializers.IntegerField()
+    user_id = serializers.IntegerField()
+    post_id = serializers.IntegerField(required=False, allow_null=True, help_text="재생성 시 덮어쓸 글 ID")
+    status = serializers.ChoiceField(choices=ClovaStudioLog.ClovaStatus.choices)
+    title = serializers.CharField(max_length=255, required=False)
+    content = serializers.CharField(required=False)
+    image_1_url = serializers.URLField(required=False, allow_null=True, allow_blank=True)
+    image_2_url = serializers.URLField(required=False, allow_null=True, allow_blank=True)
+    image_3_url = serializers.URLField(required=False, allow_null=True, allow_blank=True)
+    response_time_ms = serializers.IntegerField(required=False, allow_null=True)
+    error_message = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    deactivate_keyword = serializers.BooleanField(default=False, help_text="실패 시 키워드 비활성화 여부")
+    write_log = serializers.BooleanField(
+        default=True,
+        help_text="ClovaStudioLog 를 같이 저장할지 여부 (FastAPI 가 로그를 버퍼링해 clova-log/bulk/ 로 보내면 false)",
+    )
+
+    def validate(self, attrs):
+        if attrs["status"] == ClovaStudioLog.ClovaStatus.SUCCESS and not (attrs.get("title") and attrs.get("content")):
+            raise serializers.ValidationError("성공 커밋에는 title, content 가 필요합니다.")
+        return attrs
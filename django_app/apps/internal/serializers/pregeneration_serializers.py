@@ -0,0 +1,21 @@
+from rest_framework import serializers
+
+from apps.models import Keyword, KeywordDraft
+
+
+class PregenerationCandidateSerializer(serializers.ModelSerializer):
+    clicks = serializers.IntegerField()
+    interest = serializers.IntegerField()
+    score = serializers.FloatField()
+
+    class Meta:
+        model = Keyword
+        fields = ["id", "title", "category", "clicks", "interest", "score"]
+
+
+class KeywordDraftSaveSerializer(serializers.ModelSerializer):
+    keyword_id = serializers.PrimaryKeyRelatedField(queryset=Keyword.objects.all(), source="keyword")
+
+    class Meta:
+        model = KeywordDraft
+        fields = ["keyword_id", "title", "content", "image_1_url", "image_2_url", "image_3_url", "response_time_ms"]
@@ -2,6 +2,7 @@ from django.db.models import Q
 from rest_framework import serializers
 
 from apps.models import Keyword
+from apps.utils.feed_cache import bump_feed_version
 
 
 class ScrapedKeywordBulkListSerializer(serializers.ListSerializer):
@@ -62,6 +63,8 @@ class ScrapedKeywordBulkListSerializer(serializers.ListSerializer):
                 to_update,
                 ["collected_at", "source_category", "is_collected", "is_active"],
             )
+        if to_create or to_update:
+            bump_feed_version()
 
         return {
             "created": to_create,
@@ -12,3 +12,24 @@ class KeywordImageTargetSerializer(serializers.ModelSerializer):
 class ImageSaveRequestSerializer(serializers.Serializer):
     keyword_id = serializers.IntegerField()
     images = serializers.ListField(child=serializers.URLField(), max_length=3, allow_empty=False)
+
+
+class ImageBulkItemSerializer(serializers.Serializer):
+    keyword_id = serializers.IntegerField()
+    images = serializers.ListField(child=serializers.URLField(), max_length=3, allow_empty=True)
+    # images 와 같은 순서의 media 저장 경로 (저장하지 못한 이미지는 null)
+    stored_paths = serializers.ListField(
+        child=serializers.CharField(max_length=255, allow_null=True),
+        max_length=3,
+        required=False,
+    )
+    # images 와 같은 순서의 변환본 폭 목록 (저장본이 없으면 빈 리스트)
+    variant_widths = serializers.ListField(
+        child=serializers.ListField(child=serializers.IntegerField(min_value=1)),
+        max_length=3,
+        required=False,
+    )
+
+
+class ImageBulkSaveRequestSerializer(serializers.Serializer):
+    items = ImageBulkItemSerializer(many=True, allow_empty=False)
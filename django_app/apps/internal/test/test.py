@@ -1,6 +1,22 @@
-from django.test import TestCase
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.test import TestCase, override_settings
 from rest_framework.test import APIClient
 
+from apps.models import (
+    Article,
+    ClovaStudioLog,
+    GeneratedPost,
+    Image,
+    Keyword,
+    KeywordClickLog,
+    KeywordDraft,
+    User,
+    UserInterest,
+)
+from apps.utils.generation_jobs import user_group
+from config.settings import INTERNAL_SECRET
+
 
 class KeywordCreateAPITest(TestCase):
     def setUp(self):
@@ -24,3 +40,213 @@ class KeywordCreateAPITest(TestCase):
         response = self.client.post("/api/internal/posts/", mock_payload, format="json")
         self.assertEqual(response.status_code, 201, msg=f"응답 본문: {response.content}")
         print(response.json())
+
+
+class ImageTargetLeaseAPITest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.keywords = []
+        for i in range(3):
+            keyword = Keyword.objects.create(title=f"키워드{i}", category="연예", source_category="엔터 종합")
+            Article.objects.create(keyword=keyword, title=f"기사{i}", content="본문", origin_link="https://example.com")
+            self.keywords.append(keyword)
+        # 기사 없는 키워드는 대상 아님
+        Keyword.objects.create(title="기사없음", category="연예", source_category="엔터 종합")
+
+    def test_lease_does_not_hand_out_same_keyword_twice(self):
+        first = self.client.post("/api/internal/keywords/image-targets/lease/?limit=2")
+        second = self.client.post("/api/internal/keywords/image-targets/lease/?limit=2")
+
+        self.assertEqual(first.status_code, 200)
+        first_ids = [k["id"] for k in first.json()]
+        second_ids = [k["id"] for k in second.json()]
+        self.assertEqual(first_ids, [self.keywords[0].id, self.keywords[1].id])
+        self.assertEqual(second_ids, [self.keywords[2].id])
+
+    def test_lease_skips_keyword_with_images(self):
+        Image.objects.create(keyword=self.keywords[0], image_url="https://example.com/1.jpg", order=1)
+
+        leased = self.client.post("/api/internal/keywords/image-targets/lease/?limit=10").json()
+
+        self.assertEqual([k["id"] for k in leased], [self.keywords[1].id, self.keywords[2].id])
+
+    def test_bulk_save_is_idempotent_and_marks_collected(self):
+        keyword = self.keywords[0]
+        payload = {
+            "items": [
+                {"keyword_id": keyword.id, "images": ["https://example.com/1.jpg", "https://example.com/2.jpg"]},
+                {"keyword_id": 999999, "images": []},
+            ]
+        }
+        for _ in range(2):  # 재시도
+            response = self.client.post("/api/internal/images/bulk/", payload, format="json")
+            self.assertEqual(response.status_code, 201, msg=f"응답 본문: {response.content}")
+
+        self.assertEqual(Image.objects.filter(keyword=keyword).count(), 2)
+        self.assertEqual(response.json()["missing_ids"], [999999])
+        keyword.refresh_from_db()
+        self.assertTrue(keyword.is_collected)
+
+        leased = self.client.post("/api/internal/keywords/image-targets/lease/?limit=10").json()
+        self.assertNotIn(keyword.id, [k["id"] for k in leased])
+
+
+@override_settings(CHANNEL_LAYERS={"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}})
+class GenerationJobCompleteAPITest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create(email="owner@example.com", social_id="1", nickname="owner", provider="kakao")
+        self.other = User.objects.create(email="other@example.com", social_id="2", nickname="other", provider="kakao")
+        self.job = {
+            "job_id": "job-1",
+            "kind": "generate",
+            "user_id": self.user.id,
+            "keyword_id": 1,
+            "post_id": None,
+            "status": "done",
+            "result": {"status": "success", "post_id": 10},
+            "error": None,
+        }
+
+    def test_complete_pushes_to_owner_and_is_pollable(self):
+        layer = get_channel_layer()
+        channel = async_to_sync(layer.new_channel)()
+        async_to_sync(layer.group_add)(user_group(self.user.id), channel)
+
+        response = self.client.post(
+            "/api/internal/generation-jobs/complete/",
+            self.job,
+            format="json",
+            HTTP_X_INTERNAL_SECRET=INTERNAL_SECRET,
+        )
+        self.assertEqual(response.status_code, 200, msg=f"응답 본문: {response.content}")
+        self.assertEqual(async_to_sync(layer.receive)(channel), {"type": "generation.job", "job": self.job})
+
+        self.client.force_authenticate(self.user)
+        response = self.client.get("/api/generate/jobs/job-1/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["result"]["post_id"], 10)
+
+        self.client.force_authenticate(self.other)
+        self.assertEqual(self.client.get("/api/generate/jobs/job-1/").status_code, 404)
+
+    def test_complete_requires_internal_secret(self):
+        response = self.client.post("/api/internal/generation-jobs/complete/", self.job, format="json")
+        self.assertEqual(response.status_code, 401)
+
+
+class PregenerationAPITest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.client.credentials(HTTP_X_INTERNAL_SECRET=INTERNAL_SECRET)
+        self.user = User.objects.create(email="u@example.com", social_id="1", nickname="u", provider="kakao")
+        self.hot, self.cold, self.quiet = [
+            Keyword.objects.create(title=title, category=category, source_category="종합", is_collected=True)
+            for title, category in (("인기", "연예"), ("관심", "경제"), ("조용", "여행"))
+        ]
+        for keyword in (self.hot, self.cold, self.quiet):
+            Article.objects.create(keyword=keyword, title="기사", content="본문", origin_link="https://example.com")
+        for _ in range(3):
+            KeywordClickLog.objects.create(user=self.user, keyword=self.hot)
+        UserInterest.objects.create(user=self.user, category="경제")
+
+    def test_candidates_ranked_by_click_velocity_and_interest(self):
+        response = self.client.get("/api/internal/keywords/pregeneration-candidates/?limit=5")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([k["id"] for k in response.json()], [self.hot.id, self.cold.id])
+
+    def test_draft_is_used_for_user_generation(self):
+        response = self.client.post(
+            "/api/internal/keyword-drafts/",
+            {"keyword_id": self.hot.id, "title": "초안", "content": "<h1>초안</h1>"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201, msg=f"응답 본문: {response.content}")
+
+        candidates = self.client.get("/api/internal/keywords/pregeneration-candidates/").json()
+        self.assertNotIn(self.hot.id, [k["id"] for k in candidates])
+
+        payload = {"keyword_id": self.hot.id, "user_id": self.user.id}
+        self.assertEqual(self.client.post("/api/internal/generated-posts/preview/", payload).status_code, 204)
+
+        response = self.client.post("/api/internal/generated-posts/preview/", {**payload, "use_draft": True})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["from_draft"])
+        self.assertEqual(GeneratedPost.objects.get(id=response.json()["post_id"]).content, "<h1>초안</h1>")
+        self.assertTrue(KeywordDraft.objects.filter(keyword=self.hot).exists())
+
+
+class GenerationContextCommitAPITest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.client.credentials(HTTP_X_INTERNAL_SECRET=INTERNAL_SECRET)
+        self.user = User.objects.create(email="u@example.com", social_id="1", nickname="u", provider="kakao")
+        self.keyword = Keyword.objects.create(title="키워드", category="연예", source_category="종합")
+        Article.objects.create(keyword=self.keyword, title="기사", content="본문", origin_link="https://example.com")
+        Image.objects.create(keyword=self.keyword, image_url="https://example.com/1.jpg", order=1)
+
+    def test_context_then_commit_creates_post_and_log(self):
+        payload = {"keyword_id": self.keyword.id, "user_id": self.user.id}
+        context = self.client.post("/api/internal/generation/context/", payload, format="json").json()
+        self.assertIsNone(context["post"])
+        self.assertEqual(context["article"]["image_urls"], ["https://example.com/1.jpg"])
+
+        commit = {**payload, "status": "success", "title": "제목", "content": "<p>본문</p>", "response_time_ms": 900}
+        response = self.client.post("/api/internal/generation/commit/", commit, format="json")
+        self.assertEqual(response.status_code, 201, msg=f"응답 본문: {response.content}")
+        post_id = response.json()["post_id"]
+        self.assertTrue(ClovaStudioLog.objects.filter(keyword=self.keyword, status="success").exists())
+
+        # 같은 커밋을 다시 보내도 글은 하나 (재시도 안전)
+        self.assertEqual(
+            self.client.post("/api/internal/generation/commit/", commit, format="json").json()["post_id"], post_id
+        )
+        context = self.client.post("/api/internal/generation/context/", payload, format="json").json()
+        self.assertEqual(context["post"]["post_id"], post_id)
+        self.assertIsNone(context["article"])
+
+        # 재생성: post_id 로 글 + 기사 조회 후 덮어쓰기
+        context = self.client.post("/api/internal/generation/context/", {"post_id": post_id}, format="json").json()
+        self.assertEqual(context["post"]["keyword_id"], self.keyword.id)
+        self.assertEqual(context["article"]["content"], "본문")
+        self.client.post(
+            "/api/internal/generation/commit/", {**commit, "post_id": post_id, "title": "새 제목"}, format="json"
+        )
+        post = GeneratedPost.objects.get(id=post_id)
+        self.assertEqual((post.title, post.is_generated), ("새 제목", True))
+
+    def test_failed_commit_logs_and_deactivates_atomically(self):
+        commit = {
+            "keyword_id": self.keyword.id,
+            "user_id": self.user.id,
+            "status": "fail",
+            "error_message": "Clova 오류",
+            "deactivate_keyword": True,
+        }
+        response = self.client.post("/api/internal/generation/commit/", commit, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertIsNone(response.json()["post_id"])
+        self.keyword.refresh_from_db()
+        self.assertFalse(self.keyword.is_active)
+        self.assertEqual(ClovaStudioLog.objects.get(keyword=self.keyword).error_message, "Clova 오류")
+
+    def test_bulk_logs_keep_requested_at_and_tokens(self):
+        logs = [
+            {
+                "keyword_id": self.keyword.id,
+                "status": "success",
+                "response_time_ms": 1200,
+                "prompt_tokens": 900,
+                "completion_tokens": 400,
+                "queue_wait_ms": 35,
+                "requested_at": "2025-08-05T12:30:00+09:00",
+            },
+            {"keyword_id": self.keyword.id, "status": "fail", "error_message": "timeout"},
+            {"keyword_id": 999999, "status": "success"},
+        ]
+        response = self.client.post("/api/internal/clova-log/bulk/", logs, format="json")
+        self.assertEqual(response.json(), {"created": 2, "skipped": 1})
+
+        log = ClovaStudioLog.objects.get(keyword=self.keyword, status="success")
+        self.assertEqual((log.prompt_tokens, log.completion_tokens, log.queue_wait_ms), (900, 400, 35))
+        self.assertEqual(log.requested_at.isoformat(), "2025-08-05T03:30:00+00:00")
@@ -5,6 +5,7 @@
 - FastAPI와 Django 간 콘텐츠 동기화용 엔드포인트 모음
 - 외부 공개용이 아닌 내부 시스템 간 호출 전용
 """
+
 from django.urls import path
 
 from apps.internal.views.fetch_aritcle_views import (
@@ -13,16 +14,31 @@ from apps.internal.views.fetch_aritcle_views import (
 )
 from apps.internal.views.generate_post_views import (
     ClovaFailLogCreateAPIView,
+    ClovaLogBulkCreateAPIView,
     ClovaSuccessLogCreateAPIView,
     GeneratedPostPreviewAPIView,
     InternalArticleDetailAPIView,
     InternalGeneratedPostCreateAPIView,
     InternalRegeneratedPostAPIView,
 )
-from apps.internal.views.keyword import KeywordDeactivateAPIView
+from apps.internal.views.generation_job_views import GenerationJobCompleteAPIView
+from apps.internal.views.generation_views import (
+    GenerationCommitAPIView,
+    GenerationContextAPIView,
+)
+from apps.internal.views.keyword import (
+    KeywordDeactivateAPIView,
+    KeywordPopularitySnapshotAPIView,
+)
+from apps.internal.views.pregeneration_views import (
+    KeywordDraftSaveAPIView,
+    KeywordPregenerationCandidateAPIView,
+)
 from apps.internal.views.scrap_titles_views import KeywordCreateAPIView
 from apps.internal.views.scrape_images_views import (
+    ImageBulkSaveAPIView,
     ImageSaveAPIView,
+    KeywordImageTargetLeaseAPIView,
     KeywordMarkCollectedAPIView,
     KeywordNextImageTargetAPIView,
 )
@@ -35,7 +51,13 @@ urlpatterns = [
         KeywordNextImageTargetAPIView.as_view(),
         name="internal-keywords-next-image-target",
     ),
+    path(
+        "keywords/image-targets/lease/",
+        KeywordImageTargetLeaseAPIView.as_view(),
+        name="internal-keywords-image-targets-lease",
+    ),
     path("images/", ImageSaveAPIView.as_view(), name="internal-images-save"),
+    path("images/bulk/", ImageBulkSaveAPIView.as_view(), name="internal-images-bulk-save"),
     path(
         "keywords/<int:id>/collected/",
         KeywordMarkCollectedAPIView.as_view(),
@@ -46,6 +68,12 @@ urlpatterns = [
         KeywordDeactivateAPIView.as_view(),
         name="keyword-deactivate",
     ),
+    # 키워드 인기도: Redis 카운터 → KeywordPopularity 스냅샷 (FastAPI 주기 호출)
+    path(
+        "keywords/popularity/snapshot/",
+        KeywordPopularitySnapshotAPIView.as_view(),
+        name="internal-keywords-popularity-snapshot",
+    ),
     # 키워드 생성: FastAPI가 네이버 등에서 수집한 키워드를 Django에 저장할 때 사용 (POST)
     path("posts/", KeywordCreateAPIView.as_view(), name="keyword-create"),
     # 키워드 목록 조회: FastAPI가 본문 수집 대상 키워드를 조회할 때 사용 (GET)
@@ -81,6 +109,36 @@ urlpatterns = [
         ClovaFailLogCreateAPIView.as_view(),
         name="internal-clova-log-fail",
     ),
+    # Clova 로그 일괄 저장 (FastAPI 버퍼 → 주기적 flush)
+    path(
+        "clova-log/bulk/",
+        ClovaLogBulkCreateAPIView.as_view(),
+        name="internal-clova-log-bulk",
+    ),
+    # Clova 생성 컨텍스트 조회 / 결과 커밋 (생성 1건당 Django 왕복 2회)
+    path(
+        "generation/context/",
+        GenerationContextAPIView.as_view(),
+        name="internal-generation-context",
+    ),
+    path(
+        "generation/commit/",
+        GenerationCommitAPIView.as_view(),
+        name="internal-generation-commit",
+    ),
+    # Clova 생성 잡 완료 알림 (FastAPI 워커 → 캐시 저장 + WebSocket push)
+    path(
+        "generation-jobs/complete/",
+        GenerationJobCompleteAPIView.as_view(),
+        name="internal-generation-job-complete",
+    ),
+    # 사전 생성: 후보 키워드 조회 (GET) / 초안 저장 (POST)
+    path(
+        "keywords/pregeneration-candidates/",
+        KeywordPregenerationCandidateAPIView.as_view(),
+        name="internal-keywords-pregeneration-candidates",
+    ),
+    path("keyword-drafts/", KeywordDraftSaveAPIView.as_view(), name="internal-keyword-drafts"),
     # Clova 생성 중복 프리뷰 반환
     path(
         "generated-posts/preview/",
@@ -12,17 +12,72 @@ from rest_framework.views import APIView
 from apps.internal.serializers.generate_post_serializers import (
     ArticleWithImagesSerializer,
     ClovaFailLogSerializer,
+    ClovaLogBulkItemSerializer,
     ClovaSuccessLogSerializer,
     InternalGeneratedPostCreateSerializer,
     InternalGeneratedPostDetailSerializer,
     InternalGeneratedPostUpdateSerializer,
 )
-from apps.models import Article, ClovaStudioLog, GeneratedPost, Image, Keyword, User
+from apps.models import (
+    Article,
+    ClovaStudioLog,
+    GeneratedPost,
+    Image,
+    Keyword,
+    KeywordDraft,
+    User,
+)
 from config.settings import INTERNAL_SECRET
 
 logger = logging.getLogger(__name__)
 
 
+def article_with_images(keyword: Keyword) -> dict | None:
+    """Clova 프롬프트용 기사 본문 + 이미지(최대 3장), 기사 본문이 없으면 None"""
+    article = getattr(keyword, "article", None)
+    if not article:
+        return None
+
+    images = Image.objects.filter(keyword_id=keyword.id).order_by("order")[:3]
+    image_urls = [img.image_url for img in images]
+    stored_paths = [img.stored_path for img in images]
+    variant_widths = [img.variant_widths for img in images]
+
+    if not image_urls:
+        logger.warning(f"Keyword id={keyword.id}에 이미지가 없습니다.")
+
+    return {
+        "title": keyword.title,
+        "content": article.content,
+        "condensed_content": article.condensed_content,
+        "image_urls": image_urls,
+        "stored_paths": stored_paths,
+        "variant_widths": variant_widths,
+    }
+
+
+def post_from_draft(user_id: int, keyword_id: int) -> GeneratedPost | None:
+    """사전 생성 초안이 있으면 Clova 호출 없이 사용자 글로 복사 (없으면 None)"""
+    draft = KeywordDraft.objects.filter(keyword_id=keyword_id).first()
+    if draft is None:
+        return None
+
+    post, _ = GeneratedPost.objects.get_or_create(
+        user_id=user_id,
+        keyword_id=keyword_id,
+        defaults={
+            "title": draft.title,
+            "content": draft.content,
+            "image_1_url": draft.image_1_url,
+            "image_2_url": draft.image_2_url,
+            "image_3_url": draft.image_3_url,
+            "is_generated": False,
+        },
+    )
+    logger.info(f"[Draft] keyword_id={keyword_id} 초안으로 글 생성 - user_id={user_id}, post_id={post.id}")
+    return post
+
+
 @extend_schema(
     tags=["[Internal] FastAPI ↔ Django - 콘텐츠 동기화"],
     summary="기사 + 이미지 통합 조회",
@@ -34,11 +89,18 @@ logger = logging.getLogger(__name__)
             value={
                 "title": "2025 여름을 강타할 패션 키워드",
                 "content": "2025년 여름, 가장 주목받는 패션 스타일은...",
+                "condensed_content": "2025년 여름, 가장 주목받는 패션 스타일은...",
                 "image_urls": [
                     "https://cdn.blogi.com/1.jpg",
                     "https://cdn.blogi.com/2.jpg",
                     "https://cdn.blogi.com/3.jpg",
                 ],
+                "stored_paths": [
+                    "images/3f/a2/3fa2….jpg",
+                    None,
+                    "images/9c/01/9c01….png",
+                ],
+                "variant_widths": [[360, 720, 1080], [], [360, 720]],
             },
             response_only=True,
         )
@@ -57,22 +119,10 @@ class InternalArticleDetailAPIView(APIView):
         if not keyword:
             return JsonResponse({"detail": "해당 키워드는 존재하지 않습니다."}, status=404)
 
-        article = getattr(keyword, "article", None)
-        if not article:
+        data = article_with_images(keyword)
+        if data is None:
             return JsonResponse({"detail": "해당 키워드의 기사 본문이 없습니다."}, status=404)
 
-        images = Image.objects.filter(keyword_id=keyword_id).order_by("order")[:3]
-        image_urls = [img.image_url for img in images]
-
-        if not image_urls:
-            logger.warning(f"Keyword id={keyword.id}에 이미지가 없습니다.")
-
-        data = {
-            "title": keyword.title,
-            "content": article.content,
-            "image_urls": image_urls,
-        }
-
         return Response(data, status=200)
 
 
@@ -207,6 +257,48 @@ class ClovaFailLogCreateAPIView(APIView):
         return Response({"log_id": log.id, "status": log.status}, status=status.HTTP_201_CREATED)
 
 
+@extend_schema(
+    tags=["[Internal] FastAPI ↔ Django - 콘텐츠 동기화"],
+    summary="Clova 로그 일괄 저장",
+    description=(
+        "FastAPI가 메모리에 모아 둔 Clova 생성 로그(성공/실패, 토큰 수, 대기 시간)를 주기적으로 한 번에 저장합니다.\n\n"
+        "- `requested_at` 은 FastAPI 에서 호출한 시각 (없으면 저장 시각)\n"
+        "- 존재하지 않는 keyword_id 항목은 건너뜀"
+    ),
+    request=ClovaLogBulkItemSerializer(many=True),
+    responses={
+        201: OpenApiExample(
+            "일괄 저장 예시",
+            value={"created": 120, "skipped": 1},
+            response_only=True,
+        )
+    },
+)
+class ClovaLogBulkCreateAPIView(APIView):
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        secret = request.headers.get("X-Internal-Secret")
+        if secret != INTERNAL_SECRET:
+            return Response({"detail": "내부 인증 실패"}, status=status.HTTP_401_UNAUTHORIZED)
+
+        serializer = ClovaLogBulkItemSerializer(data=request.data, many=True)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        items = serializer.validated_data
+        keyword_ids = set(
+            Keyword.objects.filter(id__in={item["keyword_id"] for item in items}).values_list("id", flat=True)
+        )
+        logs = [ClovaStudioLog(**item) for item in items if item["keyword_id"] in keyword_ids]
+        ClovaStudioLog.objects.bulk_create(logs, batch_size=500)
+
+        skipped = len(items) - len(logs)
+        if skipped:
+            logger.warning(f"[ClovaLogBulk] 존재하지 않는 키워드 로그 {skipped}건 건너뜀")
+        return Response({"created": len(logs), "skipped": skipped}, status=status.HTTP_201_CREATED)
+
+
 # 기존 유저가 글생성 요청했을때 프리뷰 반환
 @extend_schema(
     tags=["[Internal] FastAPI ↔ Django - 콘텐츠 동기화"],
@@ -215,6 +307,7 @@ class ClovaFailLogCreateAPIView(APIView):
         "FastAPI가 Clova Studio 콘텐츠 생성을 시도하기 전에, "
         "해당 유저가 이미 같은 키워드로 글을 생성했는지 확인합니다.\n\n"
         "- 중복된 글이 있을 경우: `200 OK` + `post_id`, `created_at` 반환\n"
+        "- `use_draft=true` 이고 사전 생성 초안(KeywordDraft)이 있으면 초안으로 글을 만들어 `200 OK` (`from_draft: true`)\n"
         "- 중복 글이 없을 경우: `204 No Content`\n"
         "- 인증 실패 시: `401`"
     ),
@@ -268,8 +361,17 @@ class GeneratedPostPreviewAPIView(APIView):
                 status=status.HTTP_200_OK,
             )
         except GeneratedPost.DoesNotExist:
+            pass
+
+        post = post_from_draft(user_id, keyword_id) if request.data.get("use_draft") else None
+        if post is None:
             return Response(status=status.HTTP_204_NO_CONTENT)
 
+        return Response(
+            {"post_id": post.id, "created_at": post.created_at.isoformat(), "from_draft": True},
+            status=status.HTTP_200_OK,
+        )
+
 
 @extend_schema(
     tags=["[Internal] FastAPI ↔ Django - 콘텐츠 동기화"],
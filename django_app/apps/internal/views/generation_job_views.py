@@ -0,0 +1,64 @@
+import logging
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.core.cache import cache
+from drf_spectacular.utils import OpenApiExample, extend_schema
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.utils.generation_jobs import JOB_CACHE_TTL, job_cache_key, user_group
+from config.settings import INTERNAL_SECRET
+
+logger = logging.getLogger(__name__)
+
+
+@extend_schema(
+    tags=["[Internal] FastAPI ↔ Django - 콘텐츠 동기화"],
+    summary="Clova 생성 잡 완료 알림",
+    description=(
+        "FastAPI 생성 워커가 잡을 마치면 호출합니다.\n\n"
+        "- 잡 상태를 캐시에 저장 (폴링 응답용)\n"
+        "- 요청한 사용자의 WebSocket 그룹(ws/generation/)으로 결과 push"
+    ),
+    examples=[
+        OpenApiExample(
+            name="완료 알림 예시",
+            value={
+                "job_id": "3f2a9c0e6b1d4e7fa1c2d3e4f5a6b7c8",
+                "kind": "generate",
+                "user_id": 7,
+                "keyword_id": 123,
+                "post_id": None,
+                "status": "done",
+                "result": {"status": "success", "post_id": 101, "created_at": "2025-08-05T12:30:00"},
+                "error": None,
+            },
+            request_only=True,
+        )
+    ],
+)
+class GenerationJobCompleteAPIView(APIView):
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        secret = request.headers.get("X-Internal-Secret")
+        if secret != INTERNAL_SECRET:
+            return Response({"detail": "내부 인증 실패"}, status=status.HTTP_401_UNAUTHORIZED)
+
+        job = request.data
+        job_id, user_id = job.get("job_id"), job.get("user_id")
+        if not job_id or not isinstance(user_id, int):
+            return Response({"detail": "job_id, user_id 는 필수입니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        cache.set(job_cache_key(job_id), job, JOB_CACHE_TTL)
+
+        try:
+            async_to_sync(get_channel_layer().group_send)(user_group(user_id), {"type": "generation.job", "job": job})
+        except Exception as e:
+            # push 실패해도 캐시에 남았으므로 폴링으로 확인 가능
+            logger.warning(f"[GenerationJob] push 실패 job_id={job_id}: {e}")
+
+        return Response({"ok": True}, status=status.HTTP_200_OK)
@@ -0,0 +1,180 @@
+import logging
+
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from django.utils.timezone import now
+from drf_spectacular.utils import OpenApiExample, extend_schema
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.internal.serializers.generation_serializers import (
+    GenerationCommitSerializer,
+    GenerationContextRequestSerializer,
+)
+from apps.internal.views.generate_post_views import (
+    article_with_images,
+    post_from_draft,
+)
+from apps.models import ClovaStudioLog, GeneratedPost, Keyword, User
+from apps.utils.feed_cache import bump_feed_version
+from config.settings import INTERNAL_SECRET
+
+logger = logging.getLogger(__name__)
+
+
+def _post_summary(post: GeneratedPost, from_draft: bool = False) -> dict:
+    return {
+        "post_id": post.id,
+        "keyword_id": post.keyword_id,
+        "user_id": post.user_id,
+        "created_at": post.created_at.isoformat(),
+        "from_draft": from_draft,
+    }
+
+
+@extend_schema(
+    tags=["[Internal] FastAPI ↔ Django - 콘텐츠 동기화"],
+    summary="Clova 생성 컨텍스트 조회 (기존 글 + 기사 + 이미지)",
+    description=(
+        "생성 전 필요한 조회(중복 글 확인 / 초안 사용 / 기사 + 이미지)를 한 번에 처리합니다.\n\n"
+        "- `keyword_id` + `user_id`: 기존 글(또는 `use_draft=true` 일 때 초안으로 만든 글)이 있으면 `post` 만, "
+        "없으면 `article` 을 반환\n"
+        "- `post_id` (재생성): 대상 글과 그 키워드의 `article` 을 함께 반환\n"
+        "- `article` 은 기사 본문이 없으면 `null`"
+    ),
+    request=GenerationContextRequestSerializer,
+    responses={
+        200: OpenApiExample(
+            "생성 컨텍스트 응답 예시",
+            value={
+                "post": None,
+                "article": {
+                    "title": "2025 여름을 강타할 패션 키워드",
+                    "content": "2025년 여름, 가장 주목받는 패션 스타일은...",
+                    "condensed_content": "2025년 여름, 가장 주목받는 패션 스타일은...",
+                    "image_urls": ["https://cdn.blogi.com/1.jpg"],
+                    "stored_paths": ["images/3f/a2/3fa2….jpg"],
+                    "variant_widths": [[360, 720, 1080]],
+                },
+            },
+            response_only=True,
+        )
+    },
+)
+class GenerationContextAPIView(APIView):
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        secret = request.headers.get("X-Internal-Secret")
+        if secret != INTERNAL_SECRET:
+            return Response({"detail": "내부 인증 실패"}, status=status.HTTP_401_UNAUTHORIZED)
+
+        serializer = GenerationContextRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        # 재생성: 대상 글 + 기사
+        if data.get("post_id"):
+            post = get_object_or_404(GeneratedPost.objects.select_related("keyword__article"), id=data["post_id"])
+            return Response(
+                {"post": _post_summary(post), "article": article_with_images(post.keyword)},
+                status=status.HTTP_200_OK,
+            )
+
+        # 생성: 기존 글 / 초안이 있으면 기사 조회 생략
+        post = GeneratedPost.objects.filter(user_id=data["user_id"], keyword_id=data["keyword_id"]).first()
+        if post is not None:
+            return Response({"post": _post_summary(post), "article": None}, status=status.HTTP_200_OK)
+        if data["use_draft"]:
+            post = post_from_draft(data["user_id"], data["keyword_id"])
+            if post is not None:
+                return Response(
+                    {"post": _post_summary(post, from_draft=True), "article": None}, status=status.HTTP_200_OK
+                )
+
+        keyword = get_object_or_404(Keyword.objects.select_related("article"), id=data["keyword_id"])
+        return Response({"post": None, "article": article_with_images(keyword)}, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["[Internal] FastAPI ↔ Django - 콘텐츠 동기화"],
+    summary="Clova 생성 결과 커밋 (글 저장 + 로그)",
+    description=(
+        "Clova 호출 결과를 한 트랜잭션으로 반영합니다.\n\n"
+        "- `status=success`: 글 생성 (`post_id` 가 있으면 해당 글 덮어쓰기) + 성공 로그\n"
+        "- `status=fail`: 실패 로그 (+ `deactivate_keyword=true` 면 키워드 비활성화)\n"
+        "- `write_log=false` 면 로그는 저장하지 않음 (FastAPI 가 `clova-log/bulk/` 로 따로 전송)\n"
+        "- 같은 유저/키워드 글이 이미 있으면 새로 만들지 않고 기존 글을 반환"
+    ),
+    request=GenerationCommitSerializer,
+    responses={
+        201: OpenApiExample(
+            "커밋 성공 예시",
+            value={"post_id": 101, "created_at": "2025-08-05T12:30:00", "log_id": 555, "status": "success"},
+            response_only=True,
+        )
+    },
+)
+class GenerationCommitAPIView(APIView):
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        secret = request.headers.get("X-Internal-Secret")
+        if secret != INTERNAL_SECRET:
+            return Response({"detail": "내부 인증 실패"}, status=status.HTTP_401_UNAUTHORIZED)
+
+        serializer = GenerationCommitSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        data = serializer.validated_data
+
+        with transaction.atomic():
+            keyword = get_object_or_404(Keyword, id=data["keyword_id"])
+            post = None
+
+            if data["status"] == ClovaStudioLog.ClovaStatus.SUCCESS:
+                fields = {
+                    "title": data["title"],
+                    "content": data["content"],
+                    "image_1_url": data.get("image_1_url"),
+                    "image_2_url": data.get("image_2_url"),
+                    "image_3_url": data.get("image_3_url"),
+                }
+                if data.get("post_id"):
+                    # 재생성 덮어쓰기 (InternalGeneratedPostUpdateSerializer 와 동일하게 처리)
+                    post = get_object_or_404(GeneratedPost.objects.select_for_update(), id=data["post_id"])
+                    for attr, value in fields.items():
+                        setattr(post, attr, value)
+                    post.is_generated = True
+                    post.created_at = now()
+                    post.save()
+                else:
+                    user = get_object_or_404(User, id=data["user_id"])
+                    post, _ = GeneratedPost.objects.get_or_create(
+                        user=user, keyword=keyword, defaults={**fields, "is_generated": False}
+                    )
+            elif data["deactivate_keyword"]:
+                Keyword.objects.filter(id=keyword.id).update(is_active=False)
+                bump_feed_version()
+                logger.info(f"[Commit] keyword_id={keyword.id} 생성 실패 → 비활성화")
+
+            log = None
+            if data["write_log"]:
+                log = ClovaStudioLog.objects.create(
+                    keyword=keyword,
+                    status=data["status"],
+                    error_message=data.get("error_message") or None,
+                    response_time_ms=data.get("response_time_ms"),
+                )
+
+        return Response(
+            {
+                "post_id": post.id if post else None,
+                "created_at": post.created_at.isoformat() if post else None,
+                "log_id": log.id if log else None,
+                "status": data["status"],
+            },
+            status=status.HTTP_201_CREATED,
+        )
@@ -6,6 +6,8 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.models import Keyword
+from apps.utils import keyword_popularity
+from config.settings import INTERNAL_SECRET
 
 
 @extend_schema(
@@ -24,3 +26,23 @@ class KeywordDeactivateAPIView(APIView):
             {"message": "키워드가 비활성화 처리되었습니다."},
             status=status.HTTP_200_OK,
         )
+
+
+@extend_schema(
+    tags=["[Internal] FastAPI ↔ Django - 키워드 관리"],
+    summary="키워드 인기도 스냅샷",
+    description=(
+        "Redis 의 키워드 클릭 수 / 시간 감쇠 점수를 KeywordPopularity 테이블에 기록합니다.\n\n"
+        "FastAPI 가 주기적으로 호출하며, 인기순 정렬은 이 테이블의 score 를 읽습니다."
+    ),
+    responses={200: {"type": "object", "example": {"saved": 120}}},
+)
+class KeywordPopularitySnapshotAPIView(APIView):
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        secret = request.headers.get("X-Internal-Secret")
+        if secret != INTERNAL_SECRET:
+            return Response({"detail": "내부 인증 실패"}, status=status.HTTP_401_UNAUTHORIZED)
+
+        return Response({"saved": keyword_popularity.snapshot()}, status=status.HTTP_200_OK)
@@ -0,0 +1,122 @@
+import math
+from datetime import timedelta
+
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils.timezone import now
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.internal.serializers.pregeneration_serializers import (
+    KeywordDraftSaveSerializer,
+    PregenerationCandidateSerializer,
+)
+from apps.models import Keyword, KeywordDraft, UserInterest
+from config.settings import INTERNAL_SECRET
+
+PREGENERATION_MAX_LIMIT = 50
+PREGENERATION_WINDOW_HOURS = 24  # 이 시간 안에 수집된 키워드만 후보
+CLICK_VELOCITY_WEIGHT = 1.0  # 시간당 클릭 수 가중치
+INTEREST_WEIGHT = 0.5  # 카테고리 관심 사용자 수(log) 가중치
+
+
+def pregeneration_candidates(limit: int, window_hours: int) -> list[Keyword]:
+    """
+    사전 생성 후보 키워드 (점수 내림차순)
+    - 대상: 최근 window_hours 안에 수집, 활성, 기사/이미지 수집 완료, 초안 없음
+    - 점수: 수집 이후 시간당 클릭 수 × CLICK_VELOCITY_WEIGHT + log(1 + 카테고리 관심 사용자 수) × INTEREST_WEIGHT
+    """
+    current = now()
+    since = current - timedelta(hours=window_hours)
+    interest = (
+        UserInterest.objects.filter(category=OuterRef("category"))
+        .values("category")
+        .annotate(c=Count("id"))
+        .values("c")
+    )
+    keywords = (
+        Keyword.objects.filter(
+            is_active=True,
+            is_collected=True,
+            created_at__gte=since,
+            article__isnull=False,
+            draft__isnull=True,
+        )
+        .annotate(
+            clicks=Count("keywordclicklog", filter=Q(keywordclicklog__clicked_at__gte=since)),
+            interest=Coalesce(Subquery(interest, output_field=IntegerField()), Value(0)),
+        )
+        .filter(Q(clicks__gt=0) | Q(interest__gt=0))
+    )
+
+    scored = []
+    for keyword in keywords:
+        age_hours = max(1.0, (current - keyword.created_at).total_seconds() / 3600)
+        keyword.score = round(
+            keyword.clicks / age_hours * CLICK_VELOCITY_WEIGHT + math.log1p(keyword.interest) * INTEREST_WEIGHT, 4
+        )
+        scored.append(keyword)
+    scored.sort(key=lambda k: (-k.score, k.id))
+    return scored[:limit]
+
+
+@extend_schema(
+    tags=["[Internal] FastAPI ↔ Django - 콘텐츠 동기화"],
+    summary="사전 생성 후보 키워드 조회",
+    description=(
+        "최근 수집된 키워드를 초기 클릭 속도(시간당 클릭 수)와 카테고리 관심 사용자 수로 점수화해 상위 limit 개를 반환합니다.\n\n"
+        "이미 초안이 있는 키워드와 클릭/관심이 모두 0인 키워드는 제외합니다."
+    ),
+    parameters=[
+        OpenApiParameter(name="limit", type=int, required=False, description=f"최대 {PREGENERATION_MAX_LIMIT}"),
+        OpenApiParameter(
+            name="window_hours", type=int, required=False, description=f"기본 {PREGENERATION_WINDOW_HOURS}"
+        ),
+    ],
+    responses=PregenerationCandidateSerializer(many=True),
+)
+class KeywordPregenerationCandidateAPIView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        secret = request.headers.get("X-Internal-Secret")
+        if secret != INTERNAL_SECRET:
+            return Response({"detail": "내부 인증 실패"}, status=status.HTTP_401_UNAUTHORIZED)
+
+        try:
+            limit = min(int(request.query_params.get("limit", 10)), PREGENERATION_MAX_LIMIT)
+            window_hours = int(request.query_params.get("window_hours", PREGENERATION_WINDOW_HOURS))
+        except ValueError:
+            return Response({"detail": "limit, window_hours 는 정수여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        keywords = pregeneration_candidates(max(limit, 1), max(window_hours, 1))
+        return Response(PregenerationCandidateSerializer(keywords, many=True).data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["[Internal] FastAPI ↔ Django - 콘텐츠 동기화"],
+    summary="사전 생성 초안 저장",
+    description="FastAPI 가 미리 생성한 키워드 초안을 저장합니다. (키워드당 1개, 다시 보내면 덮어씀)",
+    request=KeywordDraftSaveSerializer,
+)
+class KeywordDraftSaveAPIView(APIView):
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        secret = request.headers.get("X-Internal-Secret")
+        if secret != INTERNAL_SECRET:
+            return Response({"detail": "내부 인증 실패"}, status=status.HTTP_401_UNAUTHORIZED)
+
+        serializer = KeywordDraftSaveSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = dict(serializer.validated_data)
+        keyword = data.pop("keyword")
+        draft, created = KeywordDraft.objects.update_or_create(keyword=keyword, defaults=data)
+
+        return Response(
+            {"draft_id": draft.id, "created": created},
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
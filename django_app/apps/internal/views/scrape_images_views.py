@@ -1,4 +1,7 @@
-from django.db.models import Exists, OuterRef  # 추가
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q  # 추가
 from django.utils.timezone import now
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
@@ -7,10 +10,55 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.internal.serializers.scrape_images_serializers import (
+    ImageBulkSaveRequestSerializer,
     ImageSaveRequestSerializer,
     KeywordImageTargetSerializer,
 )
 from apps.models import Article, Image, Keyword
+from apps.utils.feed_cache import bump_feed_version
+
+IMAGE_TARGET_MAX_LIMIT = 100
+IMAGE_TARGET_LEASE_SECONDS = 600  # 선점 후 저장 없이 만료되면 다른 작업자가 다시 가져감
+
+
+def image_target_queryset():
+    # article이 연결된 keyword_id만 필터링해서 쿼리
+    article_keyword_ids = Article.objects.values_list("keyword_id", flat=True)
+
+    # 이미지가 이미 있는 키워드는 제외 (has_images=False만 대상)
+    has_images = Exists(Image.objects.filter(keyword_id=OuterRef("id")))
+
+    return (
+        Keyword.objects.filter(is_collected=False, id__in=article_keyword_ids)
+        .annotate(has_images=has_images)
+        .filter(has_images=False)  # ← 핵심 필터
+        .order_by("created_at", "id")  # 안정적 정렬
+    )
+
+
+def lease_image_targets(limit: int, lease_seconds: int = IMAGE_TARGET_LEASE_SECONDS) -> list[Keyword]:
+    """
+    이미지 수집 대상 키워드를 limit개 선점
+    - 미수집 부분 인덱스(keyword_image_target_idx) 순서대로 조회
+    - SKIP LOCKED 로 다른 작업자가 잡고 있는 행은 건너뜀 (동시 실행 시 중복 배정 없음)
+    - 이미지가 이미 있는 키워드는 제외 (예전 경로로 이미지만 저장된 키워드를 Kakao 로 다시 조회하지 않음,
+      해당 키워드는 0018 마이그레이션에서 수집 완료 처리)
+    """
+    current = now()
+    with transaction.atomic():
+        keywords = list(
+            Keyword.objects.select_for_update(skip_locked=True)
+            .filter(is_collected=False)
+            .filter(Q(image_leased_until__isnull=True) | Q(image_leased_until__lt=current))
+            .filter(Exists(Article.objects.filter(keyword_id=OuterRef("id"))))
+            .filter(~Exists(Image.objects.filter(keyword_id=OuterRef("id"))))
+            .order_by("created_at", "id")[:limit]
+        )
+        if keywords:
+            Keyword.objects.filter(id__in=[k.id for k in keywords]).update(
+                image_leased_until=current + timedelta(seconds=lease_seconds)
+            )
+    return keywords
 
 
 @extend_schema(
@@ -31,19 +79,7 @@ class KeywordNextImageTargetAPIView(APIView):
     serializer_class = KeywordImageTargetSerializer
 
     def get(self, request):
-        # article이 연결된 keyword_id만 필터링해서 쿼리
-        article_keyword_ids = Article.objects.values_list("keyword_id", flat=True)
-
-        # 이미지가 이미 있는 키워드는 제외 (has_images=False만 대상)
-        has_images = Exists(Image.objects.filter(keyword_id=OuterRef("id")))
-
-        keyword = (
-            Keyword.objects.filter(is_collected=False, id__in=article_keyword_ids)
-            .annotate(has_images=has_images)
-            .filter(has_images=False)  # ← 핵심 필터
-            .order_by("created_at", "id")  # 안정적 정렬
-            .first()
-        )
+        keyword = image_target_queryset().first()
 
         if not keyword:
             return Response(
@@ -81,17 +117,118 @@ class ImageSaveAPIView(APIView):
         except Keyword.DoesNotExist:
             return Response({"detail": "해당 키워드가 존재하지 않습니다."}, status=404)
 
-        for idx, url in enumerate(images[:3]):
-            Image.objects.create(
-                keyword=keyword,  # ForeignKey 추가
-                post=None,  # 아직 생성 글 없음
+        # (keyword, order) 유니크 제약 → 재시도해도 중복 저장되지 않음
+        Image.objects.bulk_create(
+            [
+                Image(
+                    keyword=keyword,  # ForeignKey 추가
+                    post=None,  # 아직 생성 글 없음
+                    image_url=url,
+                    order=idx + 1,
+                    description=None,
+                    collected_at=now(),
+                )
+                for idx, url in enumerate(images[:3])
+            ],
+            ignore_conflicts=True,
+        )
+
+        return Response({"detail": "이미지가 저장되었습니다."}, status=201)
+
+
+@extend_schema(
+    tags=["[Internal] Keyword - 내부 연동"],
+    summary="이미지 수집 대상 키워드 선점",
+    description=(
+        "이미지 수집 대상 키워드를 `limit`개(기본 20, 최대 100)까지 선점해 반환합니다.\n\n"
+        "- `is_collected=False` + `article` 보유 + 선점 만료된 키워드만 대상\n"
+        f"- 반환된 키워드는 {IMAGE_TARGET_LEASE_SECONDS}초 동안 다른 요청에 다시 배정되지 않음\n"
+        "- 동시 요청은 잠긴 행을 건너뛰므로(SKIP LOCKED) 서로 다른 키워드를 받음\n"
+        "- 대상이 없으면 빈 목록 반환"
+    ),
+    responses={200: KeywordImageTargetSerializer(many=True)},
+)
+class KeywordImageTargetLeaseAPIView(APIView):
+    permission_classes = [AllowAny]
+    serializer_class = KeywordImageTargetSerializer
+
+    def post(self, request):
+        try:
+            limit = int(request.query_params.get("limit", 20))
+        except ValueError:
+            return Response({"detail": "limit은 정수여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
+        limit = max(1, min(limit, IMAGE_TARGET_MAX_LIMIT))
+
+        serializer = self.serializer_class(lease_image_targets(limit), many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["[Internal] Keyword - 내부 연동"],
+    summary="대표 이미지 일괄 저장 + 수집 완료 처리",
+    description=(
+        "여러 키워드의 이미지 URL을 한 번에 저장하고, 요청에 포함된 키워드를 모두 `is_collected=True`로 처리합니다.\n\n"
+        "- `images`가 빈 키워드는 이미지 없이 수집 완료만 처리\n"
+        "- 이미 저장된 (keyword, order) 이미지는 건너뜀 (재시도 안전)\n"
+        "- 존재하지 않는 keyword_id는 무시하고 `missing_ids`로 반환"
+    ),
+    request=ImageBulkSaveRequestSerializer,
+    responses={201: {"description": "저장 성공"}, 400: {"description": "잘못된 요청"}},
+)
+class ImageBulkSaveAPIView(APIView):
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        serializer = ImageBulkSaveRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        items = {
+            item["keyword_id"]: list(
+                zip(
+                    item["images"][:3],
+                    item.get("stored_paths") or [None] * 3,
+                    item.get("variant_widths") or [[]] * 3,
+                )
+            )
+            for item in serializer.validated_data["items"]
+        }
+        existing_ids = set(Keyword.objects.filter(id__in=items.keys()).values_list("id", flat=True))
+        collected_at = now()
+
+        images = [
+            Image(
+                keyword_id=keyword_id,
+                post=None,
                 image_url=url,
+                stored_path=stored_path,
+                variant_widths=widths,
                 order=idx + 1,
                 description=None,
-                collected_at=now(),
+                collected_at=collected_at,
             )
-
-        return Response({"detail": "이미지가 저장되었습니다."}, status=201)
+            for keyword_id, pairs in items.items()
+            if keyword_id in existing_ids
+            for idx, (url, stored_path, widths) in enumerate(pairs)
+        ]
+
+        with transaction.atomic():
+            Image.objects.bulk_create(images, ignore_conflicts=True)
+            # update()는 Keyword.save()를 거치지 않지만 False→True 방향만 갱신하므로 롤백 가드와 무관
+            Keyword.objects.filter(id__in=existing_ids).update(
+                is_collected=True, collected_at=collected_at, image_leased_until=None
+            )
+            # 수집 완료된 키워드가 공개 피드에 새로 보이므로 페이지 캐시 무효화
+            bump_feed_version()
+
+        return Response(
+            {
+                "detail": "이미지가 저장되었습니다.",
+                "saved_images": len(images),
+                "collected_ids": sorted(existing_ids),
+                "missing_ids": sorted(set(items) - existing_ids),
+            },
+            status=201,
+        )
 
 
 @extend_schema(
@@ -0,0 +1,20 @@
+"""
+키워드 인기도 재계산 (클릭 로그 → Redis 카운터 + KeywordPopularity)
+
+    python manage.py backfill_keyword_popularity
+
+- 도입 직후 / Redis 데이터 유실 시 한 번 실행 (기존 카운터와 스냅샷은 덮어씀)
+- 실행 중 들어온 클릭은 Redis 에서 빠질 수 있으므로 트래픽이 적을 때 실행
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.utils import keyword_popularity
+
+
+class Command(BaseCommand):
+    help = "클릭 로그로 키워드 인기도(누적 클릭 수 / 시간 감쇠 점수) 재계산"
+
+    def handle(self, *args, **options):
+        saved = keyword_popularity.backfill()
+        self.stdout.write(self.style.SUCCESS(f"키워드 인기도 재계산 완료: {saved}개"))
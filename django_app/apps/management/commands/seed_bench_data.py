@@ -0,0 +1,102 @@
+"""
+생성 지연 벤치마크용 데이터 시드 (fastapi_app/scripts/bench_generation.py 와 함께 사용)
+
+    python manage.py seed_bench_data [--keywords 50] [--users 5] [--images 3] [--article-chars 3000] [--reset]
+
+- 벤치 키워드는 source_category="bench" 로, 벤치 유저는 bench-<n>@bench.local 로 만들어 운영 데이터와 구분
+- 키워드마다 기사(본문 + 추출 요약) 1건, 이미지 --images 장 (이미 있으면 재사용)
+- --reset: 기존 벤치 키워드/유저와 딸린 글/로그/이미지를 지우고 새로 생성
+- 마지막 줄에 bench_generation.py 에 그대로 넘길 --keyword-ids / --user-ids 를 출력
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.models import Article, Image, Keyword, User
+
+BENCH_SOURCE = "bench"
+BENCH_EMAIL_DOMAIN = "bench.local"
+
+_SENTENCE = (
+    "{title} 관련 소식이 이어지며 업계와 소비자 모두의 관심이 커지고 있다. "
+    "관계자는 앞으로의 일정과 세부 내용을 순차적으로 공개할 예정이라고 밝혔다. "
+)
+
+
+def _article_text(title: str, chars: int) -> str:
+    sentence = _SENTENCE.format(title=title)
+    return (sentence * (chars // len(sentence) + 1))[:chars]
+
+
+def _id_ranges(ids: list[int]) -> str:
+    """[1, 2, 3, 7] → "1-3,7" (bench_generation.py 의 id 목록 형식)"""
+    parts = []
+    for i in sorted(ids):
+        if parts and parts[-1][1] == i - 1:
+            parts[-1][1] = i
+        else:
+            parts.append([i, i])
+    return ",".join(f"{a}-{b}" if a != b else str(a) for a, b in parts)
+
+
+class Command(BaseCommand):
+    help = "생성 지연 벤치마크용 키워드/기사/이미지/유저 시드"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--keywords", type=int, default=50)
+        parser.add_argument("--users", type=int, default=5)
+        parser.add_argument("--images", type=int, default=3, help="키워드당 이미지 수")
+        parser.add_argument("--article-chars", type=int, default=3000, help="기사 본문 길이 (글자)")
+        parser.add_argument("--reset", action="store_true", help="기존 벤치 데이터 삭제 후 생성")
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        if options["reset"]:
+            deleted, _ = Keyword.objects.filter(source_category=BENCH_SOURCE).delete()
+            deleted_users, _ = User.objects.filter(email__endswith=f"@{BENCH_EMAIL_DOMAIN}").delete()
+            self.stdout.write(f"기존 벤치 데이터 삭제: keyword 관련 {deleted}건, user 관련 {deleted_users}건")
+
+        users = []
+        for n in range(1, options["users"] + 1):
+            user, _ = User.objects.get_or_create(
+                email=f"bench-{n}@{BENCH_EMAIL_DOMAIN}",
+                defaults={"social_id": f"bench-{n}", "nickname": f"bench{n}", "provider": User.Provider.KAKAO},
+            )
+            users.append(user)
+
+        keywords = []
+        for n in range(1, options["keywords"] + 1):
+            title = f"벤치 키워드 {n}"
+            keyword, _ = Keyword.objects.get_or_create(
+                title=title,
+                category="연예",
+                defaults={"source_category": BENCH_SOURCE, "is_collected": True, "collected_at": timezone.now()},
+            )
+            content = _article_text(title, options["article_chars"])
+            Article.objects.update_or_create(
+                keyword=keyword,
+                defaults={
+                    "title": f"{title} 기사",
+                    "content": content,
+                    "condensed_content": content[:1500],
+                    "origin_link": f"https://news.example.com/bench/{keyword.id}",
+                },
+            )
+            Image.objects.bulk_create(
+                [
+                    Image(
+                        keyword=keyword,
+                        image_url=f"https://img.example.com/bench/{keyword.id}/{order}.jpg",
+                        order=order,
+                    )
+                    for order in range(1, options["images"] + 1)
+                ],
+                ignore_conflicts=True,
+            )
+            keywords.append(keyword)
+
+        self.stdout.write(self.style.SUCCESS(f"벤치 데이터 준비 완료: keyword {len(keywords)}개, user {len(users)}명"))
+        self.stdout.write(
+            f"--keyword-ids {_id_ranges([k.id for k in keywords])} --user-ids {_id_ranges([u.id for u in users])}"
+        )
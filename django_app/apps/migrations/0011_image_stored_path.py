@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("apps", "0010_alter_userinterest_category"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="image",
+            name="stored_path",
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+    ]
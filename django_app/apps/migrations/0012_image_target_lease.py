@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:07
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def remove_duplicate_images(apps, schema_editor):
+    # 유니크 제약 추가 전, 재시도로 중복 저장된 (keyword, order) 이미지는 가장 먼저 저장된 것만 남김
+    Image = apps.get_model("apps", "Image")
+    keep_ids = Image.objects.values("keyword_id", "order").annotate(keep_id=Min("id")).values_list("keep_id", flat=True)
+    Image.objects.exclude(id__in=list(keep_ids)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("apps", "0011_image_stored_path"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_images, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name="keyword",
+            name="image_leased_until",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="keyword",
+            index=models.Index(
+                condition=models.Q(("is_collected", False)),
+                fields=["created_at", "id"],
+                name="keyword_image_target_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="image",
+            constraint=models.UniqueConstraint(fields=("keyword", "order"), name="image_keyword_order_uniq"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("apps", "0012_image_target_lease"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="condensed_content",
+            field=models.TextField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("apps", "0013_article_condensed_content"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="KeywordDraft",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("title", models.CharField(max_length=255)),
+                ("content", models.TextField()),
+                ("image_1_url", models.CharField(blank=True, max_length=1000, null=True)),
+                ("image_2_url", models.CharField(blank=True, max_length=1000, null=True)),
+                ("image_3_url", models.CharField(blank=True, max_length=1000, null=True)),
+                ("response_time_ms", models.IntegerField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "keyword",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="draft", to="apps.keyword"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "키워드 사전 생성 초안",
+                "verbose_name_plural": "키워드 사전 생성 초안 목록",
+                "db_table": "keyword_draft",
+            },
+        ),
+    ]
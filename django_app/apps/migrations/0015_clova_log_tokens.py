@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:29
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("apps", "0014_keyword_draft"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="clovastudiolog",
+            name="completion_tokens",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="clovastudiolog",
+            name="prompt_tokens",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="clovastudiolog",
+            name="queue_wait_ms",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="clovastudiolog",
+            name="requested_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:48
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("apps", "0015_clova_log_tokens"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="KeywordPopularity",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("click_count", models.BigIntegerField(default=0)),
+                ("score", models.FloatField(default=0.0)),
+                ("snapshot_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "keyword",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="popularity", to="apps.keyword"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "키워드 인기도",
+                "verbose_name_plural": "키워드 인기도 목록",
+                "db_table": "keyword_popularity",
+                "indexes": [models.Index(fields=["-score"], name="keyword_popularity_score_idx")],
+            },
+        ),
+    ]
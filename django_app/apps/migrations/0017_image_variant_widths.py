@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("apps", "0016_keyword_popularity"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="image",
+            name="variant_widths",
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:40
+
+from django.db import migrations
+from django.db.models import Exists, OuterRef
+from django.utils.timezone import now
+
+
+def mark_keywords_with_images_collected(apps, schema_editor):
+    # 예전 단건 저장 경로로 이미지만 저장되고 수집 완료 표시가 빠진 키워드는 선점 대상에서 빠지므로 완료 처리
+    Image = apps.get_model("apps", "Image")
+    Keyword = apps.get_model("apps", "Keyword")
+    Keyword.objects.filter(is_collected=False).filter(Exists(Image.objects.filter(keyword_id=OuterRef("id")))).update(
+        is_collected=True, collected_at=now(), image_leased_until=None
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("apps", "0017_image_variant_widths"),
+    ]
+
+    operations = [
+        migrations.RunPython(mark_keywords_with_images_collected, migrations.RunPython.noop),
+    ]
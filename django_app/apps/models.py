@@ -3,6 +3,9 @@ import random
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils import timezone
+
+from apps.utils.feed_cache import bump_feed_version
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +84,8 @@ class Keyword(models.Model):
     is_active = models.BooleanField(default=True)
     is_collected = models.BooleanField(default=False)
     collected_at = models.DateTimeField(null=True, blank=True)
+    # 이미지 수집 작업자가 선점한 만료 시각 (만료 전까지 다른 작업자에게 배정하지 않음)
+    image_leased_until = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -88,6 +93,14 @@ class Keyword(models.Model):
         verbose_name = "키워드"
         verbose_name_plural = "키워드 목록"
         unique_together = ("title", "category")
+        indexes = [
+            # 이미지 수집 대상(미수집) 키워드만 담는 부분 인덱스 - 선점 조회 정렬 순서와 동일
+            models.Index(
+                fields=["created_at", "id"],
+                name="keyword_image_target_idx",
+                condition=models.Q(is_collected=False),
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -109,12 +122,16 @@ class Keyword(models.Model):
                 # if not self.collected_at:
                 #     self.collected_at = timezone.now()
         super().save(*args, **kwargs)
+        # 공개 피드 페이지 캐시 무효화
+        bump_feed_version()
 
 
 class Article(models.Model):
     keyword = models.OneToOneField(Keyword, on_delete=models.CASCADE, related_name="article")
     title = models.CharField(max_length=255)
     content = models.TextField()
+    # 프롬프트용 추출 요약 (FastAPI 가 수집 시 계산, 토큰 예산 이하)
+    condensed_content = models.TextField(null=True, blank=True)
     origin_link = models.CharField(max_length=1000)
 
     class Meta:
@@ -149,6 +166,31 @@ class GeneratedPost(models.Model):
         return self.title
 
 
+class KeywordDraft(models.Model):
+    """
+    인기 키워드 사전 생성 초안 (사용자 무관 기본 글)
+    - FastAPI 가 한가한 시간대에 미리 생성해 저장
+    - 사용자가 생성 요청하면 Clova 호출 없이 이 초안으로 GeneratedPost 를 만듦
+    """
+
+    keyword = models.OneToOneField(Keyword, on_delete=models.CASCADE, related_name="draft")
+    title = models.CharField(max_length=255)
+    content = models.TextField()
+    image_1_url = models.CharField(max_length=1000, null=True, blank=True)
+    image_2_url = models.CharField(max_length=1000, null=True, blank=True)
+    image_3_url = models.CharField(max_length=1000, null=True, blank=True)
+    response_time_ms = models.IntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "keyword_draft"
+        verbose_name = "키워드 사전 생성 초안"
+        verbose_name_plural = "키워드 사전 생성 초안 목록"
+
+    def __str__(self) -> str:
+        return self.title
+
+
 class CopyLog(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     post = models.ForeignKey(GeneratedPost, on_delete=models.CASCADE)
@@ -184,6 +226,10 @@ class Image(models.Model):
     keyword = models.ForeignKey(Keyword, on_delete=models.CASCADE)  # 이미지의 진짜 소유자
     post = models.ForeignKey(GeneratedPost, on_delete=models.SET_NULL, null=True, blank=True)  # 선택적 연결
     image_url = models.CharField(max_length=1000)
+    # FastAPI가 수집 시 media 볼륨에 저장한 파일 경로 (MEDIA_ROOT 기준, 내용 해시 기반)
+    stored_path = models.CharField(max_length=255, null=True, blank=True)
+    # stored_path 기준으로 미리 만들어 둔 WebP 변환본 폭 목록 (글 HTML srcset 용)
+    variant_widths = models.JSONField(default=list, blank=True)
     order = models.SmallIntegerField()
     description = models.CharField(max_length=255, null=True, blank=True)
     collected_at = models.DateTimeField(auto_now_add=True)
@@ -192,6 +238,10 @@ class Image(models.Model):
         db_table = "image"
         verbose_name = "이미지"
         verbose_name_plural = "이미지 목록"
+        constraints = [
+            # 재시도 시 같은 순번 이미지가 중복 저장되지 않도록 보장
+            models.UniqueConstraint(fields=["keyword", "order"], name="image_keyword_order_uniq"),
+        ]
 
     def __str__(self) -> str:
         if self.post:
@@ -213,6 +263,29 @@ class KeywordClickLog(models.Model):
         return f"{self.user.nickname} - {self.keyword.title}"
 
 
+class KeywordPopularity(models.Model):
+    """
+    키워드 인기도 스냅샷 (인기순 정렬용)
+    - 클릭 시 Redis sorted set 에 누적 클릭 수 / 시간 감쇠 점수를 바로 반영 (apps.utils.keyword_popularity)
+    - 스케줄러가 주기적으로 Redis 값을 이 테이블에 옮겨 씀 → 정렬은 클릭 로그 집계 없이 score 만 읽음
+    """
+
+    keyword = models.OneToOneField(Keyword, on_delete=models.CASCADE, related_name="popularity")
+    click_count = models.BigIntegerField(default=0)
+    # 클릭마다 1 을 더하고 반감기(HALF_LIFE_HOURS)마다 절반으로 줄어드는 점수 (snapshot_at 기준 값)
+    score = models.FloatField(default=0.0)
+    snapshot_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "keyword_popularity"
+        verbose_name = "키워드 인기도"
+        verbose_name_plural = "키워드 인기도 목록"
+        indexes = [models.Index(fields=["-score"], name="keyword_popularity_score_idx")]
+
+    def __str__(self) -> str:
+        return f"{self.keyword_id} - {self.score:.2f}"
+
+
 class ClovaStudioLog(models.Model):
     class ClovaStatus(models.TextChoices):
         SUCCESS = "success", "성공"
@@ -222,7 +295,11 @@ class ClovaStudioLog(models.Model):
     status = models.CharField(max_length=20, choices=ClovaStatus.choices)
     error_message = models.TextField(null=True, blank=True)
     response_time_ms = models.IntegerField(null=True, blank=True)
-    requested_at = models.DateTimeField(auto_now_add=True)
+    prompt_tokens = models.IntegerField(null=True, blank=True)
+    completion_tokens = models.IntegerField(null=True, blank=True)
+    queue_wait_ms = models.IntegerField(null=True, blank=True)
+    # FastAPI 가 버퍼링 후 일괄 전송하므로 호출 시각을 그대로 받음 (없으면 저장 시각)
+    requested_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         db_table = "clova_studio_log"
@@ -1,10 +1,11 @@
 from rest_framework import serializers
 
-from apps.models import GeneratedPost, Keyword
+from apps.models import Keyword
 
 
 class KeywordListSerializer(serializers.ModelSerializer):
-    is_generated = serializers.SerializerMethodField()
+    # 로그인한 유저가 해당 키워드로 생성 완료한 게시글 있는지 (KeywordListAPIView 가 queryset 에 annotate)
+    is_generated = serializers.BooleanField(read_only=True, default=False)
 
     class Meta:
         model = Keyword
@@ -16,10 +17,3 @@ class KeywordListSerializer(serializers.ModelSerializer):
             "collected_at",
             "is_generated",
         ]
-
-    def get_is_generated(self, obj):
-        user = self.context.get("user")
-        if not user or not user.is_authenticated:
-            return False
-        # 로그인한 유저가 해당 키워드로 생성 완료한 게시글 있는지 체크
-        return GeneratedPost.objects.filter(user=user, keyword=obj, is_generated=True).exists()
@@ -0,0 +1,81 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils.timezone import now
+from rest_framework.test import APIClient
+
+from apps.models import GeneratedPost, Keyword, KeywordClickLog, KeywordPopularity, User
+
+
+class KeywordListAPITest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create(email="u@example.com", social_id="1", nickname="u", provider="kakao")
+        self.client.force_authenticate(self.user)
+
+    def _seed(self, count: int) -> list[Keyword]:
+        start = Keyword.objects.count()
+        keywords = [
+            Keyword.objects.create(
+                title=f"키워드{start + i}", category="연예", source_category="종합", is_collected=True
+            )
+            for i in range(count)
+        ]
+        for keyword in keywords[::2]:
+            GeneratedPost.objects.create(user=self.user, keyword=keyword, title="글", content="본문", is_generated=True)
+        return keywords
+
+    def test_is_generated_query_count_does_not_grow_with_page_size(self):
+        keywords = self._seed(5)
+        # 관심사 조회 + 페이지 count + 페이지 조회 (행마다 exists() 조회 없음)
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/keywords/", {"page_size": 5})
+        self.assertEqual(response.status_code, 200)
+        generated = {row["id"]: row["is_generated"] for row in response.json()["data"]}
+        self.assertEqual(generated, {k.id: i % 2 == 0 for i, k in enumerate(keywords)})
+
+        self._seed(45)
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/keywords/", {"page_size": 50, "sort": "popular"})
+        self.assertEqual(len(response.json()["data"]), 50)
+
+    def test_anonymous_is_generated_false(self):
+        self._seed(2)
+        self.client.force_authenticate(None)
+        response = self.client.get("/api/keywords/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({row["is_generated"] for row in response.json()["data"]}, {False})
+
+    def test_popular_sort_reads_decayed_popularity(self):
+        old, recent, none = self._seed(3)
+        for _ in range(3):
+            KeywordClickLog.objects.create(user=self.user, keyword=old)
+        KeywordClickLog.objects.filter(keyword=old).update(clicked_at=now() - timedelta(days=5))
+        KeywordClickLog.objects.create(user=self.user, keyword=recent)
+
+        call_command("backfill_keyword_popularity", stdout=StringIO())
+        self.assertEqual(KeywordPopularity.objects.get(keyword=old).click_count, 3)
+
+        # 5일 전 클릭 3회 < 방금 클릭 1회 (24시간 반감기), 클릭 없는 키워드는 마지막
+        response = self.client.get("/api/keywords/", {"sort": "popular"})
+        self.assertEqual([row["id"] for row in response.json()["data"]], [recent.id, old.id, none.id])
+
+    def test_anonymous_feed_served_from_cache_until_keyword_changes(self):
+        keywords = self._seed(3)
+        self.client.force_authenticate(None)
+        first = self.client.get("/api/keywords/", {"page_size": 10}).json()
+
+        # 같은 피드 버전이면 DB 조회 없이 캐시에서 응답
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/api/keywords/", {"page_size": 10}).json(), first)
+
+        # 키워드 저장(토글) → 버전이 올라가 새로 조회
+        with self.captureOnCommitCallbacks(execute=True):
+            keywords[0].is_active = False
+            keywords[0].save()
+        data = self.client.get("/api/keywords/", {"page_size": 10}).json()["data"]
+        self.assertNotIn(keywords[0].id, [row["id"] for row in data])
@@ -1,7 +1,17 @@
 from typing import cast
 
 from django.contrib.auth import get_user_model
-from django.db.models import Case, Count, IntegerField, QuerySet, Value, When
+from django.db.models import (
+    BooleanField,
+    Case,
+    Exists,
+    F,
+    IntegerField,
+    OuterRef,
+    QuerySet,
+    Value,
+    When,
+)
 from django.shortcuts import get_object_or_404
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
@@ -10,13 +20,17 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.models import Keyword, KeywordClickLog
+from apps.models import GeneratedPost, Keyword, KeywordClickLog
 from apps.users.serializers.keyword_serializers import KeywordListSerializer
+from apps.utils import feed_cache, keyword_popularity
 from apps.utils.paginations import CustomPageNumberPagination
 from apps.utils.permissions import IsUser
 
 user_model = get_user_model()
 
+# 인기순: 클릭 로그 집계 대신 KeywordPopularity 스냅샷의 시간 감쇠 점수 (클릭 없는 키워드는 뒤로)
+_POPULARITY_DESC = F("popularity__score").desc(nulls_last=True)
+
 
 @extend_schema(
     tags=["[User] Keyword - 콘텐츠"],
@@ -24,8 +38,9 @@ user_model = get_user_model()
     description=(
         "로그인한 사용자의 관심사를 기준으로 키워드를 우선 정렬하여 반환합니다.\n\n"
         "- 기본 정렬: 관심사 우선 + 최신순 (sort=latest)\n"
-        "- 인기순 정렬: 향후 확장 가능 (sort=popular)\n"
-        "- 페이지네이션 적용 (page, page_size)"
+        "- 인기순 정렬: 최근 클릭일수록 크게 반영한 인기도 점수순 (sort=popular, 주기적 스냅샷 기준)\n"
+        "- 페이지네이션 적용 (page, page_size)\n"
+        "- 비로그인 요청은 페이지 단위로 캐시 (키워드 변경 / 인기도 스냅샷 시 무효화)"
     ),
     parameters=[
         OpenApiParameter(
@@ -34,7 +49,9 @@ user_model = get_user_model()
             location=OpenApiParameter.QUERY,
             enum=["latest", "popular"],
             description=(
-                "정렬 기준:\n" "- latest: 최신순 + 관심사 우선 (기본값)\n" "- popular: 클릭 수 기반 인기순 (추후 지원)"
+                "정렬 기준:\n"
+                "- latest: 최신순 + 관심사 우선 (기본값)\n"
+                "- popular: 클릭 기반 인기도 점수순 (24시간 반감기)"
             ),
         ),
         OpenApiParameter(
@@ -73,24 +90,40 @@ class KeywordListAPIView(APIView):
                     When(category__in=user_categories, then=Value(0)),
                     default=Value(1),
                     output_field=IntegerField(),
-                )
+                ),
+                # 생성 완료 글 여부를 같은 쿼리의 서브쿼리로 (행마다 exists() 조회하지 않음)
+                is_generated=Exists(GeneratedPost.objects.filter(user=user, keyword=OuterRef("pk"), is_generated=True)),
             )
 
             if sort == "popular":
-                qs = qs.annotate(clicks=Count("keywordclicklog")).order_by("priority", "-clicks", "-collected_at")
+                qs = qs.order_by("priority", _POPULARITY_DESC, "-collected_at")
             else:  # latest (기본)
                 qs = qs.order_by("priority", "-collected_at")
         else:
             # 비로그인 유저
+            qs = qs.annotate(is_generated=Value(False, output_field=BooleanField()))
             if sort == "popular":
-                qs = qs.annotate(clicks=Count("keywordclicklog")).order_by("-clicks", "-collected_at")
+                qs = qs.order_by(_POPULARITY_DESC, "-collected_at")
             else:
                 qs = qs.order_by("-collected_at")
 
         paginator = CustomPageNumberPagination()
-        page_qs = paginator.paginate_queryset(qs, request)
-        serializer = KeywordListSerializer(page_qs, many=True, context={"user": user})
-        return paginator.get_paginated_response(serializer.data)
+
+        def render_page() -> dict:
+            page_qs = paginator.paginate_queryset(qs, request)
+            serializer = KeywordListSerializer(page_qs, many=True, context={"user": user})
+            return paginator.get_paginated_response(list(serializer.data)).data
+
+        if user.is_authenticated:
+            return Response(render_page())
+
+        # 비로그인: 모두 같은 페이지를 보므로 피드 버전별 페이지 캐시 (키워드가 바뀌면 버전이 올라가 무효화)
+        key = feed_cache.page_key(
+            "popular" if sort == "popular" else "latest",
+            request.query_params.get(paginator.page_query_param, "1"),
+            paginator.get_page_size(request),
+        )
+        return Response(feed_cache.get_or_fill(key, render_page))
 
 
 @extend_schema(
@@ -119,6 +152,7 @@ class KeywordClickLogView(APIView):
         keyword = get_object_or_404(Keyword, pk=id)
 
         KeywordClickLog.objects.create(user=user, keyword=keyword)
+        keyword_popularity.record_click(keyword.id)
         from rest_framework import status
 
         return Response({"message": "클릭 로그가 기록되었습니다."}, status=status.HTTP_201_CREATED)
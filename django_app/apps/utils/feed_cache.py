@@ -0,0 +1,78 @@
+"""
+공개 키워드 피드(비로그인 KeywordListAPIView) 페이지 캐시
+
+- 페이지 키: keyword_feed:<버전>:<sort>:<page>:<page_size> → 직렬화된 응답 본문 (Django 캐시 = Redis)
+- 버전: 키워드가 바뀌면 bump_feed_version() 으로 올려 이전 페이지를 한 번에 무효화 (지우지 않고 TTL 로 만료)
+    keywords    키워드 저장/토글/수집 (Keyword.save, 수집 일괄 저장, 비활성화)
+    popularity  인기도 스냅샷 - 인기순(popular) 페이지만 무효화
+- 콜드 페이지는 cache.add 락을 잡은 요청 하나만 채우고, 나머지는 잠시 기다렸다가 채워진 값을 읽음
+"""
+
+import time
+from typing import Callable
+
+from django.core.cache import cache
+from django.db import transaction
+
+PAGE_TTL = 10 * 60  # 버전이 안 바뀌어도 10분 뒤 만료
+LOCK_TTL = 10  # 채우는 요청이 죽어도 10초 뒤 다른 요청이 채움
+LOCK_WAIT_SEC = 3.0
+LOCK_POLL_SEC = 0.05
+
+
+def _version_key(scope: str) -> str:
+    return f"keyword_feed:version:{scope}"
+
+
+def feed_version(scope: str) -> int:
+    version = cache.get(_version_key(scope))
+    if version is None:
+        # 버전 키가 만료/유실돼도 이전 페이지 키와 겹치지 않도록 현재 시각(ms)으로 시작
+        cache.add(_version_key(scope), int(time.time() * 1000), None)
+        version = cache.get(_version_key(scope))
+    return version
+
+
+def _incr_version(scope: str) -> None:
+    try:
+        cache.incr(_version_key(scope))
+    except ValueError:
+        # 아직 버전 키가 없음 → 새로 시작 (기존 페이지 키와 겹치지 않음)
+        feed_version(scope)
+
+
+def bump_feed_version(scope: str = "keywords") -> None:
+    """피드 버전 올리기 - 트랜잭션 안이면 커밋 후에 (커밋 전 데이터가 새 버전으로 캐시되지 않도록)"""
+    transaction.on_commit(lambda: _incr_version(scope))
+
+
+def page_key(sort: str, page: str, page_size: int) -> str:
+    version = f"{feed_version('keywords')}"
+    if sort == "popular":
+        version += f".{feed_version('popularity')}"
+    return f"keyword_feed:{version}:{sort}:{page}:{page_size}"
+
+
+def get_or_fill(key: str, fill: Callable[[], dict]) -> dict:
+    """캐시된 페이지 반환, 없으면 락을 잡은 요청 하나만 fill() 로 채움"""
+    data = cache.get(key)
+    if data is not None:
+        return data
+
+    lock_key = f"{key}:lock"
+    if cache.add(lock_key, 1, LOCK_TTL):
+        try:
+            data = fill()
+            cache.set(key, data, PAGE_TTL)
+            return data
+        finally:
+            cache.delete(lock_key)
+
+    # 다른 요청이 채우는 중 → 잠시 대기 후 읽기 (그래도 없으면 캐시 없이 직접 계산)
+    deadline = time.monotonic() + LOCK_WAIT_SEC
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_SEC)
+        data = cache.get(key)
+        if data is not None:
+            return data
+    return fill()
@@ -0,0 +1,18 @@
+"""
+Clova 생성 잡 공용 키 (content 프록시 ↔ internal 완료 콜백 ↔ WebSocket consumer)
+
+- 잡 상태는 Django 캐시(Redis)에 보관 → 폴링 시 FastAPI 를 거치지 않음
+- 완료 알림은 사용자별 채널 그룹으로 push
+"""
+
+JOB_CACHE_TTL = 60 * 60  # 1시간
+# 등록 후 이 시간이 지나도 완료 콜백이 없으면 실패로 응답 (FastAPI 재시작 등으로 잡이 사라진 경우)
+JOB_PENDING_TIMEOUT = 10 * 60
+
+
+def job_cache_key(job_id: str) -> str:
+    return f"generation_job:{job_id}"
+
+
+def user_group(user_id: int) -> str:
+    return f"generation_user_{user_id}"
@@ -0,0 +1,172 @@
+"""
+키워드 인기도 (인기순 정렬용 비정규화 카운터)
+
+- 클릭 시 Redis sorted set 두 개에 바로 반영 (클릭 로그 전체를 다시 집계하지 않음)
+    CLICKS_KEY  누적 클릭 수
+    SCORE_KEY   시간 감쇠 점수 - 클릭마다 1, HALF_LIFE_HOURS 마다 절반
+                (저장 값은 2^((클릭 시각 - epoch) / 반감기) 의 합, epoch 는 EPOCH_KEY)
+- snapshot(): epoch 를 현재 시각으로 옮기고(점수 일괄 축소) 값을 KeywordPopularity 테이블에 upsert
+  → FastAPI 가 주기적으로 호출 (internal keywords/popularity/snapshot/)
+  점수가 PRUNE_SCORE 미만으로 식은 키워드는 sorted set 과 테이블에서 제거 (클릭 없는 키워드와 같이 뒤로 정렬)
+- backfill(): 클릭 로그에서 Redis / KeywordPopularity 를 다시 계산 (manage.py backfill_keyword_popularity)
+- Redis 가 없는 환경(로컬 메모리 캐시)에서는 클릭 반영/스냅샷을 건너뛰고 backfill 만 DB 에 기록
+"""
+
+import logging
+from datetime import datetime
+
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import TruncHour
+from django.utils.timezone import now
+from django_redis import get_redis_connection
+
+from apps.models import Keyword, KeywordClickLog, KeywordPopularity
+from apps.utils.feed_cache import bump_feed_version
+
+logger = logging.getLogger(__name__)
+
+CLICKS_KEY = "keyword_popularity:clicks"
+SCORE_KEY = "keyword_popularity:score"
+EPOCH_KEY = "keyword_popularity:epoch"
+HALF_LIFE_HOURS = 24
+# 이 점수 미만(클릭 1회 기준 약 7일 경과)이면 snapshot 에서 제거 → sorted set 이 누적 키워드 수만큼 커지지 않음
+PRUNE_SCORE = 0.01
+
+_HALF_LIFE_SEC = HALF_LIFE_HOURS * 3600
+_BATCH_SIZE = 1000
+
+# KEYS: clicks, score, epoch / ARGV: keyword_id, 현재 시각(초), 반감기(초)
+_RECORD_CLICK = """
+redis.call('SET', KEYS[3], ARGV[2], 'NX')
+local epoch = tonumber(redis.call('GET', KEYS[3]))
+redis.call('ZINCRBY', KEYS[1], 1, ARGV[1])
+redis.call('ZINCRBY', KEYS[2], 2 ^ ((tonumber(ARGV[2]) - epoch) / tonumber(ARGV[3])), ARGV[1])
+"""
+
+# KEYS: score, epoch / ARGV: 현재 시각(초), 반감기(초) - 점수를 현재 시각 기준으로 줄이고 epoch 갱신
+_REBASE = """
+local epoch = tonumber(redis.call('GET', KEYS[2]))
+local current = tonumber(ARGV[1])
+if epoch and current > epoch then
+    redis.call('ZUNIONSTORE', KEYS[1], 1, KEYS[1], 'WEIGHTS', 2 ^ (-(current - epoch) / tonumber(ARGV[2])))
+end
+redis.call('SET', KEYS[2], ARGV[1])
+"""
+
+# KEYS: score, clicks / ARGV: 기준 점수 - 기준 미만 키워드를 두 sorted set 에서 제거하고 id 목록 반환
+_PRUNE = """
+local members = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', '(' .. ARGV[1])
+if #members > 0 then
+    redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', '(' .. ARGV[1])
+    for i = 1, #members, 1000 do
+        redis.call('ZREM', KEYS[2], unpack(members, i, math.min(i + 999, #members)))
+    end
+end
+return members
+"""
+
+
+def _redis():
+    """django-redis 연결 (Redis 캐시가 아니면 None)"""
+    try:
+        return get_redis_connection("default")
+    except NotImplementedError:
+        return None
+
+
+def record_click(keyword_id: int) -> None:
+    """클릭 1회 반영 (Redis 오류는 로그만 남김 - 클릭 기록 자체는 DB 로그에 남아 backfill 로 복구 가능)"""
+    conn = _redis()
+    if conn is None:
+        return
+    try:
+        conn.register_script(_RECORD_CLICK)(
+            keys=[CLICKS_KEY, SCORE_KEY, EPOCH_KEY], args=[keyword_id, now().timestamp(), _HALF_LIFE_SEC]
+        )
+    except Exception as e:
+        logger.warning(f"[Popularity] keyword_id={keyword_id} 클릭 반영 실패: {e}")
+
+
+def _save(clicks: dict[int, float], scores: dict[int, float], at: datetime) -> tuple[int, set[int]]:
+    """KeywordPopularity upsert → (기록한 키워드 수, 삭제되어 건너뛴 키워드 id)"""
+    ids = set(clicks) | set(scores)
+    existing = set(Keyword.objects.filter(id__in=ids).values_list("id", flat=True))
+    KeywordPopularity.objects.bulk_create(
+        [
+            KeywordPopularity(
+                keyword_id=keyword_id,
+                click_count=int(clicks.get(keyword_id, 0)),
+                score=scores.get(keyword_id, 0.0),
+                snapshot_at=at,
+            )
+            for keyword_id in existing
+        ],
+        update_conflicts=True,
+        unique_fields=["keyword"],
+        update_fields=["click_count", "score", "snapshot_at"],
+        batch_size=_BATCH_SIZE,
+    )
+    return len(existing), ids - existing
+
+
+def snapshot() -> int:
+    """Redis 카운터를 KeywordPopularity 에 기록하고 기록한 키워드 수 반환"""
+    conn = _redis()
+    if conn is None:
+        return 0
+    current = now()
+    conn.register_script(_REBASE)(keys=[SCORE_KEY, EPOCH_KEY], args=[current.timestamp(), _HALF_LIFE_SEC])
+    pruned = [int(member) for member in conn.register_script(_PRUNE)(keys=[SCORE_KEY, CLICKS_KEY], args=[PRUNE_SCORE])]
+    pipe = conn.pipeline(transaction=False)
+    pipe.zrange(CLICKS_KEY, 0, -1, withscores=True)
+    pipe.zrange(SCORE_KEY, 0, -1, withscores=True)
+    clicks, scores = pipe.execute()
+
+    saved, deleted = _save(
+        {int(member): value for member, value in clicks}, {int(member): value for member, value in scores}, current
+    )
+    if pruned:
+        KeywordPopularity.objects.filter(keyword_id__in=pruned).delete()
+    if deleted:
+        # 삭제된 키워드는 카운터에서도 제거
+        pipe = conn.pipeline(transaction=False)
+        pipe.zrem(CLICKS_KEY, *deleted)
+        pipe.zrem(SCORE_KEY, *deleted)
+        pipe.execute()
+    # 공개 피드의 인기순 페이지 캐시 무효화
+    bump_feed_version("popularity")
+    return saved
+
+
+def backfill() -> int:
+    """클릭 로그 전체로 카운터를 다시 계산 (시간 단위로 묶어 집계, 감쇠는 시간 구간 가운데 기준)"""
+    current = now()
+    clicks: dict[int, float] = {}
+    scores: dict[int, float] = {}
+    rows = (
+        KeywordClickLog.objects.annotate(hour=TruncHour("clicked_at"))
+        .values("keyword_id", "hour")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    for row in rows.iterator(chunk_size=_BATCH_SIZE):
+        age_sec = max(0.0, (current - row["hour"]).total_seconds() - 1800)
+        clicks[row["keyword_id"]] = clicks.get(row["keyword_id"], 0) + row["count"]
+        scores[row["keyword_id"]] = scores.get(row["keyword_id"], 0.0) + row["count"] * 2 ** (-age_sec / _HALF_LIFE_SEC)
+
+    with transaction.atomic():
+        KeywordPopularity.objects.all().delete()
+        saved, _ = _save(clicks, scores, current)
+
+    conn = _redis()
+    if conn is not None:
+        pipe = conn.pipeline(transaction=True)
+        pipe.delete(CLICKS_KEY, SCORE_KEY)
+        if clicks:
+            pipe.zadd(CLICKS_KEY, clicks)
+            pipe.zadd(SCORE_KEY, scores)
+        pipe.set(EPOCH_KEY, current.timestamp())
+        pipe.execute()
+    bump_feed_version("popularity")
+    return saved
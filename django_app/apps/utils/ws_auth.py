@@ -0,0 +1,29 @@
+from urllib.parse import parse_qs
+
+from channels.db import database_sync_to_async
+from channels.middleware import BaseMiddleware
+from django.contrib.auth.models import AnonymousUser
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+
+
+@database_sync_to_async
+def _get_user(raw_token: str):
+    auth = JWTAuthentication()
+    try:
+        return auth.get_user(auth.get_validated_token(raw_token))
+    except (InvalidToken, AuthenticationFailed):
+        return AnonymousUser()
+
+
+class JWTAuthMiddleware(BaseMiddleware):
+    """
+    WebSocket 용 JWT 인증
+    - 브라우저 WebSocket 은 Authorization 헤더를 보낼 수 없으므로 ?token=<access token> 으로 전달
+    - 검증 실패 시 scope["user"] = AnonymousUser (consumer 에서 연결 거부)
+    """
+
+    async def __call__(self, scope, receive, send):
+        token = parse_qs(scope.get("query_string", b"").decode()).get("token", [None])[0]
+        scope["user"] = await _get_user(token) if token else AnonymousUser()
+        return await super().__call__(scope, receive, send)
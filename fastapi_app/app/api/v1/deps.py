@@ -0,0 +1,28 @@
+# fastapi_app/app/api/v1/deps.py
+import os
+
+from fastapi import HTTPException
+from fastapi import status as http_status
+
+ENV = os.getenv("ENV", "local")
+INTERNAL_SECRET = os.getenv("INTERNAL_SECRET_KEY", "")  # 기존 내부 인증 키 재사용
+
+
+def check_internal_secret(x_internal_secret: str | None):
+    """
+    관리자 API(/admin/*) 공용 인증
+    운영(ENV=production)에서는 INTERNAL_SECRET_KEY 반드시 필요.
+    비운영에선 설정돼 있으면 검사, 없으면 통과.
+    """
+    if ENV == "production":
+        if not INTERNAL_SECRET:
+            raise HTTPException(
+                status_code=http_status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Admin API disabled: missing INTERNAL_SECRET_KEY",
+            )
+        if x_internal_secret != INTERNAL_SECRET:
+            raise HTTPException(status_code=http_status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+    else:
+        # 개발/로컬: INTERNAL_SECRET이 설정돼 있다면 검사, 없으면 프리패스
+        if INTERNAL_SECRET and x_internal_secret != INTERNAL_SECRET:
+            raise HTTPException(status_code=http_status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
@@ -0,0 +1,20 @@
+# fastapi_app/app/api/v1/metrics_admin.py
+from fastapi import APIRouter, Header
+
+from app.api.v1.deps import check_internal_secret
+from app.common import metrics
+
+router = APIRouter(prefix="/admin/metrics", tags=["admin:metrics"])
+
+
+@router.get("")
+def get_metrics(x_internal_secret: str | None = Header(default=None, alias="X-INTERNAL-SECRET")):
+    check_internal_secret(x_internal_secret)
+    return metrics.snapshot()
+
+
+@router.post("/reset")
+def reset_metrics(x_internal_secret: str | None = Header(default=None, alias="X-INTERNAL-SECRET")):
+    check_internal_secret(x_internal_secret)
+    metrics.reset()
+    return {"ok": True}
@@ -1,5 +1,7 @@
 from fastapi import APIRouter
 
+from app.api.v1.metrics_admin import router as metrics_admin_router
+
 # 스케줄러 관리 라우터 (항상 등록, 인증은 라우터 내부에서 처리)
 from app.api.v1.scheduler_admin import router as scheduler_admin_router
 from app.features.internal.router import internal_router
@@ -11,3 +13,4 @@ api_router = APIRouter(prefix="/api/v1")
 api_router.include_router(user_router)
 api_router.include_router(internal_router)
 api_router.include_router(scheduler_admin_router)
+api_router.include_router(metrics_admin_router)
@@ -8,6 +8,14 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+class ApiResponseError(RuntimeError):
+    """2xx 가 아닌 응답 (기존 RuntimeError 처리와 호환, 재시도 판단용 status_code 포함)"""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"API 응답 오류: status={status_code}")
+        self.status_code = status_code
+
+
 async def get_json(url: str, headers: Optional[Dict[str, str]] = None) -> Any:
     default_headers = {
         "X-Internal-Secret": settings.internal_secret_key or "",
@@ -53,7 +61,7 @@ async def post_json(url: str, data: Any, headers: Optional[Dict[str, str]] = Non
 
         if response.status_code not in (200, 201):
             logger.error(f"API 응답 오류: status={response.status_code}, text={response.text!r}")
-            raise RuntimeError("API 응답 오류")
+            raise ApiResponseError(response.status_code)
 
         try:
             return response.json()
@@ -0,0 +1,64 @@
+# app/common/metrics.py
+"""
+프로세스 내 간단한 운영 지표 (카운터 / 관측값 / 게이지)
+
+- incr("kakao_cache_hit")          : 누적 카운터
+- observe("clova_latency_ms", 812) : count / sum / max 누적
+- gauge("clova_queue_depth", 3)     : 마지막 값
+
+GET /api/v1/admin/metrics 로 조회합니다. 워커(프로세스)별로 따로 집계됩니다.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Any, Dict
+
+_lock = threading.Lock()
+_counters: Dict[str, float] = defaultdict(float)
+_observations: Dict[str, Dict[str, float]] = {}
+_gauges: Dict[str, float] = {}
+
+
+def incr(name: str, value: float = 1) -> None:
+    with _lock:
+        _counters[name] += value
+
+
+def observe(name: str, value: float) -> None:
+    with _lock:
+        stat = _observations.setdefault(name, {"count": 0, "sum": 0.0, "max": 0.0})
+        stat["count"] += 1
+        stat["sum"] += value
+        stat["max"] = max(stat["max"], value)
+
+
+def gauge(name: str, value: float) -> None:
+    with _lock:
+        _gauges[name] = value
+
+
+def snapshot() -> Dict[str, Any]:
+    with _lock:
+        counters = dict(_counters)
+        observations = {
+            name: {**stat, "avg": round(stat["sum"] / stat["count"], 3) if stat["count"] else 0.0}
+            for name, stat in _observations.items()
+        }
+        gauges = dict(_gauges)
+
+    # xxx_hit / xxx_miss 쌍이 있으면 적중률 계산
+    ratios = {}
+    for name, hits in counters.items():
+        if name.endswith("_hit"):
+            prefix = name[: -len("_hit")]
+            total = hits + counters.get(f"{prefix}_miss", 0)
+            ratios[f"{prefix}_hit_rate"] = round(hits / total, 4) if total else 0.0
+
+    return {"counters": counters, "ratios": ratios, "observations": observations, "gauges": gauges}
+
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
+        _observations.clear()
+        _gauges.clear()
@@ -0,0 +1,51 @@
+# app/common/rate_limit.py
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    외부 API 호출 속도 제한용 토큰 버킷 (단일 이벤트 루프 내 공유)
+
+    - rate: 초당 보충되는 토큰 수 (= 평균 QPS)
+    - capacity: 버스트 허용량
+    - pause(seconds): 쿼터 초과 응답을 받았을 때 일정 시간 모든 acquire()를 멈춤
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        # 락 안에서 대기하므로 먼저 들어온 요청부터 순서대로 토큰을 받음
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        # 재개 직후 버스트가 몰리지 않도록 빈 버킷에서 다시 채움
+        self._tokens = 0.0
+        self._updated = self._paused_until
+
+    @property
+    def paused(self) -> bool:
+        return time.monotonic() < self._paused_until
@@ -12,6 +12,9 @@ from app.common.logger import get_logger
 from app.features.internal.fetch_image.service import (  # 이미지 수집
     fetch_and_save_images,
 )
+from app.features.internal.generate_clova_post.pregenerate import (  # 인기 키워드 사전 생성
+    pregenerate_drafts,
+)
 
 # === 우리 프로젝트 실제 경로 ===
 from app.features.internal.scrape_titles.services import (
@@ -63,6 +66,9 @@ async def article_step() -> None:
 
 image_step: AsyncNoArg = _wrap_noarg(fetch_and_save_images)
 
+# 선택 단계: settings.pregeneration_enabled + 한가한 시간대에만 실제로 Clova 호출
+pregenerate_step: AsyncNoArg = _wrap_noarg(pregenerate_drafts)
+
 
 async def _initial_wait():
     if INITIAL_DELAY_SECONDS > 0:
@@ -85,7 +91,7 @@ async def _jitter_wait():
 
 
 async def run_cycle_once() -> None:
-    """키워드 → 기사(job) → 이미지 한 번 실행 (중복 방지 락 포함)."""
+    """키워드 → 기사(job) → 이미지 → 사전 생성(선택) 한 번 실행 (중복 방지 락 포함)."""
     global _lock
     if _lock is None:
         _lock = asyncio.Lock()
@@ -119,6 +125,13 @@ async def run_cycle_once() -> None:
         except Exception:
             logger.exception("[Scheduler] image step failed")
 
+        # 4) 사전 생성 (선택)
+        try:
+            await pregenerate_step()
+            logger.info("[Scheduler] pregenerate step done")
+        except Exception:
+            logger.exception("[Scheduler] pregenerate step failed")
+
         logger.info(f"[Scheduler] cycle end (elapsed={time.time() - started:.1f}s)")
 
 
@@ -230,6 +243,7 @@ class BlogiScheduler:
                 (keyword_step, "keyword"),
                 (article_step, "article(job)"),
                 (image_step, "image"),
+                (pregenerate_step, "pregenerate"),
             ):
                 if self._stop_event.is_set() or self._paused:
                     logger.info(f"[Scheduler] skip step: {name} (stop/pause)")
@@ -1,17 +1,89 @@
+import re
+
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+
+# 네이버 검색 API 제목처럼 <b> 강조 태그와 기본 엔티티만 있는 경우 (파서 없이 처리 가능)
+_SIMPLE_MARKUP_RE = re.compile(r"(?:[^<&]|</?b>|&(?:amp|lt|gt|quot|apos|#39|#x27|#34);)*")
+_B_TAG_RE = re.compile(r"</?b>")
+_ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+_ENTITY_RE = re.compile(r"&(amp|lt|gt|quot|apos|#39|#x27|#34);")
+_DROP_TAGS = ("script", "style", "aside", "footer", "header", "nav", "form")
+_ENTITY_MAP = {
+    "amp": "&",
+    "lt": "<",
+    "gt": ">",
+    "quot": '"',
+    "apos": "'",
+    "#39": "'",
+    "#x27": "'",
+    "#34": '"',
+}
+
+
+def _text_node(text: str) -> str:
+    # BeautifulSoup 은 공백 문자로만 된 텍스트 노드를 "\n" 또는 " " 하나로 줄임
+    if text and not text.strip(_ASCII_SPACES):
+        return "\n" if "\n" in text else " "
+    return text
+
+
+def _has_markup(text: str) -> bool:
+    return "<" in text or "&" in text
+
+
+def _join_clean_lines(text: str) -> str:
+    return "\n".join(filter(None, map(str.strip, text.splitlines())))
 
 
 # 스크랩한 기사 제목에서 HTML 태그를 제거하고 텍스트만 추출
 def clean_html(raw_html: str) -> str:
-    soup = BeautifulSoup(raw_html, "html.parser")
-    return soup.get_text()
+    if not _has_markup(raw_html):
+        return _text_node(raw_html)
+    if _SIMPLE_MARKUP_RE.fullmatch(raw_html):
+        nodes = (_ENTITY_RE.sub(lambda m: _ENTITY_MAP[m.group(1)], node) for node in _B_TAG_RE.split(raw_html))
+        return "".join(map(_text_node, nodes))
+    return _clean_html_reference(raw_html)
 
 
 # 스크랩한 기사 본문에서 불필요한 태그 제거 후 텍스트 정제
 def clean_article_content(raw_html: str) -> str:
+    # Playwright inner_text() 결과처럼 태그/엔티티가 없는 본문은 파싱을 건너뜀
+    if not _has_markup(raw_html):
+        return _join_clean_lines(raw_html)
+    if "\x00" in raw_html:
+        # lxml 은 NULL 문자를 U+FFFD 로 바꿈 → 기존 구현
+        return _clean_article_content_reference(raw_html)
+    try:
+        return _clean_article_content_lxml(raw_html)
+    except (ValueError, etree.ParserError):
+        # lxml 이 받지 않는 입력 (제어 문자, 빈 문서) → 기존 구현
+        return _clean_article_content_reference(raw_html)
+
+
+def _clean_article_content_lxml(raw_html: str) -> str:
+    root = lxml_html.document_fromstring(raw_html)
+    # drop_tree() 는 뒤따르는 텍스트를 앞 텍스트에 붙임 → 비우기만 해서 텍스트 노드 경계를 BeautifulSoup 과 같게 유지
+    for tag in list(root.iter(*_DROP_TAGS)):
+        tag.clear(keep_tail=True)
+
+    article_body = next(root.iter("article"), None)
+    if article_body is None:
+        article_body = next((div for div in root.iter("div") if "content" in (div.get("class") or "").split()), root)
+    return _join_clean_lines("\n".join(article_body.itertext()))
+
+
+# 기존 BeautifulSoup 구현 (제목의 복잡한 마크업 처리 및 scripts/bench_html_clean.py 정합성 비교 기준)
+def _clean_html_reference(raw_html: str) -> str:
+    soup = BeautifulSoup(raw_html, "html.parser")
+    return soup.get_text()
+
+
+def _clean_article_content_reference(raw_html: str) -> str:
     soup = BeautifulSoup(raw_html, "html.parser")
 
-    for tag in soup(["script", "style", "aside", "footer", "header", "nav", "form"]):
+    for tag in soup(list(_DROP_TAGS)):
         tag.decompose()
 
     article_body = soup.find("article") or soup.find("div", class_="content") or soup
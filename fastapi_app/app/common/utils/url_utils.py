@@ -1,3 +1,6 @@
+import asyncio
+import ipaddress
+import socket
 from urllib.parse import urlparse
 
 
@@ -24,3 +27,27 @@ def join_url(*parts: str) -> str:
         -> "http://localhost:8000/api/keywords/list/"
     """
     return "/".join(part.strip("/") for part in parts) + "/"
+
+
+def _is_public_ip(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address.split("%", 1)[0])
+    except ValueError:
+        return False
+    return ip.is_global and not ip.is_multicast
+
+
+async def is_public_http_url(url: str) -> bool:
+    """
+    http(s) URL 이고 호스트가 공인 IP 로만 해석되는지 확인합니다.
+    외부에서 받은 URL 을 서버가 대신 요청할 때 내부망/루프백/링크 로컬(메타데이터) 주소로 향하는 것을 막습니다.
+    """
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not parsed.hostname:
+        return False
+    try:
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        infos = await asyncio.get_running_loop().getaddrinfo(parsed.hostname, port, type=socket.SOCK_STREAM)
+    except (OSError, ValueError):
+        return False
+    return bool(infos) and all(_is_public_ip(str(info[4][0])) for info in infos)
@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import Dict, List, Literal, Optional
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -27,6 +27,50 @@ class Settings(BaseSettings):
         default="/api/internal/keywords/{id}/collected/",
         description="키워드 수집 완료 처리",
     )
+    django_api_endpoint_image_targets: str = Field(
+        default="/api/internal/keywords/image-targets/lease/",
+        description="대표 이미지 수집 대상 키워드 선점 (POST, 동시 실행 시 중복 배정 없음)",
+    )
+    django_api_endpoint_save_images_bulk: str = Field(
+        default="/api/internal/images/bulk/",
+        description="이미지 일괄 저장 + 수집 완료 처리 API",
+    )
+
+    # 대표 이미지 수집 파이프라인 (Kakao 호출 제한)
+    kakao_qps: float = Field(default=8.0, description="Kakao 이미지 검색 초당 호출 수 (토큰 버킷 보충 속도)")
+    kakao_burst: int = Field(default=8, description="Kakao 이미지 검색 버스트 허용량")
+    image_fetch_concurrency: int = Field(default=4, description="동시에 처리할 이미지 수집 키워드 수")
+    image_target_batch_size: int = Field(default=20, description="한 번에 조회할 이미지 수집 대상 키워드 수")
+    kakao_throttle_pause_sec: float = Field(default=30.0, description="Kakao 쿼터 초과 시 일시 정지 시간(초)")
+    kakao_throttle_max_pauses: int = Field(default=3, description="한 번의 실행에서 허용할 쿼터 초과 일시 정지 횟수")
+    kakao_image_fetch_mode: Literal["serial", "parallel"] = Field(
+        default="serial",
+        description="검색어 시도 방식 (serial: 순차 시도 후 최다 결과 1개, parallel: 동시 조회 후 순위 병합)",
+    )
+
+    # 이미지 후보 검증 (상태/타입/크기 확인 + 중복 제거)
+    image_validation_enabled: bool = Field(default=True, description="이미지 저장 전 후보 검증 여부")
+    image_overfetch_count: int = Field(default=8, description="검증용으로 Kakao 에서 받아올 후보 수")
+    image_probe_concurrency: int = Field(default=8, description="후보 검증 동시 요청 수")
+    image_probe_timeout_sec: float = Field(default=5.0, description="후보 검증 요청 타임아웃(초)")
+    image_probe_max_bytes: int = Field(default=2 * 1024 * 1024, description="후보 검증 시 최대 다운로드 크기")
+    image_min_width: int = Field(default=300, description="허용 최소 이미지 폭(px)")
+    image_min_height: int = Field(default=200, description="허용 최소 이미지 높이(px)")
+    image_dhash_distance: int = Field(default=6, description="중복으로 볼 dHash 해밍 거리 이하")
+
+    # 수집 이미지 로컬 저장소 (nginx 와 공유하는 media 볼륨)
+    image_store_enabled: bool = Field(default=True, description="검증 통과 이미지를 media 볼륨에 저장할지 여부")
+    media_root: str = Field(default="/blogi/app/media", description="media 볼륨 경로 (nginx /media/ 와 동일)")
+    media_base_url: str = Field(
+        default="",
+        description="media 볼륨을 서빙하는 nginx 공개 URL prefix (미설정 시 {fastapi_origin}/media)",
+    )
+
+    # Kakao 이미지 검색 결과 캐시 (redis_url 미설정 시 프로세스 메모리 캐시 - 로컬 단독 실행용)
+    redis_url: Optional[str] = Field(default=None, description="캐시용 Redis URL (예: redis://redis:6379/2)")
+    kakao_cache_ttl_sec: int = Field(default=6 * 60 * 60, description="Kakao 검색 결과 캐시 TTL(초)")
+    kakao_negative_cache_ttl_sec: int = Field(default=30 * 60, description="검색 결과 없음 캐시 TTL(초)")
+    kakao_cache_max_entries: int = Field(default=5000, description="메모리 캐시 최대 항목 수")
 
     # 키워드 비활성화처리
     django_api_endpoint_keyword_deactivate: str = Field(
@@ -34,6 +78,11 @@ class Settings(BaseSettings):
         description="키워드 비활성화 처리 API",
     )
 
+    django_api_endpoint_keyword_popularity_snapshot: str = Field(
+        default="/api/internal/keywords/popularity/snapshot/",
+        description="키워드 인기도 스냅샷 (Redis 카운터 → KeywordPopularity)",
+    )
+
     # Clova 콘텐츠 생성 처리 관련 Endpoints
     django_api_endpoint_article_detail: str = Field(
         default="/api/internal/posts/article-with-images/",
@@ -65,6 +114,50 @@ class Settings(BaseSettings):
         description="Clova 생성 결과 미리보기 (기존 결과 반환)",
     )
 
+    django_api_endpoint_clova_log_bulk: str = Field(
+        default="/api/internal/clova-log/bulk/",
+        description="Clova 로그 일괄 저장 (버퍼 flush)",
+    )
+
+    django_api_endpoint_generation_context: str = Field(
+        default="/api/internal/generation/context/",
+        description="Clova 생성 컨텍스트 조회 (기존 글 / 초안 / 기사 + 이미지 한 번에)",
+    )
+
+    django_api_endpoint_generation_commit: str = Field(
+        default="/api/internal/generation/commit/",
+        description="Clova 생성 결과 커밋 (글 저장 + 로그 한 트랜잭션)",
+    )
+
+    django_api_endpoint_generation_job_complete: str = Field(
+        default="/api/internal/generation-jobs/complete/",
+        description="Clova 생성 잡 완료 알림 (Django 가 WebSocket 으로 사용자에게 전달)",
+    )
+
+    django_api_endpoint_pregeneration_candidates: str = Field(
+        default="/api/internal/keywords/pregeneration-candidates/",
+        description="사전 생성 후보 키워드 조회",
+    )
+
+    django_api_endpoint_keyword_drafts: str = Field(
+        default="/api/internal/keyword-drafts/",
+        description="사전 생성 초안 저장",
+    )
+
+    # 인기 키워드 사전 생성 (스케줄러 이미지 단계 다음, 한가한 시간대에만)
+    pregeneration_enabled: bool = Field(default=False, description="사전 생성 단계 사용 여부")
+    pregeneration_top_n: int = Field(default=5, description="한 번 실행에서 초안을 만들 상위 키워드 수")
+    pregeneration_daily_budget: int = Field(default=30, description="하루 사전 생성 Clova 호출 한도")
+    pregeneration_offpeak_hours: List[int] = Field(
+        default=[1, 2, 3, 4, 5, 6], description="사전 생성을 실행할 시간대 (timezone 기준 시)"
+    )
+    pregeneration_window_hours: int = Field(default=24, description="최근 몇 시간 안에 수집된 키워드를 후보로 볼지")
+
+    # Clova 생성 잡 큐 / 워커 풀
+    generation_workers: int = Field(default=4, description="동시에 실행할 Clova 생성 잡 수 (워커 수)")
+    generation_queue_max: int = Field(default=200, description="대기 가능한 생성 잡 최대 수 (초과 시 503)")
+    generation_job_ttl_sec: int = Field(default=3600, description="완료된 생성 잡 상태 보관 시간(초)")
+
     # 사용자 로그인용 JWT 토큰 검증용 시크릿
     django_secret_key: str = Field(..., description="JWT 서명용 시크릿 키 (Django와 동일)")
     algorithm: str = Field(default="HS256", description="JWT 알고리즘")
@@ -76,6 +169,80 @@ class Settings(BaseSettings):
     naver_client_id: str = Field(..., description="네이버 클라이언트 아이디")
     naver_client_secret: str = Field(..., description="네이버 클라이언트 시크릿 키")
 
+    # 외부 API base URL (부하 테스트 시 scripts.fake_providers 주소로 교체)
+    naver_openapi_base_url: str = Field(default="https://openapi.naver.com", description="네이버 검색 Open API")
+    naver_search_base_url: str = Field(default="https://search.naver.com", description="네이버 통합검색 (키워드 수집)")
+    naver_blog_base_url: str = Field(default="https://blog.naver.com", description="네이버 블로그 원문 링크")
+    kakao_api_base_url: str = Field(default="https://dapi.kakao.com", description="Kakao 검색 API")
+    clova_chat_base_url: str = Field(
+        default="https://clovastudio.stream.ntruss.com", description="Clova Studio chat-completions API"
+    )
+
+    # 기사 추출 요약 (프롬프트 토큰 예산)
+    article_token_budget: int = Field(default=1200, description="프롬프트에 넣을 기사 본문 최대 토큰 수(근사치)")
+    condense_keyword_weight: float = Field(default=1.0, description="키워드와 겹치는 문장 가중치")
+    condense_position_weight: float = Field(default=0.5, description="앞쪽 문장 가중치 (0이면 위치 무시)")
+    condense_max_sentences: int = Field(
+        default=200, description="순위를 매길 최대 문장 수 (앞에서부터, TextRank 가 문장 수 제곱에 비례)"
+    )
+
+    # Clova 호출 디스패처 (동시 호출 / 속도 / 우선순위별 대기 기한)
+    clova_concurrency: int = Field(
+        default=4, description="동시에 진행할 Clova 호출 수 (sectioned 모드는 clova_section_count + 1 이상 필요)"
+    )
+    clova_qps: float = Field(default=2.0, description="Clova 초당 호출 수 (계정 한도 이하로 설정)")
+    clova_burst: float = Field(default=2.0, description="Clova 호출 버스트 허용량")
+    clova_queue_max: int = Field(default=50, description="Clova 호출 대기열 최대 길이 (초과 시 낮은 우선순위부터 거절)")
+    clova_queue_deadlines_sec: Dict[str, float] = Field(
+        default={"interactive": 20.0, "admin": 60.0, "background": 300.0},
+        description="우선순위별 최대 대기 시간(초) - 넘으면 503 + Retry-After",
+    )
+    clova_throttle_pause_sec: float = Field(default=10.0, description="Clova 429 응답 시 호출 일시 정지 시간(초)")
+
+    # Clova 생성 방식 ("single": 한 번에 생성 / "sectioned": 소제목 → 단락별 병렬 생성, 비스트리밍 생성만)
+    # sectioned 는 생성 1건이 단락 수만큼 슬롯을 동시에 씀 → clova_concurrency 를 단락 수 + 1 이상으로 (기동 시 검사)
+    clova_generation_mode: Literal["single", "sectioned"] = Field(default="single", description="Clova 생성 방식")
+    clova_section_count: int = Field(default=5, description="sectioned 모드 단락(소제목) 수")
+    clova_outline_max_tokens: int = Field(default=256, description="sectioned 모드 소제목 생성 maxTokens")
+    clova_section_max_tokens: int = Field(default=800, description="sectioned 모드 단락 1개 생성 maxTokens")
+
+    # Clova 생성 결과 검증 / 모자란 단락만 보충 (validator)
+    clova_min_chars: int = Field(default=2000, description="생성 본문 최소 글자 수 (공백 제외)")
+    clova_min_sections: int = Field(default=5, description="생성 본문 최소 단락(소제목) 수")
+    clova_min_section_chars: int = Field(default=300, description="단락 1개 본문 최소 글자 수 (공백 제외)")
+    clova_repair_enabled: bool = Field(default=True, description="검증에 걸리면 모자란 단락만 추가 생성")
+    clova_repair_max_calls: int = Field(default=3, description="보충에 쓸 추가 Clova 호출 수 상한")
+
+    # Clova 헤지 요청 (꼬리 지연 줄이기, 비스트리밍 생성만)
+    clova_hedge_enabled: bool = Field(default=False, description="Clova 헤지 요청 사용 여부")
+    clova_hedge_delay_ms: int = Field(default=0, description="헤지 전 대기 시간(ms), 0 이면 최근 지연 백분위 사용")
+    clova_hedge_percentile: float = Field(default=90.0, description="헤지 대기 시간으로 쓸 최근 호출 지연 백분위")
+    clova_hedge_budget_pct: float = Field(default=10.0, description="헤지로 추가되는 호출 수 상한 (일반 호출 대비 %)")
+    clova_hedge_min_samples: int = Field(
+        default=20, description="백분위 계산에 필요한 최소 표본 수 (미만이면 헤지 안 함)"
+    )
+    clova_hedge_window: int = Field(default=200, description="백분위 계산에 쓰는 최근 호출 수")
+
+    # Clova 로그 버퍼 (요청 경로 밖에서 clova-log/bulk/ 로 일괄 전송)
+    clova_log_flush_interval_sec: float = Field(default=5.0, description="Clova 로그 전송 주기(초)")
+    clova_log_batch_size: int = Field(default=200, description="한 번에 전송할 Clova 로그 수 (이만큼 쌓이면 바로 전송)")
+    clova_log_buffer_max: int = Field(
+        default=10000, description="메모리에 보관할 Clova 로그 최대 수 (넘치면 오래된 것부터 버림)"
+    )
+    clova_log_spill_path: str = Field(
+        default="cache/clova_log_spill.jsonl",
+        description="종료 시 전송하지 못한 Clova 로그 저장 파일 (재기동 시 다시 전송, 컨테이너에서는 볼륨 경로)",
+    )
+    clova_log_dead_letter_path: str = Field(
+        default="cache/clova_log_dead_letter.jsonl",
+        description="Django 가 4xx 로 거절한 Clova 로그 보관 파일 (재전송하지 않음)",
+    )
+
+    # 키워드 인기도 스냅샷 (Django 인기순 정렬이 읽는 KeywordPopularity 갱신 주기)
+    keyword_popularity_snapshot_interval_sec: float = Field(
+        default=300.0, description="키워드 인기도 스냅샷 주기(초), 0 이면 사용 안 함"
+    )
+
     # Clova 연동
     # Clova Studio API 키 (모든 API 호출에 사용됨)
     clova_api_key: str = Field(..., description="CLOVA Studio API 키")
@@ -110,6 +277,18 @@ class Settings(BaseSettings):
         description="이미지 프록시 요청을 위한 FastAPI 서버 주소 (도메인 또는 포트 포함)",
     )
 
+    # 이미지 프록시 디스크 캐시
+    image_proxy_cache_dir: str = Field(default="cache/proxy_image", description="이미지 프록시 캐시 디렉터리")
+    image_proxy_cache_max_mb: int = Field(default=1024, description="이미지 프록시 캐시 최대 용량(MB)")
+    image_proxy_max_object_mb: int = Field(default=10, description="캐시할 이미지 1개 최대 크기(MB)")
+    image_proxy_cache_max_age: int = Field(default=7 * 24 * 60 * 60, description="Cache-Control max-age(초)")
+    image_variant_widths: List[int] = Field(default=[360, 720, 1080], description="리사이즈 허용 폭 목록(px)")
+    image_variant_quality: int = Field(default=80, description="WebP/JPEG 변환 품질")
+    image_variant_workers: int = Field(default=2, description="이미지 변환 스레드 수")
+    image_max_pixels: int = Field(
+        default=40_000_000, description="디코딩할 이미지 최대 픽셀 수 (초과 시 변환/해시 없이 원본 사용)"
+    )
+
     timezone: str = Field(default="Asia/Seoul", description="애플리케이션 기본 타임존")
 
     model_config = SettingsConfigDict(
@@ -117,5 +296,22 @@ class Settings(BaseSettings):
         extra="allow",
     )
 
+    @model_validator(mode="after")
+    def _check_clova_slots(self) -> "Settings":
+        # 단락 생성이 슬롯을 모두 차지하면 단락이 나뉘어 순서대로 밀리고 그동안 다른 요청은 슬롯을 못 받음
+        if self.clova_generation_mode == "sectioned" and self.clova_concurrency <= self.clova_section_count:
+            raise ValueError(
+                f"clova_generation_mode=sectioned 는 clova_concurrency({self.clova_concurrency}) 가 "
+                f"clova_section_count({self.clova_section_count}) + 1 이상이어야 합니다"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def _default_media_base_url(self) -> "Settings":
+        # nginx 가 FastAPI 와 같은 호스트에서 /media/ 를 서빙하므로 별도 설정이 없으면 그 주소를 사용
+        if not self.media_base_url:
+            self.media_base_url = f"{self.fastapi_origin.rstrip('/')}/media"
+        return self
+
 
 settings = Settings()  # type: ignore
@@ -1,5 +1,5 @@
 import json
-from typing import Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urljoin
 
 from app.common.http_client import get_json, get_raw_json, patch_json, post_json
@@ -89,6 +89,12 @@ async def log_clova_failure_to_django(log_data: dict):
     return await post_json(url, log_data)
 
 
+# Clova 로그 일괄 저장 (log_buffer flush)
+async def send_clova_logs_bulk(logs: List[dict]):
+    url = join_url(settings.django_api_url, settings.django_api_endpoint_clova_log_bulk)
+    return await post_json(url, logs)
+
+
 # 키워드 비활성화 처리 (PATCH)
 async def deactivate_keyword(keyword_id: int):
     try:
@@ -103,10 +109,59 @@ async def deactivate_keyword(keyword_id: int):
 
 
 # 생성된 글 미리보기 요청 (존재 시 응답)
-async def fetch_generated_post_preview(keyword_id: int, user_id: int):
+# use_draft=True 면 사전 생성 초안이 있을 때 초안으로 글을 만들어 반환 (from_draft)
+async def fetch_generated_post_preview(keyword_id: int, user_id: int, use_draft: bool = False):
     url = join_url(
         settings.django_api_url,
         settings.django_api_endpoint_generated_post_preview,
     )
-    payload = {"keyword_id": keyword_id, "user_id": user_id}
+    payload = {"keyword_id": keyword_id, "user_id": user_id, "use_draft": use_draft}
+    return await post_json(url, payload)
+
+
+# 생성 컨텍스트 조회 (preview + 기사/이미지 조회를 한 번에)
+# - keyword_id + user_id: {"post": 기존 글 또는 초안으로 만든 글 | None, "article": 기사 | None}
+# - post_id (재생성): {"post": 대상 글, "article": 기사 | None}
+async def fetch_generation_context(
+    keyword_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    post_id: Optional[int] = None,
+    use_draft: bool = False,
+):
+    url = join_url(settings.django_api_url, settings.django_api_endpoint_generation_context)
+    payload: dict[str, Any] = {"use_draft": use_draft}
+    if post_id is not None:
+        payload["post_id"] = post_id
+    else:
+        payload.update({"keyword_id": keyword_id, "user_id": user_id})
     return await post_json(url, payload)
+
+
+# 생성 결과 커밋 (글 저장/덮어쓰기 + Clova 로그 + 실패 시 키워드 비활성화를 한 트랜잭션으로)
+async def commit_generation(data: dict):
+    url = join_url(settings.django_api_url, settings.django_api_endpoint_generation_commit)
+    return await post_json(url, data)
+
+
+# 생성 잡 완료 알림 (Django → 채널 레이어로 사용자에게 push)
+async def notify_generation_job_to_django(job: dict):
+    url = join_url(settings.django_api_url, settings.django_api_endpoint_generation_job_complete)
+    return await post_json(url, job)
+
+
+# 키워드 인기도 스냅샷 (Redis 클릭 카운터 → KeywordPopularity)
+async def snapshot_keyword_popularity():
+    url = join_url(settings.django_api_url, settings.django_api_endpoint_keyword_popularity_snapshot)
+    return await post_json(url, {})
+
+
+# 사전 생성 후보 키워드 조회 (클릭 속도 + 카테고리 관심도 순)
+async def fetch_pregeneration_candidates(limit: int, window_hours: int):
+    url = join_url(settings.django_api_url, settings.django_api_endpoint_pregeneration_candidates)
+    return await get_raw_json(f"{url}?limit={limit}&window_hours={window_hours}")
+
+
+# 사전 생성 초안 저장
+async def save_keyword_draft(draft: dict):
+    url = join_url(settings.django_api_url, settings.django_api_endpoint_keyword_drafts)
+    return await post_json(url, draft)
@@ -27,7 +27,7 @@ def fix_url_protocol(url: str) -> str:
 
 async def search_news(query: str, type: str = "news", display: int = 3):
     if type == "news":
-        url = "https://openapi.naver.com/v1/search/news.json"
+        url = f"{settings.naver_openapi_base_url}/v1/search/news.json"
         params = {
             "query": query,
             "display": display,
@@ -36,7 +36,7 @@ async def search_news(query: str, type: str = "news", display: int = 3):
         }
 
     elif type == "blog":
-        url = "https://openapi.naver.com/v1/search/blog.json"
+        url = f"{settings.naver_openapi_base_url}/v1/search/blog.json"
         params = {
             "query": query,
             "display": display,
@@ -88,7 +88,7 @@ async def search_news(query: str, type: str = "news", display: int = 3):
                     post_num = raw_link.rstrip("/").split("/")[-1]
                     try:
                         post_num = raw_link.rstrip("/").split("/")[-1]
-                        origin_link = f"https://blog.naver.com/{blogger_id}/{post_num}"
+                        origin_link = f"{settings.naver_blog_base_url}/{blogger_id}/{post_num}"
                     except Exception:
                         # post_num 추출 실패시 그냥 blogger_link만 사용
                         origin_link = fix_url_protocol(blogger_link)
@@ -0,0 +1,127 @@
+# app/features/internal/fetch_article/scraper/html_corpus.py
+"""
+기사/블로그 페이지 HAR 녹화·재생 (오프라인 추출 벤치마크용)
+
+- 녹화: recording(url) 블록 안에서 열리는 모든 브라우저 컨텍스트가 HAR로 저장됩니다.
+- 재생: replaying(url) 블록 안에서는 네트워크 대신 저장된 HAR로만 응답합니다.
+  (extract_news_content / extract_blog_content 코드는 그대로 사용)
+
+코퍼스 구조:
+    <corpus_dir>/manifest.json
+    <corpus_dir>/<domain>/<sha1(url)>.<n>.har   # n = 해당 URL 처리 중 열린 컨텍스트 순번
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import AsyncGenerator, List, Literal, Optional
+
+from playwright.async_api import BrowserContext
+
+from app.common.utils.url_utils import get_domain
+
+DEFAULT_CORPUS_DIR = os.getenv("HTML_CORPUS_DIR", "corpus/html")
+
+Kind = Literal["news", "blog"]
+HarMode = Literal["record", "replay"]
+
+
+@dataclass
+class CorpusEntry:
+    url: str
+    kind: Kind
+    keyword: str
+    domain: str = ""
+    contexts: int = 0  # 녹화된 HAR(컨텍스트) 개수
+
+    def __post_init__(self) -> None:
+        if not self.domain:
+            self.domain = get_domain(self.url)
+
+
+@dataclass
+class _HarSession:
+    mode: HarMode
+    base_path: Path
+    opened: int = 0
+    paths: List[Path] = field(default_factory=list)
+
+
+_session: ContextVar[Optional[_HarSession]] = ContextVar("html_corpus_session", default=None)
+
+
+def _base_path(corpus_dir: str | Path, url: str) -> Path:
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return Path(corpus_dir) / get_domain(url) / digest
+
+
+def load_manifest(corpus_dir: str | Path = DEFAULT_CORPUS_DIR) -> List[CorpusEntry]:
+    path = Path(corpus_dir) / "manifest.json"
+    if not path.exists():
+        return []
+    with path.open(encoding="utf-8") as f:
+        return [CorpusEntry(**item) for item in json.load(f)]
+
+
+def save_manifest(entries: List[CorpusEntry], corpus_dir: str | Path = DEFAULT_CORPUS_DIR) -> None:
+    path = Path(corpus_dir) / "manifest.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump([asdict(e) for e in entries], f, ensure_ascii=False, indent=2)
+
+
+@asynccontextmanager
+async def recording(url: str, corpus_dir: str | Path = DEFAULT_CORPUS_DIR) -> AsyncGenerator[_HarSession, None]:
+    """블록 안에서 열리는 컨텍스트를 <corpus>/<domain>/<sha1>.<n>.har 로 녹화합니다."""
+    session = _HarSession(mode="record", base_path=_base_path(corpus_dir, url))
+    session.base_path.parent.mkdir(parents=True, exist_ok=True)
+    token = _session.set(session)
+    try:
+        yield session
+    finally:
+        _session.reset(token)
+
+
+@asynccontextmanager
+async def replaying(url: str, corpus_dir: str | Path = DEFAULT_CORPUS_DIR) -> AsyncGenerator[_HarSession, None]:
+    """블록 안에서 열리는 컨텍스트가 녹화된 HAR로만 응답하도록 합니다 (미녹화 요청은 abort)."""
+    session = _HarSession(mode="replay", base_path=_base_path(corpus_dir, url))
+    token = _session.set(session)
+    try:
+        yield session
+    finally:
+        _session.reset(token)
+
+
+def context_kwargs(kwargs: dict) -> dict:
+    """녹화 중이면 new_context() 인자에 record_har_* 옵션을 추가합니다."""
+    session = _session.get()
+    if session is None or session.mode != "record":
+        return kwargs
+    har_path = session.base_path.with_suffix(f".{session.opened}.har")
+    session.paths.append(har_path)
+    return {**kwargs, "record_har_path": str(har_path), "record_har_content": "embed"}
+
+
+async def attach(ctx: BrowserContext) -> None:
+    """새 컨텍스트 생성 직후 호출. 재생 중이면 같은 순번의 HAR로 라우팅합니다."""
+    session = _session.get()
+    if session is None:
+        return
+    index = session.opened
+    session.opened += 1
+    if session.mode != "replay":
+        return
+
+    har_path = session.base_path.with_suffix(f".{index}.har")
+    # 녹화본이 없는 요청은 실제 네트워크로 나가지 않도록 모두 차단
+    await ctx.route("**/*", lambda route: route.abort())
+    if har_path.exists():
+        session.paths.append(har_path)
+        await ctx.route_from_har(str(har_path), not_found="fallback")
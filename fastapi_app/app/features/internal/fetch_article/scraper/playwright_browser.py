@@ -6,6 +6,8 @@ from typing import AsyncGenerator, Optional, Tuple
 
 from playwright.async_api import Browser, BrowserContext, Page, async_playwright
 
+from app.features.internal.fetch_article.scraper import html_corpus
+
 _pw = None
 _browser: Optional[Browser] = None
 
@@ -79,7 +81,8 @@ async def context(**kwargs) -> AsyncGenerator[BrowserContext, None]:
             ...
     """
     browser = await get_browser()
-    ctx: BrowserContext = await browser.new_context(**kwargs)
+    ctx: BrowserContext = await browser.new_context(**html_corpus.context_kwargs(kwargs))
+    await html_corpus.attach(ctx)  # HAR 녹화/재생 중일 때만 동작
     try:
         yield ctx
     finally:
@@ -99,7 +102,8 @@ async def new_context(**kwargs) -> AsyncGenerator[Tuple[BrowserContext, Page], N
             ...
     """
     browser = await get_browser()
-    ctx: BrowserContext = await browser.new_context(**kwargs)
+    ctx: BrowserContext = await browser.new_context(**html_corpus.context_kwargs(kwargs))
+    await html_corpus.attach(ctx)  # HAR 녹화/재생 중일 때만 동작
     page: Page = await ctx.new_page()
     try:
         yield ctx, page
@@ -1,4 +1,6 @@
 # app/features/internal/fetch_article/services.py
+import asyncio
+
 from app.common.constants.category import CATEGORY_META_MAP
 from app.common.logger import get_logger
 from app.features.internal.django_client import (
@@ -20,6 +22,9 @@ from app.features.internal.fetch_article.smart_blog_fetcher import (
 # 뉴스용
 from app.features.internal.fetch_article.smart_news_fetcher import fetch_smart_article
 
+# 프롬프트용 추출 요약 (수집 시 미리 계산해 함께 저장)
+from app.features.internal.generate_clova_post.condenser import condense
+
 logger = get_logger(__name__)
 
 
@@ -126,6 +131,7 @@ async def scrape_and_send_articles():
                 seen_urls.add(origin)
 
             logger.info(f"[SUCCESS] 수집 완료: keyword_id={keyword_id}, title={article.get('title')}")
+            article["condensed_content"] = await asyncio.to_thread(condense, article["content"], title)
             result = await send_articles_to_django([article])
             logger.info(f"[SEND] Django 저장 결과: {result}")
 
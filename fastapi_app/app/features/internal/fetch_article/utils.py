@@ -2,6 +2,8 @@ import logging
 from typing import Optional
 from urllib.parse import urlparse
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,7 +25,7 @@ def build_origin_link(item: dict) -> Optional[str]:
             logger.warning(f"[블로그 링크 조합 실패 - 아이디 또는 포스트ID 없음] item={item}")
             return None
 
-        return f"https://blog.naver.com/{blog_id}/{post_id}"
+        return f"{settings.naver_blog_base_url}/{blog_id}/{post_id}"
     except Exception as e:
         logger.warning(f"[블로그 링크 조합 실패] item={item}, error={e}")
         return None
@@ -0,0 +1,96 @@
+# fastapi_app/app/features/internal/fetch_image/image_store.py
+"""
+수집 이미지 로컬 저장소 (media 볼륨, 내용 주소 기반)
+
+    <media_root>/images/<sha256[:2]>/<sha256[2:4]>/<sha256>.<ext>          # 원본
+    <media_root>/images/<sha256[:2]>/<sha256[2:4]>/<sha256>.w<width>.webp  # 미리 만든 변환본
+
+- 같은 내용의 이미지는 URL이 달라도 파일 1개만 저장
+- nginx 가 /media/ 로 직접 서빙하므로 글 조회 시 FastAPI 를 거치지 않음
+- 반환값의 path 는 media_root 기준 상대 경로이며 Django Image.stored_path 에 저장됨
+- 변환본을 만든 폭 목록(variant_widths)도 함께 Django Image.variant_widths 에 기록
+  → 글 HTML 생성 시 파일 존재를 다시 확인하지 않고 srcset 구성
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from app.core.config import settings
+from app.features.internal.proxy_image.variants import render_variant
+
+from .image_validator import ProbeResult, image_format
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StoredImage:
+    path: str
+    variant_widths: List[int]
+
+
+def relative_path(digest: str, ext: str) -> str:
+    return f"images/{digest[:2]}/{digest[2:4]}/{digest}.{ext}"
+
+
+def variant_relative_path(stored_path: str, width: int) -> str:
+    stem = stored_path.rsplit(".", 1)[0]
+    return f"{stem}.w{width}.webp"
+
+
+def _write_atomic(target: Path, data: bytes) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=target.parent, delete=False) as tmp:
+        tmp.write(data)
+    os.replace(tmp.name, target)
+
+
+async def _prerender_variants(source: Path, stored_path: str) -> List[int]:
+    """변환본을 만들고 (이미 있으면 건너뜀) 변환본이 있는 폭 목록을 반환"""
+    root = Path(settings.media_root)
+    widths = []
+    for width in sorted(settings.image_variant_widths):
+        target = root / variant_relative_path(stored_path, width)
+        if not target.exists():
+            temp_path = await render_variant(source, source.parent, width, "webp")
+            if temp_path is None:
+                continue
+            os.replace(temp_path, target)
+        widths.append(width)
+    return widths
+
+
+async def store_image(data: bytes) -> Optional[StoredImage]:
+    """이미지 바이트를 저장하고 (media_root 기준 상대 경로, 변환본 폭 목록) 반환 (이미지가 아니거나 저장 실패 시 None)"""
+    ext = image_format(data[:16])
+    if ext is None:
+        return None
+
+    digest = hashlib.sha256(data).hexdigest()
+    stored_path = relative_path(digest, ext)
+    target = Path(settings.media_root) / stored_path
+    try:
+        if not target.exists():
+            await asyncio.to_thread(_write_atomic, target, data)
+        variant_widths = await _prerender_variants(target, stored_path)
+    except OSError as e:
+        logger.warning(f"[ImageStore] 저장 실패: {e} path={target}")
+        return None
+    return StoredImage(stored_path, variant_widths)
+
+
+async def store_probed(results: List[ProbeResult]) -> List[Optional[StoredImage]]:
+    """검증 통과 이미지 중 본문을 끝까지 받은 것만 저장 (나머지는 None → 프록시 경유)"""
+    if not settings.image_store_enabled:
+        return [None] * len(results)
+
+    async def _store(result: ProbeResult) -> Optional[StoredImage]:
+        return await store_image(result.body) if result.body else None
+
+    return list(await asyncio.gather(*(_store(r) for r in results)))
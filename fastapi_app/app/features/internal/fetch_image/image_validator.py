@@ -0,0 +1,246 @@
+# fastapi_app/app/features/internal/fetch_image/image_validator.py
+"""
+Kakao 이미지 후보 검증 (저장 전 단계)
+
+- 후보 URL을 동시에 요청해 상태 코드 / Content-Type / 크기(헤더 파싱)를 확인
+- 내부망/루프백 등 공인 IP 가 아닌 주소(리다이렉트 대상 포함)는 요청하지 않음
+- 본문을 끝까지 받은 경우 Pillow 로 dHash 를 계산해 거의 같은 이미지는 제거
+- 입력 순서(검색 순위)를 유지한 채 통과한 URL만 need 개까지 반환
+- 이미 확보한 이미지(kept)를 넘기면 그 뒤에 이어서 채움 (다음 검색어 결과로 보충할 때)
+"""
+
+import asyncio
+import io
+import logging
+import struct
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import httpx
+from PIL import Image
+
+from app.common import metrics
+from app.common.utils.url_utils import is_public_http_url
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+_MAX_REDIRECTS = 3
+
+# 일부 이미지 호스트는 브라우저가 아닌 요청을 막음
+_PROBE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Safari/537.36",
+    "Accept": "image/avif,image/webp,image/*,*/*;q=0.8",
+}
+
+
+@dataclass
+class ProbeResult:
+    url: str
+    width: Optional[int]
+    height: Optional[int]
+    dhash: Optional[int]
+    body: Optional[bytes] = None  # 끝까지 받은 경우에만 (이미지 저장소 적재용)
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=settings.image_probe_timeout_sec,
+            # 리다이렉트는 _open() 에서 주소를 확인하며 직접 따라감
+            follow_redirects=False,
+            headers=_PROBE_HEADERS,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=10),
+        )
+    return _client
+
+
+async def close_probe_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def image_size(head: bytes) -> Optional[Tuple[int, int]]:
+    """PNG / GIF / JPEG / WebP 헤더에서 (width, height) 추출 (판별 불가 시 None)"""
+    if head[:8] == b"\x89PNG\r\n\x1a\n" and len(head) >= 24:
+        return struct.unpack(">II", head[16:24])
+
+    if head[:6] in (b"GIF87a", b"GIF89a") and len(head) >= 10:
+        return struct.unpack("<HH", head[6:10])
+
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP" and len(head) >= 30:
+        chunk = head[12:16]
+        if chunk == b"VP8 ":
+            w, h = struct.unpack("<HH", head[26:30])
+            return w & 0x3FFF, h & 0x3FFF
+        if chunk == b"VP8L":
+            b = head[21:25]
+            w = 1 + (((b[1] & 0x3F) << 8) | b[0])
+            h = 1 + (((b[3] & 0x0F) << 10) | (b[2] << 2) | ((b[1] & 0xC0) >> 6))
+            return w, h
+        if chunk == b"VP8X":
+            w = 1 + int.from_bytes(head[24:27], "little")
+            h = 1 + int.from_bytes(head[27:30], "little")
+            return w, h
+        return None
+
+    if head[:2] == b"\xff\xd8":
+        i = 2
+        while i + 9 < len(head):
+            if head[i] != 0xFF:
+                i += 1
+                continue
+            marker = head[i + 1]
+            if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7 or marker == 0xFF:
+                i += 1 if marker == 0xFF else 2
+                continue
+            length = struct.unpack(">H", head[i + 2 : i + 4])[0]
+            # SOF0~SOF15 (DHT/JPG/DAC 제외)
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                h, w = struct.unpack(">HH", head[i + 5 : i + 9])
+                return w, h
+            i += 2 + length
+    return None
+
+
+def image_format(head: bytes) -> Optional[str]:
+    """매직 바이트로 확장자 판별 (jpg / png / gif / webp)"""
+    if head[:2] == b"\xff\xd8":
+        return "jpg"
+    if head[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+def _dhash(data: bytes) -> Optional[int]:
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            # 헤더만 읽은 상태에서 픽셀 수 확인 (압축 폭탄은 디코딩하지 않음)
+            if img.width * img.height > settings.image_max_pixels:
+                return None
+            img.draft("L", (64, 64))
+            small = img.convert("L").resize((9, 8))
+    except Exception:
+        return None
+    pixels = list(small.getdata())
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            value = (value << 1) | int(pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return value
+
+
+async def _open(url: str) -> Optional[httpx.Response]:
+    """공인 주소인지 확인하며 리다이렉트를 따라가 최종 응답(스트리밍)을 반환 (내부 주소로 향하면 None)"""
+    client = _get_client()
+    target = url
+    for _ in range(_MAX_REDIRECTS + 1):
+        if not await is_public_http_url(target):
+            metrics.incr("image_probe_rejected_address")
+            logger.info(f"[PROBE] 허용되지 않는 주소 target={target} url={url}")
+            return None
+        response = await client.send(client.build_request("GET", target), stream=True)
+        if response.next_request is None:
+            return response
+        await response.aclose()
+        target = str(response.next_request.url)
+    metrics.incr("image_probe_rejected_status")
+    logger.info(f"[PROBE] 리다이렉트 과다 url={url}")
+    return None
+
+
+async def probe(url: str) -> Optional[ProbeResult]:
+    """URL 앞부분(또는 전체)을 받아 이미지로 쓸 수 있는지 확인"""
+    try:
+        response = await _open(url)
+        if response is None:
+            return None
+        try:
+            if response.status_code != 200:
+                metrics.incr("image_probe_rejected_status")
+                logger.info(f"[PROBE] 상태 코드 불량 status={response.status_code} url={url}")
+                return None
+            if not response.headers.get("Content-Type", "").startswith("image/"):
+                metrics.incr("image_probe_rejected_type")
+                logger.info(f"[PROBE] 이미지 아님 type={response.headers.get('Content-Type')} url={url}")
+                return None
+
+            body = bytearray()
+            complete = True
+            async for chunk in response.aiter_bytes():
+                body.extend(chunk)
+                if len(body) > settings.image_probe_max_bytes:
+                    complete = False
+                    break
+        finally:
+            await response.aclose()
+    except Exception as e:
+        metrics.incr("image_probe_rejected_error")
+        logger.info(f"[PROBE] 요청 실패 {type(e).__name__}: {e} url={url}")
+        return None
+
+    size = image_size(bytes(body[:65536]))
+    if size is not None:
+        width, height = size
+        if width < settings.image_min_width or height < settings.image_min_height:
+            metrics.incr("image_probe_rejected_small")
+            logger.info(f"[PROBE] 너무 작음 {width}x{height} url={url}")
+            return None
+
+    metrics.incr("image_probe_ok")
+    data = bytes(body) if complete else None
+    dhash = await asyncio.to_thread(_dhash, data) if data is not None else None
+    return ProbeResult(
+        url=url,
+        width=size[0] if size else None,
+        height=size[1] if size else None,
+        dhash=dhash,
+        body=data,
+    )
+
+
+def _is_duplicate(dhash: Optional[int], kept: List[ProbeResult]) -> bool:
+    if dhash is None:
+        return False
+    return any(k.dhash is not None and bin(dhash ^ k.dhash).count("1") <= settings.image_dhash_distance for k in kept)
+
+
+async def validate_candidates(
+    urls: List[str], need: int = 3, kept: Optional[List[ProbeResult]] = None
+) -> List[ProbeResult]:
+    """후보를 동시에 검증하고 순서를 유지해 need 개까지 반환 (kept 가 있으면 그 뒤에 이어서 채움)"""
+    kept = list(kept or [])
+    seen = {k.url for k in kept}
+    semaphore = asyncio.Semaphore(settings.image_probe_concurrency)
+
+    async def guarded(url: str) -> Optional[ProbeResult]:
+        async with semaphore:
+            return await probe(url)
+
+    results = await asyncio.gather(*(guarded(u) for u in dict.fromkeys(urls) if u not in seen))
+
+    for result in results:
+        if len(kept) >= need:
+            break
+        if result is None:
+            continue
+        if _is_duplicate(result.dhash, kept):
+            metrics.incr("image_dedup_dropped")
+            logger.info(f"[PROBE] 중복 이미지 제거 url={result.url}")
+            continue
+        kept.append(result)
+
+    logger.info(f"[PROBE] 후보 {len(urls)}개 → 통과 {len(kept)}개")
+    return kept
+
+
+async def validate_images(urls: List[str], need: int = 3) -> List[str]:
+    return [k.url for k in await validate_candidates(urls, need)]
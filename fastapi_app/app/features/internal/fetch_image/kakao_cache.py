@@ -0,0 +1,108 @@
+# fastapi_app/app/features/internal/fetch_image/kakao_cache.py
+"""
+Kakao 이미지 검색 결과 캐시 ((query, sort, size) → 이미지 URL 리스트)
+
+- settings.redis_url 이 있으면 Redis, 없으면 프로세스 메모리(LRU) 사용 (docker-compose 는 REDIS_URL 지정)
+- 결과 없음([])도 짧은 TTL로 저장 (negative cache)
+- Redis 장애 시 캐시 미스로 취급하고 Kakao 호출은 그대로 진행
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "kakao:img:v1"
+
+
+def cache_key(query: str, sort: str, size: int) -> str:
+    normalized = " ".join(query.split())
+    digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+    return f"{KEY_PREFIX}:{sort}:{size}:{digest}"
+
+
+class MemoryBackend:
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[float, List[str]]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[List[str]]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            return None
+        self._data.move_to_end(key)
+        return list(value)
+
+    async def set(self, key: str, value: List[str], ttl: int) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    async def close(self) -> None:
+        self._data.clear()
+
+
+class RedisBackend:
+    def __init__(self, url: str) -> None:
+        self._redis = aioredis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[List[str]]:
+        try:
+            raw = await self._redis.get(key)
+        except Exception as e:
+            logger.warning(f"[KakaoCache] Redis GET 실패 → 캐시 미스 처리: {e}")
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: List[str], ttl: int) -> None:
+        try:
+            await self._redis.set(key, json.dumps(value), ex=ttl)
+        except Exception as e:
+            logger.warning(f"[KakaoCache] Redis SET 실패: {e}")
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+_backend = None
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        if settings.redis_url:
+            _backend = RedisBackend(settings.redis_url)
+            logger.info("[KakaoCache] Redis 백엔드 사용")
+        else:
+            logger.warning("[KakaoCache] REDIS_URL 미설정 → 프로세스 메모리 캐시 사용 (워커 간 공유 안 됨)")
+            _backend = MemoryBackend(settings.kakao_cache_max_entries)
+    return _backend
+
+
+async def get_cached(query: str, sort: str, size: int) -> Optional[List[str]]:
+    return await get_backend().get(cache_key(query, sort, size))
+
+
+async def set_cached(query: str, sort: str, size: int, urls: List[str]) -> None:
+    ttl = settings.kakao_cache_ttl_sec if urls else settings.kakao_negative_cache_ttl_sec
+    await get_backend().set(cache_key(query, sort, size), urls, ttl)
+
+
+async def close_cache() -> None:
+    global _backend
+    if _backend is not None:
+        await _backend.close()
+        _backend = None
@@ -1,24 +1,64 @@
 # fastapi_app/app/features/internal/fetch_image/kakao_client.py
 import logging
-from typing import List, Union
+from typing import List, Literal, Optional, Union
 
 import httpx
 
+from app.common import metrics
+from app.common.rate_limit import TokenBucket
 from app.core.config import settings
 
+from . import kakao_cache
+
 logger = logging.getLogger(__name__)
 
+# 모든 Kakao 이미지 검색 호출이 공유하는 호출 속도 제한
+kakao_bucket = TokenBucket(rate=settings.kakao_qps, capacity=settings.kakao_burst)
+
+# 재사용 클라이언트 (keep-alive 커넥션 풀, 서버 종료 시 close_kakao_client)
+_client: Optional[httpx.AsyncClient] = None
+
 
 # 추가: 쿼터 초과를 상위에서 구분 처리하기 위한 전용 예외
 class KakaoThrottled(RuntimeError):
     pass
 
 
-async def fetch_kakao_images(query: str, count: int = 3) -> List[str]:
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _client
+
+
+async def close_kakao_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    await kakao_cache.close_cache()
+
+
+async def fetch_kakao_images(
+    query: str,
+    count: int = 3,
+    sort: Literal["accuracy", "recency"] = "accuracy",
+) -> List[str]:
     """
     Kakao 이미지 검색 API를 사용하여 이미지 URL 리스트를 반환합니다.
+    같은 (query, sort, count) 결과는 kakao_cache 에서 먼저 찾습니다.
     """
-    endpoint = "https://dapi.kakao.com/v2/search/image"
+    cached = await kakao_cache.get_cached(query, sort, count)
+    if cached is not None:
+        metrics.incr("kakao_cache_hit")
+        logger.info(f"[KakaoAPI] cache hit query='{query}' → {len(cached)}개")
+        return cached
+    metrics.incr("kakao_cache_miss")
+
+    endpoint = f"{settings.kakao_api_base_url}/v2/search/image"
     headers = {
         "Authorization": f"KakaoAK {settings.kakao_rest_api_key}",
     }
@@ -26,32 +66,36 @@ async def fetch_kakao_images(query: str, count: int = 3) -> List[str]:
     # 타입 명시로 mypy 오류 방지
     params: dict[str, Union[str, int]] = {
         "query": query,
-        "sort": "accuracy",  # 또는 "recency"
+        "sort": sort,
         "page": 1,
         "size": count,
     }
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(endpoint, headers=headers, params=params)
-        status = response.status_code
+    await kakao_bucket.acquire()
+    metrics.incr("kakao_api_calls")
+    response = await _get_client().get(endpoint, headers=headers, params=params)
+    status = response.status_code
 
-        # 쿼터 초과(429) 또는 본문의 RequestThrottled 식별 → 전용 예외로 올림
-        if status != 200:
-            body_text = response.text
-            try:
-                body_json = response.json()
-            except Exception:
-                body_json = {}
+    # 쿼터 초과(429) 또는 본문의 RequestThrottled 식별 → 전용 예외로 올림
+    if status != 200:
+        body_text = response.text
+        try:
+            body_json = response.json()
+        except Exception:
+            body_json = {}
 
-            if status == 429 or body_json.get("errorType") == "RequestThrottled":
-                logger.warning(f"[KakaoAPI] THROTTLED query='{query}' status={status} body={body_json or body_text}")
-                raise KakaoThrottled("Kakao API limit exceeded")
+        if status == 429 or body_json.get("errorType") == "RequestThrottled":
+            metrics.incr("kakao_api_throttled")
+            logger.warning(f"[KakaoAPI] THROTTLED query='{query}' status={status} body={body_json or body_text}")
+            raise KakaoThrottled("Kakao API limit exceeded")
 
-            logger.error(f"[KakaoAPI] 오류 발생: {body_text}")
-            raise RuntimeError("Kakao 이미지 API 호출 중 오류가 발생했습니다.")
+        metrics.incr("kakao_api_errors")
+        logger.error(f"[KakaoAPI] 오류 발생: {body_text}")
+        raise RuntimeError("Kakao 이미지 API 호출 중 오류가 발생했습니다.")
 
-        logger.info(f"[KakaoAPI] query='{query}' status_code={status}")
+    logger.info(f"[KakaoAPI] query='{query}' status_code={status}")
 
-        data = response.json()
-        images = [item["image_url"] for item in data.get("documents", [])[:count]]
-        return images
+    data = response.json()
+    images = [item["image_url"] for item in data.get("documents", [])[:count]]
+    await kakao_cache.set_cached(query, sort, count, images)
+    return images
@@ -1,120 +1,152 @@
 # fastapi_app/app/features/internal/fetch_image/service.py
+import asyncio
 import logging
+from typing import Optional
 
-from fastapi import HTTPException
-
-from app.common.http_client import get_raw_json, patch_json, post_json
+from app.common.http_client import post_json
 from app.common.utils.url_utils import join_url
 from app.core.config import settings
 
+from .image_store import store_probed
+
 # ✅ KakaoThrottled import
-from .kakao_client import KakaoThrottled
-from .smart_image_fetcher import fetch_images_smart_with_threshold
+from .kakao_client import KakaoThrottled, kakao_bucket
+from .smart_image_fetcher import (
+    fetch_images_smart_with_threshold,
+    fetch_validated_images,
+)
 
 logger = logging.getLogger(__name__)
 
 
+class _ThrottleBudget:
+    """한 번의 실행에서 Kakao 쿼터 초과 시 일시 정지/재개 횟수를 관리"""
+
+    def __init__(self, max_pauses: int) -> None:
+        self.max_pauses = max_pauses
+        self.pauses = 0
+        self.exhausted = False
+
+    def on_throttled(self) -> bool:
+        """일시 정지 후 재시도 가능하면 True, 허용 횟수를 넘기면 False"""
+        # 동시에 여러 작업이 429를 받아도 이미 정지 중이면 한 번으로 취급
+        if not kakao_bucket.paused:
+            self.pauses += 1
+            if self.pauses > self.max_pauses:
+                self.exhausted = True
+                return False
+            logger.warning(
+                f"[THROTTLED] Kakao 쿼터 초과 → {settings.kakao_throttle_pause_sec}초 일시 정지 "
+                f"({self.pauses}/{self.max_pauses})"
+            )
+            kakao_bucket.pause(settings.kakao_throttle_pause_sec)
+        return not self.exhausted
+
+
+async def _lease_targets(limit: int) -> list[dict]:
+    # 선점된 키워드는 저장 전까지 다른 작업자에게 배정되지 않음 (만료 시 재배정)
+    targets = await post_json(
+        join_url(settings.django_api_url, settings.django_api_endpoint_image_targets) + f"?limit={limit}",
+        data=None,
+    )
+    return [t for t in targets or [] if "id" in t and "title" in t]
+
+
+async def _collect_one(target: dict, budget: _ThrottleBudget) -> Optional[dict]:
+    """
+    키워드 1건의 이미지 수집
+    - 성공/이미지 없음/기타 오류 → {"images": [...], "stored_paths": [...], "variant_widths": [...]} 반환
+      (오류는 빈 리스트 → 수집 완료 처리)
+    - 쿼터 초과 허용 횟수 초과 → None (이번 실행에서 수집 완료 처리하지 않음)
+    """
+    keyword_id, title = target["id"], target["title"]
+    while not budget.exhausted:
+        try:
+            if settings.image_validation_enabled:
+                # 검증에서 걸러질 것을 고려해 여유 있게 받은 뒤 살아있는 이미지만 3개 선택 (모자라면 다음 검색어로 보충)
+                kept = await fetch_validated_images(title, need=3, fetch_size=settings.image_overfetch_count)
+                image_urls = [k.url for k in kept]
+                # 검증 중 받은 본문을 media 저장소에 적재 (nginx 직접 서빙)
+                stored = await store_probed(kept)
+            else:
+                image_urls = (await fetch_images_smart_with_threshold(title))[:3]
+                stored = [None] * len(image_urls)
+            stored_paths = [s.path if s else None for s in stored]
+            logger.info(f"[FETCH] keyword_id={keyword_id}, image_urls={image_urls}, stored={stored_paths}")
+            if not image_urls:
+                logger.warning(f"[SKIP] keyword_id={keyword_id} - 이미지 없음, 수집 완료 처리")
+            return {
+                "images": image_urls,
+                "stored_paths": stored_paths,
+                "variant_widths": [s.variant_widths if s else [] for s in stored],
+            }
+        except KakaoThrottled as e:
+            # ✅ 쿼터 초과 → 버킷 일시 정지 후 같은 키워드 재시도
+            if not budget.on_throttled():
+                logger.warning(f"[THROTTLED] 정지 허용 횟수 초과. keyword_id={keyword_id}, detail={e}")
+                return None
+        except Exception as e:
+            # 기타 Kakao 오류 → collected 처리 후 다음 키워드로
+            logger.error(f"[ERROR] keyword_id={keyword_id} 이미지 수집 실패: {e}", exc_info=True)
+            return {"images": [], "stored_paths": [], "variant_widths": []}
+    return None
+
+
+async def _save_batch(collected: dict[int, dict]) -> None:
+    # 이미지 저장 + 수집 완료 표시를 한 번의 요청으로 처리
+    await post_json(
+        join_url(settings.django_api_url, settings.django_api_endpoint_save_images_bulk),
+        data={"items": [{"keyword_id": kid, **item} for kid, item in collected.items()]},
+    )
+    logger.info(f"[POST] 이미지 일괄 저장 성공: keywords={len(collected)}")
+
+
 async def fetch_and_save_images() -> list[str]:
+    """
+    이미지 수집 대상 키워드를 배치 단위로 조회해 Kakao 이미지를 동시에 수집하고 일괄 저장합니다.
+
+    - 동시 처리 수: settings.image_fetch_concurrency
+    - Kakao 호출 속도: kakao_client.kakao_bucket (settings.kakao_qps)
+    - Kakao 쿼터 초과: 일시 정지 후 재개, settings.kakao_throttle_max_pauses 초과 시 이번 실행 종료
+    """
     results: list[str] = []
+    budget = _ThrottleBudget(settings.kakao_throttle_max_pauses)
+    semaphore = asyncio.Semaphore(settings.image_fetch_concurrency)
+
+    async def guarded(target: dict) -> Optional[dict]:
+        async with semaphore:
+            return await _collect_one(target, budget)
 
-    while True:
+    while not budget.exhausted:
         try:
-            # 1. 수집 대상 keyword 조회
-            keyword_data = await get_raw_json(
-                join_url(
-                    settings.django_api_url,
-                    settings.django_api_endpoint_keyword_image_target,
-                )
-            )
+            # 1. 수집 대상 keyword 배치 조회
+            targets = await _lease_targets(settings.image_target_batch_size)
+        except RuntimeError as e:
+            logger.error(f"[ERROR] 이미지 수집 대상 조회 실패: {e}", exc_info=True)
+            break
 
-            if not keyword_data or "id" not in keyword_data or "title" not in keyword_data:
-                logger.info("더 이상 수집할 이미지 대상이 없습니다. 종료합니다.")
-                break
+        if not targets:
+            logger.info("더 이상 수집할 이미지 대상이 없습니다. 종료합니다.")
+            break
+        logger.info(f"[FETCH] 이미지 수집 대상 {len(targets)}건")
 
-            keyword_id = keyword_data["id"]
-            title = keyword_data["title"]
-            logger.info(f"[FETCH] keyword_id={keyword_id}, title='{title}'")
+        # 2. Kakao 이미지 동시 수집
+        fetched = await asyncio.gather(*(guarded(t) for t in targets))
+        collected = {t["id"]: item for t, item in zip(targets, fetched) if item is not None}
 
-            # 2. Kakao 이미지 수집
+        # 3. 일괄 저장 (쿼터 초과로 처리하지 못한 키워드는 다음 실행에서 다시 조회됨)
+        if collected:
             try:
-                image_urls = await fetch_images_smart_with_threshold(title)
-                image_urls = image_urls[:3]
-                logger.info(f"[FETCH] keyword_id={keyword_id}, image_urls={image_urls}")
-            except KakaoThrottled as e:
-                # ✅ 쿼터 초과 → 이번 런 즉시 중단 (다음 스케줄/다음날에 재시도)
-                logger.warning(f"[THROTTLED] Kakao limit exceeded. run stop. keyword_id={keyword_id}, detail={e}")
-                break
+                await _save_batch(collected)
             except Exception as e:
-                # 기타 Kakao 오류 → collected 처리 후 다음 키워드로
-                logger.error(
-                    f"[ERROR] keyword_id={keyword_id} 이미지 수집 실패: {e}",
-                    exc_info=True,
-                )
-                await patch_json(
-                    join_url(
-                        settings.django_api_url,
-                        settings.django_api_endpoint_mark_collected.replace("{id}", str(keyword_id)),
-                    ),
-                    data={},
-                )
-                continue
-
-            # 3. 이미지 없음 처리
-            if not image_urls:
-                logger.warning(f"[SKIP] keyword_id={keyword_id} - 이미지 없음, 수집 완료 처리")
-                await patch_json(
-                    join_url(
-                        settings.django_api_url,
-                        settings.django_api_endpoint_mark_collected.replace("{id}", str(keyword_id)),
-                    ),
-                    data={},
-                )
-                continue
-
-            # 4. Django 이미지 저장 요청
-            await post_json(
-                join_url(settings.django_api_url, settings.django_api_endpoint_save_images),
-                data={"keyword_id": keyword_id, "images": image_urls},
-            )
-            logger.info(f"[POST] keyword_id={keyword_id} - 이미지 저장 성공")
-
-            # 5. 수집 완료 표시
-            await patch_json(
-                join_url(
-                    settings.django_api_url,
-                    settings.django_api_endpoint_mark_collected.replace("{id}", str(keyword_id)),
-                ),
-                data={},
-            )
-            logger.info(f"[PATCH] keyword_id={keyword_id} - 수집 완료 표시 성공")
-
-            results.extend(image_urls)
-
-        except RuntimeError as e:
-            if "status=404" in str(e):
-                logger.info("[SKIP] 수집 대상 키워드 없음 (404)")
+                logger.error(f"[ERROR] 이미지 일괄 저장 실패: {e}", exc_info=True)
                 break
-            logger.error(f"[ERROR] RuntimeError: {e}", exc_info=True)
-            if "keyword_id" in locals():
-                await patch_json(
-                    join_url(
-                        settings.django_api_url,
-                        settings.django_api_endpoint_mark_collected.replace("{id}", str(keyword_id)),
-                    ),
-                    data={},
-                )
-            continue
+            for item in collected.values():
+                results.extend(item["images"])
 
-        except Exception as e:
-            logger.error(f"[FATAL] 이미지 수집 중 예외 발생: {e}", exc_info=True)
-            if "keyword_id" in locals():
-                await patch_json(
-                    join_url(
-                        settings.django_api_url,
-                        settings.django_api_endpoint_mark_collected.replace("{id}", str(keyword_id)),
-                    ),
-                    data={},
-                )
-            continue
+        if len(collected) < len(targets):
+            break
 
+    if budget.exhausted:
+        logger.warning("[THROTTLED] Kakao limit exceeded. run stop.")
     return results
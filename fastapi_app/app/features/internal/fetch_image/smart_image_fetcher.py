@@ -1,9 +1,11 @@
 # fastapi_app/app/features/internal/fetch_image/smart_image_fetcher.py
+import asyncio
 import logging
-from typing import List
+from typing import Dict, List, Optional
 
 from app.common.logger import get_logger
 from app.common.utils.text import extract_first_word
+from app.core.config import settings
 
 # ✅ KakaoThrottled 함께 import
 from app.features.internal.fetch_image.kakao_client import (
@@ -11,6 +13,8 @@ from app.features.internal.fetch_image.kakao_client import (
     fetch_kakao_images,
 )
 
+from .image_validator import ProbeResult, validate_candidates
+
 try:
     from konlpy.tag import Okt
 
@@ -20,68 +24,87 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# ✅ 추가: 키워드당 Kakao 호출 상한(과도한 시도 방지)
+MAX_ATTEMPTS = 4
 
-async def fetch_images_smart_with_threshold(title: str, count: int = 3) -> List[str]:
-    logger.info(f"[TITLE] {title}")
-
-    # ✅ 추가: 키워드당 Kakao 호출 상한(과도한 시도 방지)
-    MAX_ATTEMPTS = 4
-    attempts = 0
-
-    async def try_fetch(q: str) -> List[str]:
-        nonlocal attempts
-        if attempts >= MAX_ATTEMPTS:
-            return []
-        attempts += 1
-        return await fetch_kakao_images(q, count)
 
-    # 1) 원문
-    image_urls = await try_fetch(title)
-    logger.info(f"[TRY] 원문 그대로: {title} → {len(image_urls)}개 (attempts={attempts})")
-    if len(image_urls) >= count:
-        logger.info(f"[SELECTED] 원문으로 {count}개 확보 성공")
-        return image_urls
-
-    # 2) 형태소 분석 불가 시 중단
+def _fallback_phrases(title: str) -> List[str]:
+    """원문 검색이 부족할 때 시도할 검색어 (구체적인 것부터: 첫단어+2-gram → 첫단어+명사)"""
+    # 형태소 분석 불가 시 중단
     if not okt:
         logger.warning("[NLP] 형태소 분석기 미지원 → fallback 불가")
-        return image_urls
+        return []
 
-    # 3) 첫 단어 추출
+    # 첫 단어 추출
     first_word = extract_first_word(title)
     logger.info(f"[FIRST WORD] 추출 결과: {first_word}")
 
-    # 4) 명사 분석
+    # 명사 분석
     nouns = okt.nouns(title)
     if not nouns:
         logger.warning("[NLP] 명사 추출 결과 없음 → fallback 중단")
-        return image_urls
+        return []
     logger.info(f"[NLP] 명사 추출 결과: {nouns}")
 
-    # 5) 중복 제거
+    # 중복 제거
     filtered_nouns = [noun for noun in nouns if noun not in first_word and not first_word.startswith(noun)]
     logger.info(f"[NLP] 중복 제거 후 명사: {filtered_nouns}")
 
-    # 6) 첫 단어 + 2-gram 조합 시도
-    for i in range(len(filtered_nouns) - 1):
-        if attempts >= MAX_ATTEMPTS:
-            break
-        phrase = f"{first_word} {filtered_nouns[i]} {filtered_nouns[i+1]}"
-        fallback = await try_fetch(phrase)
-        logger.info(f"[TRY] 첫단어 + 2-gram: '{phrase}' → {len(fallback)}개 (attempts={attempts})")
-        if len(fallback) >= count:
-            logger.info(f"[SELECTED] '{phrase}' 로 {count}개 확보 성공")
-            return fallback
-        if len(fallback) > len(image_urls):
-            image_urls = fallback
+    phrases = [f"{first_word} {filtered_nouns[i]} {filtered_nouns[i+1]}" for i in range(len(filtered_nouns) - 1)]
+    phrases += [f"{first_word} {noun}" for noun in filtered_nouns]
+    return phrases
 
-    # 7) 첫 단어 + 단일 명사 조합 시도
-    for noun in filtered_nouns:
-        if attempts >= MAX_ATTEMPTS:
+
+async def fetch_images_smart_with_threshold(title: str, count: int = 3, fetch_size: Optional[int] = None) -> List[str]:
+    """
+    count: 이 개수 이상 확보되면 성공으로 보고 추가 검색어를 시도하지 않음
+    fetch_size: 검색어별로 Kakao 에 요청할 결과 수 (검증 단계에서 걸러질 것을 고려한 여유분, 기본 count)
+    """
+    logger.info(f"[TITLE] {title}")
+    size = max(count, fetch_size or count)
+    if settings.kakao_image_fetch_mode == "parallel":
+        return await _fetch_parallel(title, count, size)
+    return await _fetch_serial(title, count, size)
+
+
+async def fetch_validated_images(title: str, need: int = 3, fetch_size: Optional[int] = None) -> List[ProbeResult]:
+    """
+    검색 결과를 검증해 need 개 확보, 통과한 이미지가 모자라면 다음 검색어 결과로 보충
+    (이미 조회한 검색어는 kakao_cache 에 있어 다시 호출해도 Kakao 요청이 늘지 않음)
+    """
+    size = max(need, fetch_size or need)
+    candidates = await fetch_images_smart_with_threshold(title, count=need, fetch_size=size)
+    kept = await validate_candidates(candidates, need=need)
+    tried = set(candidates)
+
+    for phrase in _fallback_phrases(title)[: MAX_ATTEMPTS - 1]:
+        if len(kept) >= need:
             break
-        phrase = f"{first_word} {noun}"
-        fallback = await try_fetch(phrase)
-        logger.info(f"[TRY] 첫단어 + 명사: '{phrase}' → {len(fallback)}개 (attempts={attempts})")
+        extra = [url for url in await fetch_kakao_images(phrase, size) if url not in tried]
+        if not extra:
+            continue
+        tried.update(extra)
+        kept = await validate_candidates(extra, need=need, kept=kept)
+        logger.info(f"[TOP-UP] '{phrase}' 후보 {len(extra)}개로 보충 → {len(kept)}/{need}개")
+    return kept
+
+
+async def _fetch_serial(title: str, count: int, size: int) -> List[str]:
+    """검색어를 하나씩 시도하고 가장 많이 찾은 결과 하나를 사용 (기존 방식)"""
+    attempts = 1
+
+    # 1) 원문
+    image_urls = await fetch_kakao_images(title, size)
+    logger.info(f"[TRY] 원문 그대로: {title} → {len(image_urls)}개 (attempts={attempts})")
+    if len(image_urls) >= count:
+        logger.info(f"[SELECTED] 원문으로 {count}개 확보 성공")
+        return image_urls
+
+    # 2) 첫단어 + 2-gram → 첫단어 + 명사 조합 시도
+    for phrase in _fallback_phrases(title)[: MAX_ATTEMPTS - 1]:
+        attempts += 1
+        fallback = await fetch_kakao_images(phrase, size)
+        logger.info(f"[TRY] fallback: '{phrase}' → {len(fallback)}개 (attempts={attempts})")
         if len(fallback) >= count:
             logger.info(f"[SELECTED] '{phrase}' 로 {count}개 확보 성공")
             return fallback
@@ -90,3 +113,60 @@ async def fetch_images_smart_with_threshold(title: str, count: int = 3) -> List[
 
     logger.info(f"[SELECTED] 최종 이미지 {len(image_urls)}개 확보 완료 (attempts={attempts})")
     return image_urls
+
+
+def _merge_ranked(phrases: List[str], done: Dict[str, List[str]], count: int, limit: int) -> tuple[List[str], bool]:
+    """
+    구체적인 검색어 순서대로 결과를 합쳐 중복 없이 limit개까지 채움
+    - 앞 순위 검색어가 아직 응답 전이면 거기서 멈춤 (순위가 뒤바뀌지 않도록)
+    - 반환: (병합 결과, 확정 여부 = count개 이상 확보 또는 모든 응답 수신)
+    """
+    merged: List[str] = []
+    for phrase in phrases:
+        if phrase not in done:
+            return merged, len(merged) >= count
+        for url in done[phrase]:
+            if url not in merged:
+                merged.append(url)
+            if len(merged) >= limit:
+                return merged, True
+    return merged, True
+
+
+async def _fetch_parallel(title: str, count: int, size: int) -> List[str]:
+    """예산 내 검색어를 동시에 조회하고 순위대로 병합, count개가 확정되면 나머지는 취소"""
+    phrases = list(dict.fromkeys([title, *_fallback_phrases(title)]))[:MAX_ATTEMPTS]
+    tasks = {asyncio.create_task(fetch_kakao_images(p, size)): p for p in phrases}
+    done: Dict[str, List[str]] = {}
+    errors: List[Exception] = []
+
+    try:
+        pending = set(tasks)
+        while pending:
+            finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                phrase = tasks[task]
+                try:
+                    done[phrase] = task.result()
+                except KakaoThrottled:
+                    raise
+                except Exception as e:
+                    logger.warning(f"[TRY] '{phrase}' 조회 실패: {e}")
+                    errors.append(e)
+                    done[phrase] = []
+                logger.info(f"[TRY] parallel: '{phrase}' → {len(done[phrase])}개")
+
+            merged, settled = _merge_ranked(phrases, done, count, size)
+            if settled:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        # 취소/실패한 작업의 예외를 회수 ("Task exception was never retrieved" 방지)
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    if errors and len(errors) == len(phrases):
+        raise errors[0]
+
+    logger.info(f"[SELECTED] 병합 결과 {len(merged)}개 (phrases={len(phrases)}, responded={len(done)})")
+    return merged
@@ -1,118 +1,401 @@
+import asyncio
+import json
 import re
 import time
+from typing import AsyncIterator, Optional
 from urllib.parse import quote
 from uuid import uuid4
 
 import httpx
 
+from app.common import metrics
 from app.common.logger import get_logger
 from app.core.config import settings
-from app.features.internal.generate_clova_post.prompt_builder import build_prompt
+from app.features.internal.fetch_image.image_store import variant_relative_path
+from app.features.internal.generate_clova_post import validator
+from app.features.internal.generate_clova_post.prompt_builder import (
+    build_extra_outline_prompt,
+    build_outline_prompt,
+    build_prompt,
+    build_section_prompt,
+)
+
+from .dispatcher import ClovaOverloaded, Priority, clova_dispatcher
+from .hedging import clova_hedge
 
 logger = get_logger(__name__)
 
+_SUBTITLE = re.compile(r"\*\*(.+?)\*\*")
+
+
+def _image_sources(image_url: str, stored_path: Optional[str], variant_widths: Optional[list]) -> tuple[str, str]:
+    """(src, srcset) 반환 - media 저장본이 있으면 nginx 직접 서빙, 없으면 이미지 프록시"""
+    if stored_path:
+        base = settings.media_base_url.rstrip("/")
+        # 수집 시 미리 만들어 기록해 둔 변환본 폭만 srcset 에 포함
+        return f"{base}/{stored_path}", ", ".join(
+            f"{base}/{variant_relative_path(stored_path, w)} {w}w" for w in sorted(variant_widths or [])
+        )
 
-def convert_to_html_paragraphs(text: str, image_urls: list[str]) -> str:
+    widths = sorted(settings.image_variant_widths)
+    proxy_url = f"{settings.fastapi_origin}/api/v1/internal/proxy-image?url={quote(image_url, safe='')}"
+    # 화면 폭에 맞는 WebP 변환본을 고르도록 srcset 제공 (src 는 원본 fallback)
+    return proxy_url, ", ".join(f"{proxy_url}&amp;w={w}&amp;fmt=webp {w}w" for w in widths)
+
+
+class ParagraphHtmlBuilder:
     """
-    Clova 응답을 HTML로 변환
+    Clova 응답을 단락 단위로 HTML 변환 (스트리밍 응답에도 사용)
     - '**소제목**' 형식을 <h3>로 인식
     - 그 아래 문장은 <p>
     - 각 단락마다 이미지 삽입 (최대 3개)
+    - 다음 소제목이 시작되면 이전 단락이 완성된 것으로 보고 바로 반환
     """
-    paragraphs = []
-    lines = text.strip().split("\n")
-    current_subtitle = None
-    current_body = []
-    image_idx = 0
 
-    for line in lines:
+    def __init__(
+        self, image_urls: list[str], stored_paths: Optional[list] = None, variant_widths: Optional[list] = None
+    ) -> None:
+        self.image_urls = image_urls
+        self.stored_paths = stored_paths or []
+        self.variant_widths = variant_widths or []
+        self.parts: list[str] = []  # 지금까지 완성된 단락 HTML
+        self._pending = ""  # 아직 줄바꿈이 오지 않은 마지막 줄
+        self._subtitle: Optional[str] = None
+        self._body: list[str] = []
+        self._image_idx = 0
+
+    def feed(self, chunk: str) -> list[str]:
+        """텍스트 조각을 받아 이번에 완성된 단락 HTML 목록을 반환"""
+        self._pending += chunk
+        *lines, self._pending = self._pending.split("\n")
+        completed = []
+        for line in lines:
+            completed.extend(self._line(line))
+        return completed
+
+    def close(self) -> list[str]:
+        """남은 텍스트를 마무리하고 마지막 단락을 반환"""
+        completed = self._line(self._pending)
+        self._pending = ""
+        if self._subtitle and self._body:
+            completed.append(self._render(self._subtitle, " ".join(self._body)))
+            self._body = []
+        return completed
+
+    def _line(self, line: str) -> list[str]:
         line = line.strip()
         if not line:
-            continue
-
-        subtitle_match = re.match(r"\*\*(.+?)\*\*", line)
-        if subtitle_match:
-            if current_subtitle and current_body:
-                paragraphs.append((current_subtitle, " ".join(current_body)))
-                current_body = []
-            current_subtitle = subtitle_match.group(1)
-        else:
-            current_body.append(line)
+            return []
 
-    if current_subtitle and current_body:
-        paragraphs.append((current_subtitle, " ".join(current_body)))
+        subtitle_match = _SUBTITLE.match(line)
+        if not subtitle_match:
+            self._body.append(line)
+            return []
 
-    html_parts = []
-    for idx, (subtitle, body) in enumerate(paragraphs):
+        completed = []
+        if self._subtitle and self._body:
+            completed.append(self._render(self._subtitle, " ".join(self._body)))
+            self._body = []
+        self._subtitle = subtitle_match.group(1)
+        return completed
+
+    def _render(self, subtitle: str, body: str) -> str:
         img_html = ""
-        if image_idx < len(image_urls):
+        image_idx = self._image_idx
+        if image_idx < len(self.image_urls):
+            stored_path = self.stored_paths[image_idx] if image_idx < len(self.stored_paths) else None
+            widths = self.variant_widths[image_idx] if image_idx < len(self.variant_widths) else None
+            src, srcset = _image_sources(self.image_urls[image_idx], stored_path, widths)
+            srcset_attr = f' srcset="{srcset}" sizes="(max-width: 720px) 100vw, 720px"' if srcset else ""
+            lazy = ' loading="lazy"' if image_idx else ""  # 첫 이미지 외에는 지연 로딩
+            img_html = (
+                f'<img src="{src}"{srcset_attr} '
+                f'alt="대표 이미지 {image_idx + 1}"{lazy} style="max-width:100%; margin: 1rem 0;" />'
+            )
+            self._image_idx += 1
+        html = f"<h3>{subtitle}</h3>\n{img_html}\n<p>{body}</p>"
+        self.parts.append(html)
+        return html
+
+
+def convert_to_html_paragraphs(
+    text: str, image_urls: list[str], stored_paths: Optional[list] = None, variant_widths: Optional[list] = None
+) -> str:
+    """
+    Clova 응답 전체를 HTML로 변환
+    - stored_paths: 이미지별 media 저장 경로 (없으면 프록시 URL 사용)
+    - variant_widths: 이미지별 미리 만든 변환본 폭 목록 (저장본 srcset 용)
+    """
+    builder = ParagraphHtmlBuilder(image_urls, stored_paths, variant_widths)
+    builder.feed(text.strip())
+    builder.close()
+    return "\n".join(builder.parts)
+
+
+def _clova_request(prompt: str, request_id: str, stream: bool, max_tokens: int = 3000) -> tuple[str, dict, dict]:
+    """chat-completions 요청 (url, headers, body) - stream=True 면 SSE 응답 요청"""
+    headers = {
+        "Authorization": f"Bearer {settings.clova_api_key}",
+        "X-NCP-CLOVASTUDIO-REQUEST-ID": request_id,
+        "Content-Type": "application/json; charset=utf-8",
+        "Accept": "text/event-stream" if stream else "application/json",
+    }
+
+    request_body = {
+        "messages": [
+            {"role": "system", "content": settings.clova_system_prompt},
+            {"role": "user", "content": prompt},
+        ],
+        "topP": 0.8,
+        "topK": 0,
+        "temperature": 0.7,
+        "maxTokens": max_tokens,
+        "repeatPenalty": 5.0,
+        "stopBefore": [],
+    }
+
+    url = f"{settings.clova_chat_base_url}/v3/tasks/{settings.clova_tuned_model_id}/chat-completions"
+    return url, headers, request_body
+
+
+def _usage(result: dict) -> tuple[Optional[int], Optional[int]]:
+    """(프롬프트 토큰, 생성 토큰) - v3 usage 가 없으면 inputLength / outputLength 사용"""
+    usage = result.get("usage") or {}
+    return (
+        usage.get("promptTokens", result.get("inputLength")),
+        usage.get("completionTokens", result.get("outputLength")),
+    )
+
+
+async def _complete(prompt: str, priority: Priority, max_tokens: int = 3000) -> dict:
+    """
+    비스트리밍 호출 1회 → {"text", "prompt_tokens", "completion_tokens", "queue_wait_ms"}
+    - clova_dispatcher 슬롯을 받아 호출 (대기열 초과 / 429 → ClovaOverloaded)
+    - clova_hedge_enabled 면 느린 요청에 헤지 요청을 한 번 더 보내 먼저 끝난 응답 사용
+    """
+
+    async def attempt(started: asyncio.Event) -> tuple[httpx.Response, int]:
+        # 헤지 요청도 별도 request id 로 디스패처 슬롯을 따로 받음
+        url, headers, request_body = _clova_request(prompt, uuid4().hex, stream=False, max_tokens=max_tokens)
+        async with clova_dispatcher.slot(priority) as wait_ms:
+            started.set()
+            async with httpx.AsyncClient(timeout=60.0) as client:
+                response = await client.post(url, headers=headers, json=request_body)
+            if response.status_code == 429:
+                raise clova_dispatcher.throttled()
+            response.raise_for_status()
+        return response, wait_ms
+
+    response, queue_wait_ms = await clova_hedge.run(attempt)
+    result = response.json()["result"]
+    text = result["message"]["content"]
+    if not text.strip():
+        raise ValueError("Clova 응답이 비어 있습니다.")
+    prompt_tokens, completion_tokens = _usage(result)
+    return {
+        "text": text.strip(),
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "queue_wait_ms": queue_wait_ms,
+    }
+
 
-            proxy_url = (
-                f"{settings.fastapi_origin}/api/v1/internal/proxy-image?url={quote(image_urls[image_idx], safe='')}"
+async def _generate_sections(title: str, article_content: str, priority: Priority) -> dict:
+    """
+    단락별 병렬 생성 (clova_generation_mode="sectioned")
+    1. 짧은 호출로 소제목 목록 생성
+    2. 소제목마다 본문을 동시에 생성 (각 호출이 디스패처 슬롯을 따로 받으므로 동시 호출 한도를 함께 씀)
+    3. '**소제목**\n본문' 형식으로 순서대로 이어 붙여 _complete 와 같은 형태로 반환
+    소제목을 2개 미만으로 받으면 한 번에 생성하는 방식으로 대신함
+    """
+    outline_result = await _complete(
+        build_outline_prompt(title, article_content, settings.clova_section_count),
+        priority,
+        max_tokens=settings.clova_outline_max_tokens,
+    )
+    outline = [t for t in _subtitles(outline_result["text"]) if t][: settings.clova_section_count]
+    if len(outline) < 2:
+        logger.warning(f"[Clova] 소제목 {len(outline)}개 → 한 번에 생성으로 대체 - keyword: {title}")
+        return await _complete(build_prompt(title, article_content), priority)
+
+    tasks = [
+        asyncio.create_task(
+            _complete(
+                build_section_prompt(title, article_content, outline, i),
+                priority,
+                max_tokens=settings.clova_section_max_tokens,
             )
-            img_html = (
-                f'<img src="{proxy_url}" alt="대표 이미지 {image_idx + 1}" style="max-width:100%; margin: 1rem 0;" />'
+        )
+        for i in range(len(outline))
+    ]
+    try:
+        sections = await asyncio.gather(*tasks)
+    finally:
+        # 한 단락이라도 실패하면 나머지 호출은 취소 (슬롯 반납)
+        for task in tasks:
+            task.cancel()
+
+    paragraphs = [f"**{subtitle}**\n{_section_body(section['text'])}" for subtitle, section in zip(outline, sections)]
+
+    results = [outline_result, *sections]
+    return {
+        "text": "\n\n".join(paragraphs),
+        "prompt_tokens": sum(r["prompt_tokens"] or 0 for r in results),
+        "completion_tokens": sum(r["completion_tokens"] or 0 for r in results),
+        # 소제목 호출 대기 + 가장 오래 기다린 단락 (전체 지연에 더해진 대기 시간)
+        "queue_wait_ms": (outline_result["queue_wait_ms"] or 0) + max(r["queue_wait_ms"] or 0 for r in sections),
+    }
+
+
+def _subtitles(text: str) -> list[str]:
+    return [match.group(1).strip() for line in text.splitlines() if (match := _SUBTITLE.match(line.strip()))]
+
+
+def _section_body(text: str) -> str:
+    # 단락 본문에 소제목을 다시 쓰거나 줄을 나눈 경우 본문 문장만 한 줄로
+    return " ".join(line.strip() for line in text.splitlines() if line.strip() and not _SUBTITLE.match(line.strip()))
+
+
+def _repair_plan(report: validator.ValidationReport, budget: int) -> tuple[list[int], int]:
+    """(다시 쓸 단락 번호, 새로 만들 단락 수) - 추가 호출 수(다시 쓰기 + 추가 소제목 1회 + 새 단락)가 budget 이내"""
+    sections = report.sections
+    # 다시 쓸 단락: 짧은 단락 + (전체 길이가 모자라면) 모자란 만큼 짧은 순으로
+    rewrite = list(report.short_sections)
+    if report.issues["length"]:
+        deficit = settings.clova_min_chars - report.total_chars
+        needed = -(-deficit // max(1, settings.clova_min_section_chars))
+        by_length = sorted(range(len(sections)), key=lambda i: sections[i].chars)
+        rewrite += [i for i in by_length if i not in rewrite][: max(0, needed - len(rewrite))]
+    # 단락 수 보충은 추가 소제목 1회 + 새 단락 수만큼 호출 (예산이 2회 이상 남아야 함)
+    missing = min(report.missing_sections, budget - 1) if budget >= 2 else 0
+    rewrite = rewrite[: max(0, budget - (missing + 1 if missing else 0))]
+    return rewrite, missing
+
+
+async def _repair(title: str, article_content: str, completion: dict, priority: Priority) -> dict:
+    """
+    검증에 걸린 생성 결과를 고쳐 같은 형태로 반환 (전체 재생성 대신 모자란 단락만 추가 호출)
+    - 형식: 소제목 없는 단락에 키워드 소제목을 붙임 (호출 없음)
+    - 짧은 단락 / 전체 길이 부족: 짧은 단락부터 단락 본문을 다시 생성해 더 길면 교체
+    - 단락 수 부족: 추가 소제목 1회 호출 후 새 단락 생성
+    - 추가 호출은 clova_repair_max_calls 이내, 추가 호출이 실패하면 원래 결과를 그대로 사용
+    """
+    report = validator.validate(completion["text"])
+    if report.ok:
+        return completion
+
+    sections = validator.normalize(report.sections, title)
+    rewrite, missing = _repair_plan(report, settings.clova_repair_max_calls)
+
+    # normalize 후에는 모든 단락에 소제목이 있음
+    outline: list[str] = [s.subtitle or title for s in sections]
+    results: list[dict] = []
+    try:
+        # 1) 짧은 단락 다시 쓰기 + (필요하면) 추가 소제목을 동시에
+        calls = [
+            _complete(
+                build_section_prompt(title, article_content, outline, i),
+                priority,
+                max_tokens=settings.clova_section_max_tokens,
+            )
+            for i in rewrite
+        ]
+        if missing:
+            calls.append(
+                _complete(
+                    build_extra_outline_prompt(title, article_content, outline, missing),
+                    priority,
+                    max_tokens=settings.clova_outline_max_tokens,
+                )
             )
-            image_idx += 1
-        html_parts.append(f"<h3>{subtitle}</h3>\n{img_html}\n<p>{body}</p>")
+        results = list(await asyncio.gather(*calls))
+        for i, result in zip(rewrite, results):
+            body = _section_body(result["text"])
+            if validator.count_chars(body) > sections[i].chars:
+                sections[i].body = body
+
+        # 2) 새 단락 생성 (남은 예산 안에서)
+        if missing:
+            extra = [t for t in _subtitles(results[-1]["text"]) if t and t not in outline][:missing]
+            outline += extra
+            new_results = await asyncio.gather(
+                *(
+                    _complete(
+                        build_section_prompt(title, article_content, outline, len(sections) + j),
+                        priority,
+                        max_tokens=settings.clova_section_max_tokens,
+                    )
+                    for j in range(len(extra))
+                )
+            )
+            results += new_results
+            for subtitle, result in zip(extra, new_results):
+                sections.append(validator.Section(subtitle, _section_body(result["text"])))
+    except ClovaOverloaded:
+        raise
+    except Exception as e:
+        logger.warning(f"[Clova] 단락 보충 실패 → 원래 결과 사용 - keyword: {title}, {e}")
+        metrics.incr("clova_repair_error")
+        results = []
 
-    return "\n".join(html_parts)
+    metrics.incr("clova_repair_calls", len(results))
+    text = validator.render(sections)
+    after = validator.validate(text, record=False)
+    metrics.incr("clova_repair_fixed" if after.ok else "clova_repair_still_invalid")
+    logger.info(
+        f"[Clova] 단락 보충 - keyword: {title}, calls={len(results)}, "
+        f"chars {report.total_chars}→{after.total_chars}, sections {len(report.sections)}→{len(after.sections)}"
+    )
+    return {
+        "text": text,
+        "prompt_tokens": (completion["prompt_tokens"] or 0) + sum(r["prompt_tokens"] or 0 for r in results),
+        "completion_tokens": (completion["completion_tokens"] or 0) + sum(r["completion_tokens"] or 0 for r in results),
+        "queue_wait_ms": completion["queue_wait_ms"],
+    }
 
 
-async def generate_clova_post(title: str, article_content: str, image_urls: list[str]) -> dict:
+async def generate_clova_post(
+    title: str,
+    article_content: str,
+    image_urls: list[str],
+    stored_paths: Optional[list] = None,
+    priority: Priority = Priority.INTERACTIVE,
+    variant_widths: Optional[list] = None,
+) -> dict:
     """
     Clova Studio 튜닝 모델을 호출하여 블로그 콘텐츠 생성
     - 응답 첫 줄: 제목
     - 나머지: 본문 (HTML 단락 구성 포함)
     - <h1> 제목 + <h3>/<img>/<p> 조합으로 콘텐츠 완성
+    - settings.clova_generation_mode: "single"(한 번에 생성) / "sectioned"(소제목 → 단락별 병렬 생성)
+    - 결과가 짧거나 형식이 틀리면 모자란 단락만 추가 생성 (settings.clova_repair_enabled)
+    - 호출은 clova_dispatcher 를 거침 (대기열 초과 / 429 → ClovaOverloaded 를 그대로 올림)
     """
     start_time = time.time()
-    request_id = uuid4().hex
 
     try:
-        logger.info(f"[Clova] 콘텐츠 생성 시작 - keyword: {title}")
+        logger.info(f"[Clova] 콘텐츠 생성 시작 - keyword: {title} mode={settings.clova_generation_mode}")
 
         # (1) Kakao 이미지 URL은 그대로 사용 (clean_image_url 제거)
         image_urls = [url.strip().strip('"') for url in image_urls]
 
-        # (2) 프롬프트 생성
-        prompt = build_prompt(title, article_content)
-
-        headers = {
-            "Authorization": f"Bearer {settings.clova_api_key}",
-            "X-NCP-CLOVASTUDIO-REQUEST-ID": request_id,
-            "Content-Type": "application/json; charset=utf-8",
-            "Accept": "application/json",
-        }
-
-        request_body = {
-            "messages": [
-                {"role": "system", "content": settings.clova_system_prompt},
-                {"role": "user", "content": prompt},
-            ],
-            "topP": 0.8,
-            "topK": 0,
-            "temperature": 0.7,
-            "maxTokens": 3000,
-            "repeatPenalty": 5.0,
-            "stopBefore": [],
-        }
-
-        url = f"https://clovastudio.stream.ntruss.com/v3/tasks/{settings.clova_tuned_model_id}/chat-completions"
-
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, headers=headers, json=request_body)
-            response.raise_for_status()
+        # (2) 생성
+        if settings.clova_generation_mode == "sectioned":
+            completion = await _generate_sections(title, article_content, priority)
+        else:
+            completion = await _complete(build_prompt(title, article_content), priority)
 
-        result_text = response.json()["result"]["message"]["content"]
-        if not result_text.strip():
-            raise ValueError("Clova 응답이 비어 있습니다.")
+        # (2-1) 길이 / 단락 수 / 형식 검증 → 모자란 단락만 추가 생성
+        if settings.clova_repair_enabled:
+            completion = await _repair(title, article_content, completion, priority)
+        else:
+            validator.validate(completion["text"])
 
         generated_title = title
-        body_text = result_text.strip()
+        body_text = completion["text"]
 
         # (3) HTML 변환 (이미지 포함)
-        html_body = convert_to_html_paragraphs(body_text, image_urls)
+        html_body = convert_to_html_paragraphs(body_text, image_urls, stored_paths, variant_widths)
         final_html = f"<h1>{generated_title}</h1>\n{html_body}"
 
         elapsed_ms = int((time.time() - start_time) * 1000)
@@ -122,11 +405,140 @@ async def generate_clova_post(title: str, article_content: str, image_urls: list
             "title": generated_title,
             "content": final_html,
             "response_time_ms": elapsed_ms,
+            "prompt_tokens": completion["prompt_tokens"],
+            "completion_tokens": completion["completion_tokens"],
+            "queue_wait_ms": completion["queue_wait_ms"],
         }
 
+    except ClovaOverloaded:
+        raise
+
     except Exception as e:
         logger.error(f"[Clova] 생성 실패 - {e}", exc_info=True)
         return {
             "status": "fail",
             "error_message": str(e),
+            "response_time_ms": int((time.time() - start_time) * 1000),
+        }
+
+
+async def _iter_clova_tokens(response: httpx.Response, final: Optional[dict] = None) -> AsyncIterator[str]:
+    """Clova SSE 응답에서 token 이벤트의 텍스트 조각만 순서대로 반환 (마지막 result 이벤트는 final 에 담음)"""
+    event = None
+    async for line in response.aiter_lines():
+        if line.startswith("event:"):
+            event = line[len("event:") :].strip()
+        elif line.startswith("data:"):
+            data = line[len("data:") :].strip()
+            if event == "token":
+                yield json.loads(data)["message"]["content"]
+            elif event == "result" and final is not None:
+                final.update(json.loads(data))
+            elif event == "error":
+                status = json.loads(data).get("status", {})
+                raise RuntimeError(f"Clova 스트림 오류: {status.get('code')} {status.get('message')}")
+        elif not line:
+            event = None
+
+
+async def stream_clova_post(
+    title: str,
+    article_content: str,
+    image_urls: list[str],
+    stored_paths: Optional[list] = None,
+    priority: Priority = Priority.INTERACTIVE,
+    variant_widths: Optional[list] = None,
+) -> AsyncIterator[dict]:
+    """
+    Clova SSE 스트림으로 콘텐츠 생성
+    - 단락이 완성될 때마다 {"event": "paragraph", "index", "html"} 반환
+    - 마지막에 generate_clova_post 와 같은 결과를 {"event": "done", ...} 로 반환
+    - 실패 시 {"event": "error", "status": "fail", "error_message"} 반환
+    - 대기열 초과 / 429 는 {"event": "error", "status": "overloaded", "error_message", "retry_after"}
+    - 스트림이 끝나면 generate_clova_post 와 같은 검증/보충을 거침: 이미 보낸 단락은 바꿀 수 없으므로
+      보충 결과는 done 의 content (저장본) 에만 반영되고, 보충 호출이 실패하면 스트림 결과를 그대로 저장
+    """
+    start_time = time.time()
+    request_id = uuid4().hex
+    first_paragraph_ms = None
+    queue_wait_ms = None
+
+    try:
+        logger.info(f"[Clova] 스트리밍 생성 시작 - keyword: {title}")
+        image_urls = [url.strip().strip('"') for url in image_urls]
+        builder = ParagraphHtmlBuilder(image_urls, stored_paths, variant_widths)
+        url, headers, request_body = _clova_request(build_prompt(title, article_content), request_id, stream=True)
+
+        received = []
+        final: dict = {}
+        sent = 0
+        async with clova_dispatcher.slot(priority) as queue_wait_ms:
+            async with httpx.AsyncClient(timeout=60.0) as client:
+                async with client.stream("POST", url, headers=headers, json=request_body) as response:
+                    if response.status_code == 429:
+                        raise clova_dispatcher.throttled()
+                    if response.status_code != 200:
+                        await response.aread()
+                        response.raise_for_status()
+
+                    async for token in _iter_clova_tokens(response, final):
+                        received.append(token)
+                        for html in builder.feed(token):
+                            if first_paragraph_ms is None:
+                                first_paragraph_ms = int((time.time() - start_time) * 1000)
+                            yield {"event": "paragraph", "index": sent, "html": html}
+                            sent += 1
+
+        if not "".join(received).strip():
+            raise ValueError("Clova 응답이 비어 있습니다.")
+        for html in builder.close():
+            yield {"event": "paragraph", "index": sent, "html": html}
+            sent += 1
+
+        prompt_tokens, completion_tokens = _usage(final)
+        completion: dict = {
+            "text": "".join(received),
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "queue_wait_ms": queue_wait_ms,
+        }
+        html_body = "\n".join(builder.parts)
+        if settings.clova_repair_enabled:
+            try:
+                repaired = await _repair(title, article_content, completion, priority)
+            except ClovaOverloaded:
+                # 이미 단락을 보낸 뒤라 실패로 돌리지 않고 스트림 결과를 저장
+                metrics.incr("clova_repair_error")
+                repaired = completion
+            if repaired["text"] != completion["text"]:
+                html_body = convert_to_html_paragraphs(repaired["text"], image_urls, stored_paths, variant_widths)
+                completion = repaired
+        else:
+            validator.validate(completion["text"])
+
+        elapsed_ms = int((time.time() - start_time) * 1000)
+        logger.info(f"[Clova] 스트리밍 완료 - first_paragraph_ms={first_paragraph_ms}, total_ms={elapsed_ms}")
+        yield {
+            "event": "done",
+            "status": "success",
+            "title": title,
+            "content": f"<h1>{title}</h1>\n{html_body}",
+            "response_time_ms": elapsed_ms,
+            "first_paragraph_ms": first_paragraph_ms,
+            "prompt_tokens": completion["prompt_tokens"],
+            "completion_tokens": completion["completion_tokens"],
+            "queue_wait_ms": queue_wait_ms,
+        }
+
+    except ClovaOverloaded as e:
+        yield {"event": "error", "status": "overloaded", "error_message": str(e), "retry_after": e.retry_after}
+
+    except Exception as e:
+        logger.error(f"[Clova] 스트리밍 생성 실패 - {e}", exc_info=True)
+        yield {
+            "event": "error",
+            "status": "fail",
+            "error_message": str(e),
+            "response_time_ms": int((time.time() - start_time) * 1000),
+            "queue_wait_ms": queue_wait_ms,
         }
@@ -0,0 +1,188 @@
+# app/features/internal/generate/dispatcher.py
+"""
+Clova 호출 디스패처 (프로세스 내 모든 Clova 호출이 공유)
+
+- 동시 호출 수: settings.clova_concurrency
+- 호출 속도: settings.clova_qps / clova_burst (TokenBucket, 429 응답 시 clova_throttle_pause_sec 동안 정지)
+- 우선순위: INTERACTIVE(사용자 생성) > ADMIN(관리자 재생성) > BACKGROUND(사전 생성 등)
+- 대기 기한: settings.clova_queue_deadlines_sec[우선순위] 안에 슬롯을 못 받으면 ClovaOverloaded(retry_after)
+- 대기열이 clova_queue_max 를 넘으면 가장 낮은 우선순위의 마지막 대기자부터 밀어냄
+
+지표 (GET /api/v1/admin/metrics):
+    gauges       clova_queue_depth, clova_queue_depth_<priority>, clova_in_flight
+    observations clova_queue_wait_ms, clova_queue_wait_ms_<priority>, clova_call_ms
+    counters     clova_shed_<priority>, clova_throttled
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import AsyncIterator, List, Optional
+
+from app.common import metrics
+from app.common.logger import get_logger
+from app.common.rate_limit import TokenBucket
+from app.core.config import settings
+
+logger = get_logger(__name__)
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    ADMIN = 1
+    BACKGROUND = 2
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+class ClovaOverloaded(RuntimeError):
+    """Clova 대기열 초과 / 대기 기한 초과 / 429 - 키워드 실패로 기록하지 않고 retry_after 후 재시도"""
+
+    def __init__(self, message: str, retry_after: int) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    future: asyncio.Future = field(compare=False)
+
+
+class ClovaDispatcher:
+    def __init__(self, concurrency: int, qps: float, burst: float, max_queue: int) -> None:
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.bucket = TokenBucket(rate=qps, capacity=burst)
+        self._heap: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._in_flight = 0
+        # 호출 1건 평균 소요 시간 (retry_after 추정용, 지수 이동 평균)
+        self._service_sec = 10.0
+
+    # ---------- 상태 ----------
+    def _pending(self) -> List[_Waiter]:
+        return [w for w in self._heap if not w.future.done()]
+
+    def _update_gauges(self) -> None:
+        pending = self._pending()
+        metrics.gauge("clova_queue_depth", len(pending))
+        for p in Priority:
+            metrics.gauge(f"clova_queue_depth_{p.label}", sum(1 for w in pending if w.priority == p))
+        metrics.gauge("clova_in_flight", self._in_flight)
+
+    def idle_slots(self) -> int:
+        """지금 바로 쓸 수 있는 슬롯 수 (대기자가 있으면 0)"""
+        return 0 if self._pending() else max(0, self.concurrency - self._in_flight)
+
+    def retry_after(self) -> int:
+        """지금 대기열이 빠지는 데 걸릴 예상 시간(초)"""
+        backlog = len(self._pending()) + 1
+        return max(1, min(120, math.ceil(backlog / self.concurrency * self._service_sec)))
+
+    def _overloaded(self, priority: Priority, reason: str) -> ClovaOverloaded:
+        metrics.incr(f"clova_shed_{priority.label}")
+        retry_after = self.retry_after()
+        logger.warning(
+            f"[ClovaDispatcher] 요청 거절 priority={priority.label} reason={reason} retry_after={retry_after}s"
+        )
+        return ClovaOverloaded(f"Clova 요청이 많아 처리하지 못했습니다 ({reason})", retry_after)
+
+    # ---------- 슬롯 ----------
+    def _evict_lowest(self, priority: Priority) -> bool:
+        """대기열이 가득 찼을 때 더 낮은 우선순위 대기자 1명을 밀어냄"""
+        pending = self._pending()
+        victim = max(pending, key=lambda w: (w.priority, w.seq), default=None)
+        if victim is None or victim.priority <= priority:
+            return False
+        victim.future.set_exception(self._overloaded(Priority(victim.priority), "preempted"))
+        return True
+
+    async def _acquire(self, priority: Priority, timeout: float) -> None:
+        if self._in_flight < self.concurrency and not self._pending():
+            self._in_flight += 1
+            return
+
+        if len(self._pending()) >= self.max_queue and not self._evict_lowest(priority):
+            raise self._overloaded(priority, "queue full")
+
+        waiter = _Waiter(priority, next(self._seq), asyncio.get_running_loop().create_future())
+        heapq.heappush(self._heap, waiter)
+        self._update_gauges()
+        try:
+            await asyncio.wait({waiter.future}, timeout=timeout)
+        except asyncio.CancelledError:
+            # 요청 취소 시 이미 슬롯을 넘겨받았다면 반납
+            if waiter.future.done() and not waiter.future.cancelled() and waiter.future.exception() is None:
+                self._release()
+            waiter.future.cancel()
+            raise
+        finally:
+            self._update_gauges()
+
+        if not waiter.future.done():
+            waiter.future.cancel()
+            raise self._overloaded(priority, "deadline")
+        waiter.future.result()  # 밀려난 경우 ClovaOverloaded
+
+    def _release(self) -> None:
+        # 슬롯을 다음 대기자(우선순위 → 도착 순)에게 그대로 넘김
+        while self._heap:
+            waiter = heapq.heappop(self._heap)
+            if not waiter.future.done():
+                waiter.future.set_result(None)
+                self._update_gauges()
+                return
+        self._in_flight -= 1
+        self._update_gauges()
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority, deadline_sec: Optional[float] = None) -> AsyncIterator[int]:
+        """동시 호출 슬롯 + QPS 토큰을 받은 뒤 블록 실행, 대기 시간(ms)을 넘겨줌 (기한 내 못 받으면 ClovaOverloaded)"""
+        if deadline_sec is None:
+            deadline_sec = settings.clova_queue_deadlines_sec.get(priority.label, 60.0)
+        started = time.monotonic()
+        await self._acquire(priority, deadline_sec)
+
+        try:
+            remaining = deadline_sec - (time.monotonic() - started)
+            try:
+                await asyncio.wait_for(self.bucket.acquire(), timeout=max(remaining, 0.001))
+            except asyncio.TimeoutError:
+                raise self._overloaded(priority, "rate limit")
+
+            wait_ms = (time.monotonic() - started) * 1000
+            metrics.observe("clova_queue_wait_ms", wait_ms)
+            metrics.observe(f"clova_queue_wait_ms_{priority.label}", wait_ms)
+
+            call_started = time.monotonic()
+            yield int(wait_ms)
+            elapsed = time.monotonic() - call_started
+            metrics.observe("clova_call_ms", elapsed * 1000)
+            self._service_sec = 0.8 * self._service_sec + 0.2 * elapsed
+        finally:
+            self._release()
+
+    def throttled(self) -> ClovaOverloaded:
+        """Clova 429 응답 → 버킷 일시 정지 후 재시도 안내"""
+        metrics.incr("clova_throttled")
+        self.bucket.pause(settings.clova_throttle_pause_sec)
+        return ClovaOverloaded(
+            "Clova 호출 한도 초과 (429)", max(self.retry_after(), math.ceil(settings.clova_throttle_pause_sec))
+        )
+
+
+clova_dispatcher = ClovaDispatcher(
+    concurrency=settings.clova_concurrency,
+    qps=settings.clova_qps,
+    burst=settings.clova_burst,
+    max_queue=settings.clova_queue_max,
+)
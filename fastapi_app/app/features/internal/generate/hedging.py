@@ -0,0 +1,115 @@
+# app/features/internal/generate/hedging.py
+"""
+Clova 헤지 요청 (꼬리 지연 줄이기, settings.clova_hedge_enabled 로 켬)
+
+- 첫 요청이 슬롯을 받은 뒤 hedge 지연(기본: 최근 호출 지연의 clova_hedge_percentile 백분위,
+  clova_hedge_delay_ms 를 주면 고정값) 안에 끝나지 않으면 같은 요청을 한 번 더 보냄
+- 먼저 성공한 응답을 쓰고 나머지는 취소 (한쪽이 실패하면 다른 쪽을 기다림)
+- 예산: 헤지 호출 수 ≤ 일반 호출 수 × clova_hedge_budget_pct% (일반 호출마다 크레딧 적립, 헤지 1회에 1 소모)
+- 디스패처에 빈 슬롯이 있을 때만 헤지 (대기열이 있으면 다른 요청 몫을 빼앗지 않음)
+- 스트리밍 생성은 대상 아님 (이미 단락을 보내기 시작한 뒤라 바꿔 탈 수 없음)
+
+지표: counters clova_hedge_issued / clova_hedge_won / clova_hedge_skipped_budget / clova_hedge_skipped_busy,
+      gauge clova_hedge_delay_ms
+"""
+
+import asyncio
+import math
+from collections import deque
+from typing import Any, Callable, Coroutine, Deque, Optional, TypeVar
+
+from app.common import metrics
+from app.common.logger import get_logger
+from app.core.config import settings
+
+from .dispatcher import clova_dispatcher
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# 한가할 때 쌓아 둘 수 있는 헤지 크레딧 상한 (순간적으로 몰리는 헤지 수 제한)
+_BUDGET_BURST = 3.0
+
+
+class HedgePolicy:
+    def __init__(self) -> None:
+        self._latencies: Deque[float] = deque(maxlen=settings.clova_hedge_window)
+        self._credits = 0.0
+
+    # ---------- 지연 / 예산 ----------
+    def observe(self, latency_ms: float) -> None:
+        self._latencies.append(latency_ms)
+
+    def delay_sec(self) -> Optional[float]:
+        """헤지 전 대기 시간 (표본이 부족하면 None → 헤지 안 함)"""
+        if settings.clova_hedge_delay_ms > 0:
+            return settings.clova_hedge_delay_ms / 1000
+        if len(self._latencies) < settings.clova_hedge_min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        k = min(len(ordered) - 1, math.ceil(settings.clova_hedge_percentile / 100 * len(ordered)) - 1)
+        metrics.gauge("clova_hedge_delay_ms", ordered[k])
+        return ordered[k] / 1000
+
+    def _earn(self) -> None:
+        self._credits = min(_BUDGET_BURST, self._credits + settings.clova_hedge_budget_pct / 100)
+
+    def _spend(self) -> bool:
+        if self._credits < 1:
+            metrics.incr("clova_hedge_skipped_budget")
+            return False
+        if clova_dispatcher.idle_slots() <= 0:
+            metrics.incr("clova_hedge_skipped_busy")
+            return False
+        self._credits -= 1
+        return True
+
+    # ---------- 실행 ----------
+    async def run(self, attempt: Callable[[asyncio.Event], Coroutine[Any, Any, T]]) -> T:
+        """
+        attempt(started) 를 실행하고 필요하면 한 번 더 실행해 먼저 성공한 결과를 반환
+        - attempt 는 디스패처 슬롯을 받은 직후 started.set() 을 호출 (헤지 지연은 그때부터 계산)
+        """
+        if not settings.clova_hedge_enabled:
+            return await attempt(asyncio.Event())
+
+        self._earn()
+        loop = asyncio.get_running_loop()
+        started = asyncio.Event()
+        primary: asyncio.Task[T] = asyncio.create_task(attempt(started))
+        tasks = {primary}
+        try:
+            # 1) 슬롯 대기 (그 사이 끝나거나 실패하면 그대로 반환)
+            waiter = asyncio.create_task(started.wait())
+            await asyncio.wait({primary, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            waiter.cancel()
+            call_started = loop.time()
+
+            delay = self.delay_sec()
+            if not primary.done() and delay is not None:
+                # 2) hedge 지연 안에 끝나면 헤지 없음
+                await asyncio.wait({primary}, timeout=delay)
+                if not primary.done() and self._spend():
+                    metrics.incr("clova_hedge_issued")
+                    logger.info(f"[ClovaHedge] {delay * 1000:.0f}ms 초과 → 헤지 요청")
+                    tasks.add(asyncio.create_task(attempt(asyncio.Event())))
+
+            # 3) 먼저 성공한 쪽 사용 (모두 실패하면 첫 요청의 예외)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is None:
+                        if task is not primary:
+                            metrics.incr("clova_hedge_won")
+                        self.observe((loop.time() - call_started) * 1000)
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+
+clova_hedge = HedgePolicy()
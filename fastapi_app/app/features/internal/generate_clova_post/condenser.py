@@ -0,0 +1,123 @@
+# fastapi_app/app/features/internal/generate_clova_post/condenser.py
+"""
+기사 본문 추출 요약 (프롬프트 토큰 예산 맞추기)
+
+- 문장 단위로 나눈 뒤 TextRank(문장 간 단어 겹침 그래프) 점수에 키워드 겹침 / 앞쪽 위치 가중치를 곱해 순위를 매김
+- 점수 높은 문장부터 settings.article_token_budget 까지 고르고 원래 순서대로 이어 붙임
+- 앞에서부터 settings.condense_max_sentences 문장만 순위 계산 (TextRank 가 문장 수 제곱에 비례)
+- 예산에 들어가는 문장이 없으면(한 문장이 예산보다 긴 경우) 첫 문장을 예산만큼 잘라 사용 - 빈 문자열 반환 없음
+- 순수 파이썬 (형태소 분석기 없이 정규식 + 조사 제거), 기사 1건 수 ms
+
+기사 수집 시(fetch_article) 미리 계산해 Django Article.condensed_content 에 저장하고,
+생성 시에는 저장된 값을 그대로 프롬프트에 사용합니다.
+"""
+
+import math
+import re
+from typing import List, Optional, Set
+
+from app.core.config import settings
+
+_SENTENCE_END = re.compile(r"(?<=[.!?。…])\s+|(?<=다\.)|\n+")
+_WORD = re.compile(r"[가-힣]+|[A-Za-z]+|\d+")
+_HANGUL = re.compile(r"[가-힣]")
+# 두 글자 조사를 먼저 확인
+_JOSA = ("에서", "으로", "에게", "까지", "부터") + tuple("은는이가을를의에로와과도만")
+
+_DAMPING = 0.85
+_ITERATIONS = 30
+
+
+def estimate_tokens(text: str) -> int:
+    """Clova 토큰 수 근사치 (한글 음절 ≈ 0.7, 영문/숫자 단어 ≈ 1.3, 그 외 기호 ≈ 1)"""
+    hangul = len(_HANGUL.findall(text))
+    words = sum(1 for w in _WORD.findall(text) if not _HANGUL.match(w))
+    symbols = sum(1 for ch in text if not ch.isspace() and not ch.isalnum())
+    return math.ceil(hangul * 0.7 + words * 1.3 + symbols)
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s.strip() for s in _SENTENCE_END.split(text) if s and s.strip()]
+
+
+def _terms(text: str) -> Set[str]:
+    terms = set()
+    for word in _WORD.findall(text.lower()):
+        for josa in _JOSA:
+            if len(word) > len(josa) + 1 and word.endswith(josa):
+                word = word[: -len(josa)]
+                break
+        if len(word) > 1:
+            terms.add(word)
+    return terms
+
+
+def _similarity(a: Set[str], b: Set[str]) -> float:
+    # TextRank 원 논문의 문장 유사도: 겹치는 단어 수 / (log|A| + log|B|)
+    if len(a) < 2 or len(b) < 2:
+        return 0.0
+    overlap = len(a & b)
+    return overlap / (math.log(len(a)) + math.log(len(b))) if overlap else 0.0
+
+
+def _textrank(term_sets: List[Set[str]]) -> List[float]:
+    n = len(term_sets)
+    weights = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            weights[i][j] = weights[j][i] = _similarity(term_sets[i], term_sets[j])
+    out_sums = [sum(row) for row in weights]
+    # 들어오는 간선만 (j, 정규화 가중치) 로 미리 모아 반복 계산을 간선 수에 비례하게 함
+    incoming = [[(j, weights[j][i] / out_sums[j]) for j in range(n) if weights[j][i]] for i in range(n)]
+
+    scores = [1.0] * n
+    for _ in range(_ITERATIONS):
+        scores = [(1 - _DAMPING) + _DAMPING * sum(w * scores[j] for j, w in edges) for edges in incoming]
+    return scores
+
+
+def _truncate(text: str, budget: int) -> str:
+    """text 앞부분을 estimate_tokens 기준 budget 이하로 자름 (길이 이분 탐색)"""
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) <= budget:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo].rstrip()
+
+
+def condense(text: str, keyword: str = "", token_budget: Optional[int] = None) -> str:
+    """본문을 token_budget(기본 settings.article_token_budget) 이하로 줄인 추출 요약 (이미 이하면 그대로)"""
+    budget = token_budget or settings.article_token_budget
+    text = (text or "").strip()
+    if estimate_tokens(text) <= budget:
+        return text
+
+    sentences = split_sentences(text)[: settings.condense_max_sentences]
+    term_sets = [_terms(s) for s in sentences]
+    keyword_terms = _terms(keyword)
+    ranks = _textrank(term_sets)
+
+    n = len(sentences)
+    scored = []
+    for i, (sentence, terms, rank) in enumerate(zip(sentences, term_sets, ranks)):
+        keyword_bonus = 1 + settings.condense_keyword_weight * len(terms & keyword_terms) / max(1, len(keyword_terms))
+        # 기사는 앞부분(리드)에 핵심이 몰려 있음 → 1.0(첫 문장) ~ 0.5(마지막 문장)
+        position = 1 - settings.condense_position_weight * i / max(1, n - 1)
+        scored.append((rank * keyword_bonus * position, i))
+
+    chosen: Set[int] = set()
+    used = 0
+    for _, i in sorted(scored, reverse=True):
+        cost = estimate_tokens(sentences[i]) + 1
+        if used + cost > budget:
+            continue
+        chosen.add(i)
+        used += cost
+
+    if not chosen:
+        # 모든 문장이 예산보다 김 → 리드 문장을 예산만큼 잘라서라도 기사 내용을 남김
+        return _truncate(sentences[0], budget)
+    return " ".join(sentences[i] for i in sorted(chosen))
@@ -0,0 +1,187 @@
+# app/features/internal/generate_clova_post/jobs.py
+"""
+Clova 생성/재생성 잡 큐 + 워커 풀
+
+- submit_job() 은 잡을 큐에 넣고 job_id 를 바로 반환 (Django 요청 스레드가 Clova 호출을 기다리지 않음)
+- settings.generation_workers 개의 워커가 큐에서 꺼내 process_clova_generation / process_clova_regeneration 실행
+- 완료/실패 시 Django 콜백(generation-jobs/complete/)으로 결과 전달 → Django 가 채널 레이어로 사용자에게 push
+- 잡 상태는 프로세스 메모리에 보관 (fetch_article/jobs.py 와 동일, 완료 후 generation_job_ttl_sec 이 지나면 정리)
+- 서버 종료 시 끝나지 않은 잡은 failed 로 Django 에 알림 (Django 도 오래된 pending 잡은 실패로 응답)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, Final, List, Literal, Optional
+
+from app.common.logger import get_logger
+from app.core.config import settings
+
+from ..django_client import notify_generation_job_to_django
+from ..generate.dispatcher import ClovaOverloaded
+from .schema import GenerateClovaPostRequest
+from .service import process_clova_generation, process_clova_regeneration
+
+logger = get_logger(__name__)
+
+Status = Literal["pending", "running", "done", "failed"]
+Kind = Literal["generate", "regenerate"]
+
+
+class QueueFull(Exception):
+    """대기 중인 잡이 settings.generation_queue_max 를 넘음"""
+
+
+@dataclass
+class GenerationJob:
+    job_id: str
+    kind: Kind
+    user_id: int
+    keyword_id: Optional[int] = None
+    post_id: Optional[int] = None
+    status: Status = "pending"
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    retry_after: Optional[int] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "user_id": self.user_id,
+            "keyword_id": self.keyword_id,
+            "post_id": self.post_id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "retry_after": self.retry_after,
+        }
+
+
+_JOBS: Final[Dict[str, GenerationJob]] = {}
+_queue: Optional[asyncio.Queue] = None
+_workers: List[asyncio.Task] = []
+
+
+def _get_queue() -> asyncio.Queue:
+    global _queue
+    if _queue is None:
+        _queue = asyncio.Queue(maxsize=settings.generation_queue_max)
+    return _queue
+
+
+def _prune_finished() -> None:
+    cutoff = time.time() - settings.generation_job_ttl_sec
+    for job_id in [j.job_id for j in _JOBS.values() if j.finished_at and j.finished_at < cutoff]:
+        _JOBS.pop(job_id, None)
+
+
+def submit_job(
+    kind: Kind, user_id: int, keyword_id: Optional[int] = None, post_id: Optional[int] = None
+) -> GenerationJob:
+    """잡을 큐에 넣고 바로 반환 (큐가 가득 차면 QueueFull)"""
+    _prune_finished()
+    job = GenerationJob(job_id=uuid.uuid4().hex, kind=kind, user_id=user_id, keyword_id=keyword_id, post_id=post_id)
+    try:
+        _get_queue().put_nowait(job)
+    except asyncio.QueueFull:
+        raise QueueFull(f"대기 중인 생성 잡 {settings.generation_queue_max}건 초과")
+    _JOBS[job.job_id] = job
+    logger.info(f"[GEN JOB SUBMIT] {job.job_id} kind={kind} user_id={user_id} queued={_get_queue().qsize()}")
+    return job
+
+
+def get_job(job_id: str) -> Optional[GenerationJob]:
+    return _JOBS.get(job_id)
+
+
+async def _run(job: GenerationJob) -> None:
+    job.status = "running"
+    started = time.perf_counter()
+    try:
+        if job.kind == "generate":
+            if job.keyword_id is None:
+                raise ValueError("생성 잡에 keyword_id 가 없습니다.")
+            response = await process_clova_generation(
+                GenerateClovaPostRequest(keyword_id=job.keyword_id, user_id=job.user_id)
+            )
+        else:
+            if job.post_id is None:
+                raise ValueError("재생성 잡에 post_id 가 없습니다.")
+            response = await process_clova_regeneration(post_id=job.post_id, user_id=job.user_id)
+        job.result = response.model_dump(mode="json")
+        # Clova 실패(status=fail)도 잡 자체는 정상 종료 → result.status 로 구분
+        job.status = "done"
+    except ClovaOverloaded as e:
+        # Clova 대기열 초과 → 키워드 실패 기록 없이 종료, 클라이언트는 retry_after 후 다시 등록
+        job.status = "failed"
+        job.error = str(e)
+        job.retry_after = e.retry_after
+    except Exception as e:
+        job.status = "failed"
+        job.error = str(e) or type(e).__name__
+        logger.exception(f"[GEN JOB FAIL] {job.job_id}: {e}")
+    finally:
+        job.finished_at = time.time()
+
+    logger.info(
+        f"[GEN JOB {job.status.upper()}] {job.job_id} kind={job.kind} "
+        f"elapsed={(time.perf_counter() - started) * 1000:.0f}ms"
+    )
+    await _notify(job)
+
+
+async def _notify(job: GenerationJob) -> None:
+    try:
+        await notify_generation_job_to_django(job.to_dict())
+    except Exception as e:
+        # 콜백 실패 시 클라이언트는 폴링(Django 캐시의 pending 제한 시간 전까지 pending)으로만 확인 가능
+        logger.error(f"[GEN JOB NOTIFY FAIL] {job.job_id}: {e}")
+
+
+async def _worker(index: int) -> None:
+    queue = _get_queue()
+    while True:
+        job = await queue.get()
+        try:
+            await _run(job)
+        except Exception as e:
+            logger.exception(f"[GEN WORKER {index}] 예외: {e}")
+        finally:
+            queue.task_done()
+
+
+def start_workers() -> None:
+    """서버 기동 시 워커 풀 시작"""
+    if _workers:
+        return
+    for i in range(settings.generation_workers):
+        _workers.append(asyncio.create_task(_worker(i), name=f"generation-worker-{i}"))
+    logger.info(f"[GEN WORKERS] {settings.generation_workers}개 시작")
+
+
+async def stop_workers() -> None:
+    """서버 종료 시 워커 풀 정지 (진행 중/대기 중인 잡은 취소하고 Django 에 실패로 알림)"""
+    for task in _workers:
+        task.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+
+    queue = _get_queue()
+    while not queue.empty():
+        queue.get_nowait()
+        queue.task_done()
+
+    unfinished = [j for j in _JOBS.values() if j.status in ("pending", "running")]
+    for job in unfinished:
+        job.status = "failed"
+        job.error = "서버 종료로 취소된 잡입니다. 다시 시도해 주세요."
+        job.finished_at = time.time()
+    if unfinished:
+        logger.warning(f"[GEN WORKERS] 종료로 잡 {len(unfinished)}건 취소")
+        await asyncio.gather(*(_notify(j) for j in unfinished))
@@ -0,0 +1,189 @@
+# app/features/internal/generate_clova_post/log_buffer.py
+"""
+Clova 생성 로그 버퍼 (요청 경로에서 Django 로그 저장 호출 제거)
+
+- record() 는 메모리 큐에 넣기만 함 (최대 settings.clova_log_buffer_max, 넘치면 가장 오래된 로그부터 버림)
+- flusher 가 settings.clova_log_flush_interval_sec 마다, 또는 clova_log_batch_size 만큼 쌓이면
+  Django clova-log/bulk/ 로 묶어서 전송
+    네트워크 오류 / 5xx / 408 / 429  → 큐 앞쪽에 되돌려 다음 주기에 재시도
+    그 외 4xx 등                     → 다시 보내도 같은 결과이므로 settings.clova_log_dead_letter_path 에 보관
+- 서버 종료 시 마지막 flush 후 남은 로그는 settings.clova_log_spill_path(JSON Lines)에 기록,
+  다음 기동 시 읽어 다시 큐에 넣음
+
+지표: counters clova_log_recorded / clova_log_flushed / clova_log_dropped / clova_log_flush_failures /
+      clova_log_dead_lettered, gauge clova_log_buffered
+"""
+
+import asyncio
+import json
+import os
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, List, Optional
+
+import httpx
+
+from app.common import metrics
+from app.common.http_client import ApiResponseError
+from app.common.logger import get_logger
+from app.core.config import settings
+
+from ..django_client import send_clova_logs_bulk
+
+logger = get_logger(__name__)
+
+_buffer: Deque[dict] = deque()
+_wakeup: Optional[asyncio.Event] = None
+_flusher: Optional[asyncio.Task] = None
+
+
+def _get_wakeup() -> asyncio.Event:
+    global _wakeup
+    if _wakeup is None:
+        _wakeup = asyncio.Event()
+    return _wakeup
+
+
+def record(
+    keyword_id: int,
+    status: str,
+    *,
+    error_message: Optional[str] = None,
+    response_time_ms: Optional[int] = None,
+    prompt_tokens: Optional[int] = None,
+    completion_tokens: Optional[int] = None,
+    queue_wait_ms: Optional[int] = None,
+) -> None:
+    """로그 1건을 버퍼에 추가 (네트워크 호출 없음)"""
+    if len(_buffer) >= settings.clova_log_buffer_max:
+        _buffer.popleft()
+        metrics.incr("clova_log_dropped")
+    _buffer.append(
+        {
+            "keyword_id": keyword_id,
+            "status": status,
+            "error_message": error_message,
+            "response_time_ms": response_time_ms,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "queue_wait_ms": queue_wait_ms,
+            "requested_at": datetime.now(timezone.utc).isoformat(),
+        }
+    )
+    metrics.incr("clova_log_recorded")
+    metrics.gauge("clova_log_buffered", len(_buffer))
+    if len(_buffer) >= settings.clova_log_batch_size:
+        _get_wakeup().set()
+
+
+def record_result(keyword_id: int, clova_result: dict) -> None:
+    """generate_clova_post / stream_clova_post 결과 dict 로 기록"""
+    record(
+        keyword_id,
+        "success" if clova_result.get("status") == "success" else "fail",
+        error_message=clova_result.get("error_message"),
+        response_time_ms=clova_result.get("response_time_ms"),
+        prompt_tokens=clova_result.get("prompt_tokens"),
+        completion_tokens=clova_result.get("completion_tokens"),
+        queue_wait_ms=clova_result.get("queue_wait_ms"),
+    )
+
+
+def _retryable(error: Exception) -> bool:
+    if isinstance(error, httpx.TransportError):
+        return True
+    return isinstance(error, ApiResponseError) and (error.status_code >= 500 or error.status_code in (408, 429))
+
+
+def _append_jsonl(path: str, items: List[dict]) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for item in items:
+            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+
+async def flush() -> int:
+    """버퍼를 batch 단위로 모두 전송하고 전송한 건수 반환 (재시도 가능한 실패는 버퍼 앞쪽에 되돌림)"""
+    sent = 0
+    while _buffer:
+        batch = [_buffer.popleft() for _ in range(min(settings.clova_log_batch_size, len(_buffer)))]
+        try:
+            await send_clova_logs_bulk(batch)
+        except asyncio.CancelledError:
+            # 종료 중 취소 → 디스크 저장 대상에 포함되도록 되돌림
+            _buffer.extendleft(reversed(batch))
+            raise
+        except Exception as e:
+            metrics.incr("clova_log_flush_failures")
+            if _retryable(e):
+                _buffer.extendleft(reversed(batch))
+                logger.warning(f"[ClovaLog] {len(batch)}건 전송 실패 (다음 주기에 재시도): {e}")
+                break
+            # 요청 자체가 거절됨 → 재시도하지 않고 보관 후 다음 batch 진행
+            try:
+                await asyncio.to_thread(_append_jsonl, settings.clova_log_dead_letter_path, batch)
+            except OSError as write_error:
+                logger.error(f"[ClovaLog] 거절된 로그 {len(batch)}건 보관 실패 (버림): {write_error}")
+            metrics.incr("clova_log_dead_lettered", len(batch))
+            logger.error(f"[ClovaLog] {len(batch)}건 전송 거절 → {settings.clova_log_dead_letter_path} 에 보관: {e}")
+            continue
+        sent += len(batch)
+        metrics.incr("clova_log_flushed", len(batch))
+    metrics.gauge("clova_log_buffered", len(_buffer))
+    return sent
+
+
+async def _flush_loop() -> None:
+    wakeup = _get_wakeup()
+    while True:
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=settings.clova_log_flush_interval_sec)
+        except asyncio.TimeoutError:
+            pass
+        wakeup.clear()
+        await flush()
+
+
+def _load_spill() -> None:
+    path = settings.clova_log_spill_path
+    if not os.path.exists(path):
+        return
+    with open(path, encoding="utf-8") as f:
+        restored = [json.loads(line) for line in f if line.strip()]
+    os.remove(path)
+    _buffer.extendleft(reversed(restored))
+    logger.info(f"[ClovaLog] 이전 종료 시 남은 로그 {len(restored)}건 복구")
+
+
+def _spill() -> None:
+    if not _buffer:
+        return
+    _append_jsonl(settings.clova_log_spill_path, list(_buffer))
+    logger.warning(f"[ClovaLog] 전송하지 못한 로그 {len(_buffer)}건을 {settings.clova_log_spill_path} 에 저장")
+    _buffer.clear()
+
+
+def start_flusher() -> None:
+    """서버 기동 시 디스크에 남은 로그 복구 + flusher 시작"""
+    global _flusher
+    if _flusher is not None:
+        return
+    try:
+        _load_spill()
+    except Exception as e:
+        logger.error(f"[ClovaLog] 남은 로그 복구 실패: {e}")
+    _flusher = asyncio.create_task(_flush_loop(), name="clova-log-flusher")
+
+
+async def stop_flusher() -> None:
+    """서버 종료 시 마지막 flush, 그래도 남은 로그는 디스크에 저장"""
+    global _flusher
+    if _flusher is not None:
+        _flusher.cancel()
+        await asyncio.gather(_flusher, return_exceptions=True)
+        _flusher = None
+    try:
+        await asyncio.wait_for(flush(), timeout=5)
+    except Exception as e:
+        logger.warning(f"[ClovaLog] 종료 시 flush 실패: {e}")
+    _spill()
@@ -0,0 +1,166 @@
+# app/features/internal/generate_clova_post/pregenerate.py
+"""
+인기 키워드 사전 생성 (스케줄러 이미지 단계 다음에 실행)
+
+- Django 가 최근 수집 키워드를 초기 클릭 속도 + 카테고리 관심도로 점수화한 후보 중 상위 pregeneration_top_n 개
+- 한가한 시간대(pregeneration_offpeak_hours)에만, 하루 pregeneration_daily_budget 회 이내로 Clova 호출
+  (사용량은 Redis 날짜별 카운터 → 재시작/여러 인스턴스에서도 유지, REDIS_URL 미설정 시 프로세스 메모리)
+- Clova 호출은 BACKGROUND 우선순위 (사용자 요청이 몰리면 밀려나고 이번 실행 종료)
+- 결과는 KeywordDraft 로 저장 → 사용자가 생성 요청하면 초안으로 바로 글을 만듦 (generated-posts/preview use_draft)
+- 추측성 작업이므로 실패해도 키워드를 비활성화하거나 실패 로그를 남기지 않음
+"""
+
+from datetime import date, datetime
+from typing import Dict, Optional
+from zoneinfo import ZoneInfo
+
+import redis.asyncio as aioredis
+
+from app.common import metrics
+from app.common.logger import get_logger
+from app.core.config import settings
+from app.features.internal.django_client import (
+    fetch_article_with_images,
+    fetch_pregeneration_candidates,
+    save_keyword_draft,
+)
+from app.features.internal.generate.clova_client import generate_clova_post
+from app.features.internal.generate.dispatcher import ClovaOverloaded, Priority
+
+from .service import _prompt_article
+
+logger = get_logger(__name__)
+
+BUDGET_KEY_PREFIX = "pregen:budget:v1"
+BUDGET_KEY_TTL_SEC = 2 * 24 * 60 * 60  # 날짜별 키라 하루 지나면 필요 없음
+
+_redis: Optional[aioredis.Redis] = None
+# REDIS_URL 미설정(로컬 단독 실행) 시 날짜별 사용량
+_memory_used: Dict[date, int] = {}
+
+
+def _budget_key(today: date) -> str:
+    return f"{BUDGET_KEY_PREFIX}:{today.isoformat()}"
+
+
+def _get_redis() -> Optional[aioredis.Redis]:
+    global _redis
+    if _redis is None and settings.redis_url:
+        _redis = aioredis.from_url(settings.redis_url, decode_responses=True)
+    return _redis
+
+
+async def _remaining_budget(today: date) -> int:
+    client = _get_redis()
+    used = int(await client.get(_budget_key(today)) or 0) if client else _memory_used.get(today, 0)
+    return max(0, settings.pregeneration_daily_budget - used)
+
+
+async def _reserve_budget(today: date) -> bool:
+    """Clova 호출 1회분 예산 차감 (남은 예산이 없으면 False)"""
+    client = _get_redis()
+    if client is None:
+        used = _memory_used.get(today, 0)
+        if used >= settings.pregeneration_daily_budget:
+            return False
+        _memory_used.clear()
+        _memory_used[today] = used + 1
+        return True
+
+    # INCR 는 원자적이라 여러 인스턴스가 동시에 차감해도 예산을 넘지 않음
+    key = _budget_key(today)
+    used = await client.incr(key)
+    if used == 1:
+        await client.expire(key, BUDGET_KEY_TTL_SEC)
+    return used <= settings.pregeneration_daily_budget
+
+
+async def close_budget_store() -> None:
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+async def _pregenerate_one(candidate: dict) -> bool:
+    article_data = await fetch_article_with_images(candidate["id"])
+    if not article_data or not article_data.get("content"):
+        return False
+
+    image_urls = article_data.get("image_urls", [])
+    clova_result = await generate_clova_post(
+        title=article_data["title"],
+        article_content=await _prompt_article(article_data),
+        image_urls=image_urls,
+        stored_paths=article_data.get("stored_paths"),
+        variant_widths=article_data.get("variant_widths"),
+        priority=Priority.BACKGROUND,
+    )
+    if clova_result.get("status") != "success":
+        logger.info(f"[PREGEN] keyword_id={candidate['id']} 생성 실패 - {clova_result.get('error_message')}")
+        return False
+
+    await save_keyword_draft(
+        {
+            "keyword_id": candidate["id"],
+            "title": clova_result["title"],
+            "content": clova_result["content"],
+            "image_1_url": image_urls[0] if len(image_urls) > 0 else None,
+            "image_2_url": image_urls[1] if len(image_urls) > 1 else None,
+            "image_3_url": image_urls[2] if len(image_urls) > 2 else None,
+            "response_time_ms": clova_result.get("response_time_ms"),
+        }
+    )
+    return True
+
+
+async def pregenerate_drafts() -> int:
+    """상위 후보 키워드 초안을 만들고 만든 개수를 반환 (비활성/시간대 밖/예산 소진이면 0)"""
+    if not settings.pregeneration_enabled:
+        return 0
+
+    current = datetime.now(ZoneInfo(settings.timezone))
+    if current.hour not in settings.pregeneration_offpeak_hours:
+        logger.info(f"[PREGEN] 한가한 시간대가 아님 (hour={current.hour}) → 건너뜀")
+        return 0
+
+    try:
+        remaining = await _remaining_budget(current.date())
+    except Exception as e:
+        # 추측성 작업이므로 예산을 확인할 수 없으면 이번 실행은 건너뜀
+        logger.warning(f"[PREGEN] 예산 조회 실패 → 건너뜀: {e}")
+        return 0
+    if remaining <= 0:
+        logger.info("[PREGEN] 오늘 Clova 예산 소진 → 건너뜀")
+        return 0
+
+    candidates = await fetch_pregeneration_candidates(
+        limit=min(settings.pregeneration_top_n, remaining), window_hours=settings.pregeneration_window_hours
+    )
+    logger.info(f"[PREGEN] 후보 {len(candidates or [])}개, 남은 예산 {remaining}")
+
+    created = 0
+    for candidate in candidates or []:
+        try:
+            reserved = await _reserve_budget(current.date())
+        except Exception as e:
+            logger.warning(f"[PREGEN] 예산 차감 실패 → 이번 실행 종료: {e}")
+            break
+        if not reserved:
+            break
+        try:
+            if await _pregenerate_one(candidate):
+                created += 1
+                metrics.incr("pregeneration_drafts")
+                logger.info(f"[PREGEN] 초안 저장 keyword_id={candidate['id']} score={candidate.get('score')}")
+            else:
+                metrics.incr("pregeneration_failures")
+        except ClovaOverloaded:
+            # 사용자 요청이 몰리는 중 → 남은 후보는 다음 실행에서
+            metrics.incr("pregeneration_preempted")
+            logger.info("[PREGEN] Clova 대기열 혼잡 → 이번 실행 종료")
+            break
+        except Exception as e:
+            metrics.incr("pregeneration_failures")
+            logger.warning(f"[PREGEN] keyword_id={candidate['id']} 처리 실패: {e}")
+    return created
@@ -28,3 +28,65 @@ def build_prompt(title: str, article_content: str) -> str:
 [기사 내용]
 {article_content}
 """
+
+
+# ---------- 단락별 병렬 생성 (clova_generation_mode="sectioned") ----------
+def build_outline_prompt(title: str, article_content: str, section_count: int) -> str:
+    return f"""다음 키워드를 주제로 한 블로그 글의 소제목 {section_count}개를 작성해 주세요.
+
+[작성 조건]
+- 본문은 작성하지 마세요. **소제목만 작성합니다.**
+- 한 줄에 하나씩, 반드시 `**소제목**` 형식으로 작성해 주세요.
+- 글의 흐름(도입 → 핵심 내용 → 반응/전망 → 마무리)이 자연스럽게 이어지도록 순서대로 작성해 주세요.
+
+[키워드]
+{title}
+
+[기사 내용]
+{article_content}
+"""
+
+
+def build_section_prompt(title: str, article_content: str, outline: list[str], index: int) -> str:
+    outline_text = "\n".join(f"{i + 1}. {subtitle}" for i, subtitle in enumerate(outline))
+    return f"""다음 키워드를 주제로 한 블로그 글 중 한 단락의 본문을 작성해 주세요.
+
+[작성 조건]
+- 소제목은 작성하지 마세요. **아래 [작성할 단락] 소제목에 해당하는 본문만 작성합니다.**
+- 본문은 6~9문장, 줄바꿈 없이 연결해 주세요. (공백 제외 500자 이상)
+- 다른 단락과 내용이 겹치지 않도록 [전체 소제목] 흐름에 맞춰 작성해 주세요.
+- 블로그처럼 부드러운 말투로 작성해 주세요.
+
+[전체 소제목]
+{outline_text}
+
+[작성할 단락]
+{index + 1}. {outline[index]}
+
+[키워드]
+{title}
+
+[기사 내용]
+{article_content}
+"""
+
+
+# ---------- 부족한 단락 보충 (validator → clova_client._repair) ----------
+def build_extra_outline_prompt(title: str, article_content: str, existing: list[str], count: int) -> str:
+    existing_text = "\n".join(f"- {subtitle}" for subtitle in existing)
+    return f"""다음 키워드를 주제로 한 블로그 글에 이어 붙일 소제목 {count}개를 작성해 주세요.
+
+[작성 조건]
+- 본문은 작성하지 마세요. **소제목만 작성합니다.**
+- 한 줄에 하나씩, 반드시 `**소제목**` 형식으로 작성해 주세요.
+- [기존 소제목]과 내용이 겹치지 않고, 글 뒤쪽에 자연스럽게 이어지도록 작성해 주세요.
+
+[기존 소제목]
+{existing_text}
+
+[키워드]
+{title}
+
+[기사 내용]
+{article_content}
+"""
@@ -1,23 +1,39 @@
 import traceback
 
 from fastapi import APIRouter, HTTPException, Security
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import APIKeyHeader
 
 from app.core.config import settings
 
 from ..django_client import fetch_generated_post_preview
+from ..generate.dispatcher import ClovaOverloaded
+from .jobs import Kind, QueueFull, get_job, submit_job
 from .schema import (
     GenerateClovaPostRequest,
     GenerateClovaPostResponse,
+    GenerationJobResponse,
+    GenerationJobSubmitRequest,
     RegenerateClovaPostRequest,
 )
-from .service import process_clova_generation, process_clova_regeneration
+from .service import (
+    process_clova_generation,
+    process_clova_regeneration,
+    stream_clova_generation,
+)
 
 router = APIRouter()
 api_key_header = APIKeyHeader(name="x-internal-secret", auto_error=True)
 
 
+def _overloaded_response(e: ClovaOverloaded) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"status": "overloaded", "error_message": str(e), "retry_after": e.retry_after},
+        headers={"Retry-After": str(e.retry_after)},
+    )
+
+
 @router.post(
     "/generate-clova-post",
     response_model=GenerateClovaPostResponse,
@@ -34,6 +50,9 @@ async def generate_clova_post_handler(
         result = await process_clova_generation(payload)
         return result
 
+    except ClovaOverloaded as e:
+        return _overloaded_response(e)
+
     except Exception:
         traceback.print_exc()
         return JSONResponse(
@@ -42,6 +61,74 @@ async def generate_clova_post_handler(
         )
 
 
+@router.post(
+    "/generate-clova-post/stream",
+    tags=["[Internal] Clova 콘텐츠 생성"],
+    summary="Clova 콘텐츠 스트리밍 생성 및 저장 (SSE)",
+    description=(
+        "단락이 완성될 때마다 `paragraph` 이벤트로 HTML 을 보내고, 생성이 끝나면 글을 저장한 뒤 `done` 이벤트를 보냅니다.\n\n"
+        "이벤트: `title` → `paragraph`* → `done` | `error`"
+    ),
+    response_class=StreamingResponse,
+)
+async def generate_clova_post_stream_handler(
+    payload: GenerateClovaPostRequest, x_internal_secret: str = Security(api_key_header)
+):
+    if x_internal_secret != settings.internal_secret_key:
+        raise HTTPException(status_code=403, detail="Invalid internal secret")
+
+    return StreamingResponse(
+        stream_clova_generation(payload),
+        media_type="text/event-stream",
+        # nginx 버퍼링 해제 (단락 도착 즉시 전달)
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/generate-clova-post/jobs",
+    response_model=GenerationJobResponse,
+    status_code=202,
+    tags=["[Internal] Clova 콘텐츠 생성"],
+    summary="Clova 생성/재생성 잡 등록 (즉시 반환)",
+    description=(
+        "잡을 큐에 넣고 job_id 를 바로 반환합니다. 워커 풀이 생성을 마치면 Django 로 완료를 알립니다.\n\n"
+        "- keyword_id 만 있으면 생성, post_id 가 있으면 재생성\n"
+        "- 대기 잡이 가득 차면 503 + Retry-After"
+    ),
+)
+async def submit_generation_job_handler(
+    payload: GenerationJobSubmitRequest, x_internal_secret: str = Security(api_key_header)
+):
+    if x_internal_secret != settings.internal_secret_key:
+        raise HTTPException(status_code=403, detail="Invalid internal secret")
+    if payload.post_id is None and payload.keyword_id is None:
+        raise HTTPException(status_code=400, detail="keyword_id 또는 post_id 가 필요합니다.")
+
+    kind: Kind = "regenerate" if payload.post_id is not None else "generate"
+    try:
+        job = submit_job(kind, payload.user_id, keyword_id=payload.keyword_id, post_id=payload.post_id)
+    except QueueFull as e:
+        return JSONResponse(status_code=503, content={"detail": str(e)}, headers={"Retry-After": "10"})
+    return job.to_dict()
+
+
+@router.get(
+    "/generate-clova-post/jobs/{job_id}",
+    response_model=GenerationJobResponse,
+    tags=["[Internal] Clova 콘텐츠 생성"],
+    summary="Clova 생성 잡 상태 조회",
+)
+async def get_generation_job_handler(job_id: str, x_internal_secret: str = Security(api_key_header)):
+    if x_internal_secret != settings.internal_secret_key:
+        raise HTTPException(status_code=403, detail="Invalid internal secret")
+
+    job = get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    return job.to_dict()
+
+
 @router.post(
     "/generated-posts/preview",
     response_model=GenerateClovaPostResponse,
@@ -104,6 +191,9 @@ async def regenerate_clova_post_handler(
         result = await process_clova_regeneration(post_id=post_id, user_id=payload.user_id)
         return result
 
+    except ClovaOverloaded as e:
+        return _overloaded_response(e)
+
     except Exception:
         traceback.print_exc()
         return JSONResponse(
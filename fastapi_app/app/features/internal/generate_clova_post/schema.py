@@ -24,3 +24,23 @@ class RegenerateClovaPostRequest(BaseModel):
     """Clova 콘텐츠 재생성 요청 스키마"""
 
     user_id: int = Field(..., description="재생성을 요청한 사용자 ID")
+
+
+class GenerationJobSubmitRequest(BaseModel):
+    """Clova 생성/재생성 잡 등록 요청 (post_id 가 있으면 재생성)"""
+
+    user_id: int = Field(..., description="요청한 사용자 ID")
+    keyword_id: Optional[int] = Field(None, description="생성 대상 키워드 ID (생성 시 필수)")
+    post_id: Optional[int] = Field(None, description="재생성 대상 게시물 ID (재생성 시 필수)")
+
+
+class GenerationJobResponse(BaseModel):
+    job_id: str = Field(..., description="잡 ID")
+    kind: str = Field(..., description="generate 또는 regenerate")
+    user_id: int = Field(..., description="요청한 사용자 ID")
+    keyword_id: Optional[int] = Field(None, description="생성 대상 키워드 ID")
+    post_id: Optional[int] = Field(None, description="재생성 대상 게시물 ID")
+    status: str = Field(..., description="pending / running / done / failed")
+    result: Optional[dict] = Field(None, description="완료 시 GenerateClovaPostResponse")
+    error: Optional[str] = Field(None, description="잡 실패 시 오류 메시지")
+    retry_after: Optional[int] = Field(None, description="Clova 대기열 초과로 실패한 경우 재시도까지 대기(초)")
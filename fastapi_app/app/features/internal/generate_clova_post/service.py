@@ -1,14 +1,19 @@
+import asyncio
+import json
+from typing import AsyncIterator
+
 from app.common.logger import get_logger
-from app.features.internal import django_client
 from app.features.internal.django_client import (
-    deactivate_keyword,
-    fetch_article_with_images,
-    fetch_generated_post_preview,
-    log_clova_failure_to_django,
-    log_clova_success_to_django,
-    send_generated_post_to_django,
+    commit_generation,
+    fetch_generation_context,
+)
+from app.features.internal.generate.clova_client import (
+    generate_clova_post,
+    stream_clova_post,
 )
-from app.features.internal.generate.clova_client import generate_clova_post
+from app.features.internal.generate.dispatcher import ClovaOverloaded, Priority
+from app.features.internal.generate_clova_post import log_buffer
+from app.features.internal.generate_clova_post.condenser import condense
 from app.features.internal.generate_clova_post.schema import (
     GenerateClovaPostRequest,
     GenerateClovaPostResponse,
@@ -16,25 +21,78 @@ from app.features.internal.generate_clova_post.schema import (
 
 logger = get_logger(__name__)
 
+# 스트리밍 생성 작업 (클라이언트 연결이 끊겨도 생성/저장은 끝까지 진행되도록 참조 유지)
+_stream_tasks: set[asyncio.Task] = set()
+
+
+async def _prompt_article(article_data: dict) -> str:
+    # 수집 시 저장된 추출 요약 사용 (요약 없이 저장된 이전 기사만 요청 시점에 요약 - CPU 작업이라 스레드에서)
+    if article_data.get("condensed_content"):
+        return article_data["condensed_content"]
+    return await asyncio.to_thread(condense, article_data["content"], article_data["title"])
+
+
+async def _load_context(payload: GenerateClovaPostRequest) -> tuple[dict | None, dict | None]:
+    """(기존 글 또는 사전 생성 초안으로 만든 글, 기사 + 이미지) - Django 왕복 1회"""
+    context = await fetch_generation_context(keyword_id=payload.keyword_id, user_id=payload.user_id, use_draft=True)
+    return context.get("post"), context.get("article")
+
+
+async def _record_failure(payload: GenerateClovaPostRequest, clova_result: dict) -> None:
+    # 실패 로그는 버퍼로, 키워드 비활성화만 Django 에 바로 반영
+    log_buffer.record_result(payload.keyword_id, clova_result)
+    await commit_generation(
+        {
+            "keyword_id": payload.keyword_id,
+            "user_id": payload.user_id,
+            "status": "fail",
+            "error_message": clova_result.get("error_message"),
+            "deactivate_keyword": True,
+            "write_log": False,
+        }
+    )
+
+
+async def _save_success(
+    keyword_id: int, user_id: int, clova_result: dict, image_urls: list, post_id: int | None = None
+) -> dict:
+    # 글 저장(post_id 가 있으면 덮어쓰기), 성공 로그는 버퍼로 (clova-log/bulk/ 로 나중에 일괄 저장)
+    log_buffer.record_result(keyword_id, clova_result)
+    return await commit_generation(
+        {
+            "keyword_id": keyword_id,
+            "user_id": user_id,
+            "post_id": post_id,
+            "status": "success",
+            "title": clova_result["title"],
+            "content": clova_result["content"],
+            "image_1_url": image_urls[0] if len(image_urls) > 0 else None,
+            "image_2_url": image_urls[1] if len(image_urls) > 1 else None,
+            "image_3_url": image_urls[2] if len(image_urls) > 2 else None,
+            "response_time_ms": clova_result.get("response_time_ms", 0),
+            "write_log": False,
+        }
+    )
+
 
 async def process_clova_generation(
     payload: GenerateClovaPostRequest,
+    priority: Priority = Priority.INTERACTIVE,
 ) -> GenerateClovaPostResponse:
     """
-    Clova 콘텐츠 생성 전체 프로세스
-    1. 이미 생성된 글이 있으면 리턴
-    2. 기사 조회
-    3. Clova 요청 → 실패 시 비활성화 + 로그
-    4. 성공 시 Django에 저장 + 성공 로그
+    Clova 콘텐츠 생성 전체 프로세스 (Django 왕복: 컨텍스트 조회 1회 + 커밋 1회)
+    1. 이미 생성된 글(또는 사전 생성 초안)이 있으면 리턴, 없으면 같은 응답으로 기사 조회
+    2. Clova 요청 → 실패 시 비활성화 + 로그 (대기열 초과 ClovaOverloaded 는 기록 없이 그대로 올림)
+    3. 성공 시 Django에 저장 (성공/실패 로그는 log_buffer 에 모아 clova-log/bulk/ 로 일괄 저장)
     """
     try:
-        # 0. 생성된 글 미리보기 확인
-        preview = await fetch_generated_post_preview(
-            keyword_id=payload.keyword_id,
-            user_id=payload.user_id,
-        )
+        # 0. 생성된 글 (또는 사전 생성 초안으로 만든 글) 확인 + 기사 조회
+        preview, article_data = await _load_context(payload)
         if preview:
-            logger.info(f"[SKIP] 이미 생성된 글 존재 - post_id={preview['post_id']}")
+            logger.info(
+                f"[SKIP] {'사전 생성 초안 사용' if preview.get('from_draft') else '이미 생성된 글 존재'} "
+                f"- post_id={preview['post_id']}"
+            )
             return GenerateClovaPostResponse(
                 status="success",
                 post_id=preview["post_id"],
@@ -43,8 +101,7 @@ async def process_clova_generation(
                 from_cache=True,
             )
 
-        # 1. 기사 조회
-        article_data = await fetch_article_with_images(payload.keyword_id)
+        # 1. 기사 확인
         if not article_data or not article_data.get("content"):
             raise ValueError("기사 내용이 비어 있습니다.")
 
@@ -54,23 +111,17 @@ async def process_clova_generation(
         image_urls = article_data.get("image_urls", [])
         clova_result = await generate_clova_post(
             title=article_data["title"],
-            article_content=article_data["content"],
+            article_content=await _prompt_article(article_data),
             image_urls=image_urls,
+            stored_paths=article_data.get("stored_paths"),
+            variant_widths=article_data.get("variant_widths"),
+            priority=priority,
         )
 
         if clova_result.get("status") != "success":
             error_message = clova_result.get("error_message", "Clova 생성 실패")
             logger.warning(f"[STEP 2] Clova 생성 실패 - {error_message}")
-
-            await log_clova_failure_to_django(
-                {
-                    "keyword_id": payload.keyword_id,
-                    "user_id": payload.user_id,
-                    "status": "fail",
-                    "error_message": error_message,
-                }
-            )
-            await deactivate_keyword(payload.keyword_id)
+            await _record_failure(payload, clova_result)
 
             return GenerateClovaPostResponse(
                 status="fail",
@@ -83,28 +134,7 @@ async def process_clova_generation(
         logger.info(f"[STEP 2] Clova 생성 성공 - title={clova_result['title']}")
 
         # 3. 최종 저장 (Clova에서 이미지 삽입 완료된 content 사용)
-        final_content = clova_result["content"]
-
-        save_result = await send_generated_post_to_django(
-            {
-                "keyword_id": payload.keyword_id,
-                "user_id": payload.user_id,
-                "title": clova_result["title"],
-                "content": final_content,
-                "image_1_url": image_urls[0] if len(image_urls) > 0 else None,
-                "image_2_url": image_urls[1] if len(image_urls) > 1 else None,
-                "image_3_url": image_urls[2] if len(image_urls) > 2 else None,
-            }
-        )
-
-        await log_clova_success_to_django(
-            {
-                "keyword_id": payload.keyword_id,
-                "user_id": payload.user_id,
-                "status": "success",
-                "response_time_ms": clova_result.get("response_time_ms", 0),
-            }
-        )
+        save_result = await _save_success(payload.keyword_id, payload.user_id, clova_result, image_urls)
 
         logger.info(f"[STEP 3] Django 저장 완료 - post_id={save_result['post_id']}")
 
@@ -116,59 +146,145 @@ async def process_clova_generation(
             from_cache=False,
         )
 
+    except ClovaOverloaded:
+        raise
+
     except Exception as e:
         logger.error(f"[FATAL] Clova 생성 중 예외 발생: {e}", exc_info=True)
         raise
 
 
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+async def _produce_stream(payload: GenerateClovaPostRequest, queue: asyncio.Queue) -> None:
+    """스트리밍 생성 본체 - SSE 메시지를 queue 에 넣고, 끝나면 None 을 넣음"""
+    try:
+        # 0. 이미 생성된 글이 있으면 바로 완료 (없으면 같은 응답의 기사 사용)
+        preview, article_data = await _load_context(payload)
+        if preview:
+            logger.info(f"[STREAM-SKIP] 이미 생성된 글 존재 - post_id={preview['post_id']}")
+            await queue.put(
+                _sse(
+                    "done",
+                    {
+                        "status": "success",
+                        "post_id": preview["post_id"],
+                        "created_at": preview["created_at"],
+                        "from_cache": True,
+                    },
+                )
+            )
+            return
+
+        # 1. 기사 확인
+        if not article_data or not article_data.get("content"):
+            raise ValueError("기사 내용이 비어 있습니다.")
+        await queue.put(_sse("title", {"html": f"<h1>{article_data['title']}</h1>"}))
+
+        # 2. Clova 스트리밍 생성 → 단락 단위 전달
+        image_urls = article_data.get("image_urls", [])
+        async for event in stream_clova_post(
+            title=article_data["title"],
+            article_content=await _prompt_article(article_data),
+            image_urls=image_urls,
+            stored_paths=article_data.get("stored_paths"),
+            variant_widths=article_data.get("variant_widths"),
+        ):
+            kind = event.pop("event")
+            if kind == "paragraph":
+                await queue.put(_sse("paragraph", event))
+            elif kind == "error" and event["status"] == "overloaded":
+                # 대기열 초과는 키워드 실패로 기록하지 않음 (retry_after 후 재시도)
+                await queue.put(_sse("error", event))
+            elif kind == "error":
+                logger.warning(f"[STREAM-STEP 2] Clova 생성 실패 - {event['error_message']}")
+                await _record_failure(payload, event)
+                await queue.put(_sse("error", {"status": "fail", "error_message": event["error_message"]}))
+            else:
+                # 3. 스트림이 끝나면 전체 글을 한 번에 저장
+                save_result = await _save_success(payload.keyword_id, payload.user_id, event, image_urls)
+                logger.info(f"[STREAM-STEP 3] Django 저장 완료 - post_id={save_result['post_id']}")
+                await queue.put(
+                    _sse(
+                        "done",
+                        {
+                            "status": "success",
+                            "post_id": save_result["post_id"],
+                            "created_at": save_result["created_at"],
+                            "from_cache": False,
+                            "first_paragraph_ms": event.get("first_paragraph_ms"),
+                        },
+                    )
+                )
+    except Exception as e:
+        logger.error(f"[FATAL] Clova 스트리밍 생성 중 예외 발생: {e}", exc_info=True)
+        await queue.put(_sse("error", {"status": "fail", "error_message": str(e)}))
+    finally:
+        await queue.put(None)
+
+
+async def stream_clova_generation(payload: GenerateClovaPostRequest) -> AsyncIterator[str]:
+    """
+    Clova 콘텐츠 스트리밍 생성 (SSE)
+    - event: title      → {"html": "<h1>..</h1>"}
+    - event: paragraph  → {"index", "html"} (단락이 완성될 때마다)
+    - event: done       → {"status", "post_id", "created_at", "from_cache"} (저장 완료 후)
+    - event: error      → {"status": "fail", "error_message"} / {"status": "overloaded", ..., "retry_after"}
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    task = asyncio.create_task(_produce_stream(payload, queue))
+    _stream_tasks.add(task)
+    task.add_done_callback(_stream_tasks.discard)
+
+    while (message := await queue.get()) is not None:
+        yield message
+
+
 # clova 재생성
 async def process_clova_regeneration(
     post_id: int,
     user_id: int,
 ) -> GenerateClovaPostResponse:
     """
-    [재생성] Clova 콘텐츠 재생성 전체 프로세스
-    1. post_id로 Post 상세 조회 → keyword_id 추출
-    2. keyword_id로 기사 및 이미지 조회
-    3. Clova 요청 → 실패 시 로그 기록
-    4. 성공 시 Django에 기존 Post를 UPDATE + 성공 로그 기록
-    5. 반환 시 updated_at 기준으로 응답
+    [재생성] Clova 콘텐츠 재생성 전체 프로세스 (Django 왕복: 컨텍스트 조회 1회 + 커밋 1회)
+    1. post_id로 Post + 해당 키워드의 기사/이미지 조회
+    2. Clova 요청 → 실패 시 로그 기록
+    3. 성공 시 Django에 기존 Post를 UPDATE + 성공 로그 기록
+    4. 반환 시 updated_at 기준으로 응답
     """
     try:
-        # 1. post_id로 keyword_id를 조회
-        post_details = await django_client.fetch_post_details_from_django(post_id)
+        # 1. post_id로 keyword_id + 기사/이미지 조회
+        context = await fetch_generation_context(post_id=post_id)
+        post_details = context.get("post")
         if not post_details:
             raise ValueError(f"Post ID {post_id}를 찾을 수 없습니다.")
         keyword_id = post_details["keyword_id"]
         logger.info(f"[REGEN-STEP 0] 재생성 시작 - post_id={post_id}, keyword_id={keyword_id}")
 
-        # 2. 조회한 keyword_id로 기사/이미지 조회
-        article_data = await django_client.fetch_article_with_images(keyword_id)
+        article_data = context.get("article")
         if not article_data or not article_data.get("content"):
             raise ValueError("기사 내용이 비어 있습니다.")
         logger.info(f"[REGEN-STEP 1] 기사 조회 완료 - keyword_id={keyword_id}")
 
-        # 3. Clova AI를 호출하여 콘텐츠를 생성
+        # 2. Clova AI를 호출하여 콘텐츠를 생성
         image_urls = article_data.get("image_urls", [])
         clova_result = await generate_clova_post(
             title=article_data["title"],
-            article_content=article_data["content"],
+            article_content=await _prompt_article(article_data),
             image_urls=image_urls,
+            stored_paths=article_data.get("stored_paths"),
+            variant_widths=article_data.get("variant_widths"),
+            priority=Priority.ADMIN,
         )
 
         # Clova 실패 처리 로직
         if clova_result.get("status") != "success":
             error_message = clova_result.get("error_message", "Clova 생성 실패")
             logger.warning(f"[REGEN-STEP 2] Clova 생성 실패 - {error_message}")
-            await django_client.log_clova_failure_to_django(
-                {
-                    "post_id": post_id,
-                    "keyword_id": keyword_id,
-                    "user_id": user_id,
-                    "status": "fail",
-                    "error_message": error_message,
-                }
-            )  # 로그 데이터 전달
+            # 실패 로그만 (재생성은 키워드 비활성화 안 함 → Django 호출 없이 버퍼에만 기록)
+            log_buffer.record_result(keyword_id, clova_result)
             return GenerateClovaPostResponse(
                 status="fail",
                 post_id=None,
@@ -179,28 +295,11 @@ async def process_clova_regeneration(
 
         logger.info(f"[REGEN-STEP 2] Clova 생성 성공 - title={clova_result['title']}")
 
-        # 4. UPDATE 함수 호출
-        update_data = {
-            "title": clova_result["title"],
-            "content": clova_result["content"],
-            "image_1_url": image_urls[0] if len(image_urls) > 0 else None,
-            "image_2_url": image_urls[1] if len(image_urls) > 1 else None,
-            "image_3_url": image_urls[2] if len(image_urls) > 2 else None,
-        }
-        save_result = await django_client.update_generated_post_in_django(post_id, update_data)
-
-        # 성공 로그 저장 (기존과 동일)
-        await django_client.log_clova_success_to_django(
-            {
-                "keyword_id": keyword_id,
-                "user_id": user_id,
-                "status": "success",
-                "response_time_ms": clova_result.get("response_time_ms", 0),
-            }
-        )
+        # 3. 기존 Post UPDATE (성공 로그는 버퍼로)
+        save_result = await _save_success(keyword_id, user_id, clova_result, image_urls, post_id=post_id)
         logger.info(f"[REGEN-STEP 3] Django 업데이트 완료 - post_id={post_id}")
 
-        # 5. 반환값에 수정 시각(updated_at)을 사용
+        # 4. 반환값에 수정 시각(updated_at)을 사용
         return GenerateClovaPostResponse(
             status="success",
             post_id=post_id,
@@ -209,6 +308,9 @@ async def process_clova_regeneration(
             from_cache=False,
         )
 
+    except ClovaOverloaded:
+        raise
+
     except Exception as e:
         logger.error(f"[FATAL] Clova 재생성 중 예외 발생: {e}", exc_info=True)
         raise
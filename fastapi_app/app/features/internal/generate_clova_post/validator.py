@@ -0,0 +1,119 @@
+# fastapi_app/app/features/internal/generate_clova_post/validator.py
+"""
+Clova 생성 결과 검증 (HTML 변환 전 '**소제목**\\n본문' 텍스트 기준)
+
+검사 항목 (settings 값 기준, 걸리면 True):
+    length         공백 제외 전체 글자 수 < clova_min_chars
+    sections       소제목 단락 수 < clova_min_sections
+    short_section  본문이 clova_min_section_chars 미만인 단락이 있음
+    format         소제목 없는 본문 (단락 하나만큼 긴 도입부 포함) / '## 소제목' 같은 다른 형식의 소제목
+                   짧은 도입부나 '# 제목' 줄은 검사 대상이 아님 (parse_sections 에서 첫 단락에 합치거나 버림)
+
+format 은 Clova 호출 없이 normalize() 로 고치고, 나머지는 clova_client 가 모자란 단락만 다시 생성해 채움.
+검사별 결과는 metrics 카운터 clova_validation_<검사>_hit / _miss 로 남김 (→ ratios 에 _hit_rate)
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from app.common import metrics
+from app.core.config import settings
+
+_SUBTITLE = re.compile(r"\*\*(.+?)\*\*")
+_HEADING = re.compile(r"#{1,6}\s*(.+)")
+
+CHECKS = ("length", "sections", "short_section", "format")
+
+
+@dataclass
+class Section:
+    subtitle: Optional[str]
+    body: str = ""
+
+    @property
+    def chars(self) -> int:
+        return count_chars(self.body)
+
+
+@dataclass
+class ValidationReport:
+    sections: List[Section]
+    total_chars: int
+    issues: Dict[str, bool] = field(default_factory=dict)
+    short_sections: List[int] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not any(self.issues.values())
+
+    @property
+    def missing_sections(self) -> int:
+        return max(0, settings.clova_min_sections - len(self.sections))
+
+
+def count_chars(text: str) -> int:
+    """공백 제외 글자 수"""
+    return sum(1 for ch in text if not ch.isspace())
+
+
+def parse_sections(text: str) -> tuple[List[Section], bool]:
+    """
+    (단락 목록, 형식 오류 여부)
+    - 첫 소제목 앞부분(글 제목/도입부)은 단락으로 세지 않음: '# 제목' 줄은 버리고, 도입 문장은 첫 단락 본문 앞에 붙임
+    - 소제목이 아예 없거나 도입부가 단락 하나만큼 길면 subtitle=None 단락 (형식 오류 → normalize)
+    """
+    lines = [raw.strip() for raw in text.splitlines() if raw.strip()]
+    bold = any(_SUBTITLE.match(line) for line in lines)
+    sections: List[Section] = []
+    preamble: List[str] = []
+    malformed = False
+    for line in lines:
+        match = _SUBTITLE.match(line)
+        if not match and (match := _HEADING.match(line)):
+            if bold and not sections:
+                # '**소제목**' 형식 글 앞의 '# 제목' → 글 제목
+                continue
+            malformed = True
+        if match and match.group(1).strip():
+            sections.append(Section(match.group(1).strip()))
+            continue
+        if not sections:
+            preamble.append(line)
+            continue
+        sections[-1].body = f"{sections[-1].body} {line}".strip()
+
+    intro = " ".join(preamble)
+    if intro:
+        if sections and count_chars(intro) < settings.clova_min_section_chars:
+            sections[0].body = f"{intro} {sections[0].body}".strip()
+        else:
+            malformed = True
+            sections.insert(0, Section(None, intro))
+    return sections, malformed
+
+
+def validate(text: str, record: bool = True) -> ValidationReport:
+    sections, malformed = parse_sections(text)
+    titled = [s for s in sections if s.body]
+    report = ValidationReport(sections=titled, total_chars=sum(s.chars for s in titled))
+    report.short_sections = [i for i, s in enumerate(titled) if s.chars < settings.clova_min_section_chars]
+    report.issues = {
+        "length": report.total_chars < settings.clova_min_chars,
+        "sections": len(titled) < settings.clova_min_sections,
+        "short_section": bool(report.short_sections),
+        "format": malformed,
+    }
+    if record:
+        for check, hit in report.issues.items():
+            metrics.incr(f"clova_validation_{check}_{'hit' if hit else 'miss'}")
+    return report
+
+
+def normalize(sections: List[Section], fallback_subtitle: str) -> List[Section]:
+    """소제목 없는 단락에 fallback_subtitle(키워드)을 붙임 (Clova 호출 없는 형식 보정)"""
+    return [Section(s.subtitle or fallback_subtitle, s.body) for s in sections]
+
+
+def render(sections: List[Section]) -> str:
+    return "\n\n".join(f"**{s.subtitle}**\n{s.body}" for s in sections)
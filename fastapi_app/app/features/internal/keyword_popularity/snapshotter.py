@@ -0,0 +1,58 @@
+# app/features/internal/keyword_popularity/snapshotter.py
+"""
+키워드 인기도 스냅샷 주기 실행
+
+- Django 는 클릭마다 Redis sorted set(누적 클릭 수 / 시간 감쇠 점수)만 갱신하고,
+  인기순 정렬은 KeywordPopularity 테이블을 읽음
+- settings.keyword_popularity_snapshot_interval_sec 마다 Django keywords/popularity/snapshot/ 호출로 테이블 갱신
+  (스케줄러 사이클(6시간)과 별도 주기 - 인기순 반영 지연 = 이 주기)
+
+지표: counters keyword_popularity_snapshots / keyword_popularity_snapshot_failures, gauge keyword_popularity_saved
+"""
+
+import asyncio
+from typing import Optional
+
+from app.common import metrics
+from app.common.logger import get_logger
+from app.core.config import settings
+
+from ..django_client import snapshot_keyword_popularity
+
+logger = get_logger(__name__)
+
+_task: Optional[asyncio.Task] = None
+
+
+async def snapshot_once() -> int:
+    result = await snapshot_keyword_popularity()
+    saved = (result or {}).get("saved", 0)
+    metrics.incr("keyword_popularity_snapshots")
+    metrics.gauge("keyword_popularity_saved", saved)
+    return saved
+
+
+async def _snapshot_loop() -> None:
+    while True:
+        await asyncio.sleep(settings.keyword_popularity_snapshot_interval_sec)
+        try:
+            await snapshot_once()
+        except Exception as e:
+            metrics.incr("keyword_popularity_snapshot_failures")
+            logger.warning(f"[Popularity] 인기도 스냅샷 실패 (다음 주기에 재시도): {e}")
+
+
+def start_snapshotter() -> None:
+    global _task
+    if _task is not None or settings.keyword_popularity_snapshot_interval_sec <= 0:
+        return
+    _task = asyncio.create_task(_snapshot_loop(), name="keyword-popularity-snapshotter")
+
+
+async def stop_snapshotter() -> None:
+    global _task
+    if _task is None:
+        return
+    _task.cancel()
+    await asyncio.gather(_task, return_exceptions=True)
+    _task = None
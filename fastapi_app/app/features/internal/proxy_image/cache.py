@@ -0,0 +1,219 @@
+# app/features/internal/proxy_image/cache.py
+"""
+이미지 프록시 디스크 캐시 (용량 제한 LRU, 내용 주소 기반)
+
+디렉터리 구조:
+    <root>/objects/<sha256[:2]>/<sha256>   # 이미지 본문 (같은 내용은 URL이 달라도 1개만 저장)
+    <root>/urls/<sha1(url)>.json           # URL → {hash, content_type, size}
+    <root>/variants/<sha256[:2]>/<sha256>.<width>.<fmt>   # 리사이즈/포맷 변환본 (원본과 함께 삭제)
+    <root>/tmp/                            # 다운로드 중 임시 파일
+
+- ETag 는 본문 sha256 을 그대로 사용
+- 같은 URL 동시 요청은 inflight Future 하나로 합쳐서 원본 요청은 1번만 보냄
+- 응답/변환 중인 원본은 pin() 으로 고정해 용량 정리(LRU)에서 제외
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    hash: str
+    content_type: str
+    size: int
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.hash}"'
+
+
+def url_key(url: str) -> str:
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+class ImageDiskCache:
+    def __init__(self, root: str | Path, max_bytes: int, max_object_bytes: int) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_object_bytes = max_object_bytes
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()  # url_key → entry (LRU 순서)
+        self._refs: Dict[str, int] = {}  # object hash → 참조 URL 수
+        self._variant_bytes: Dict[str, int] = {}  # object hash → 변환본 용량 합
+        self._total = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._pins: Dict[str, int] = {}  # object hash → 사용 중인 요청 수 (용량 정리 대상에서 제외)
+        self._loaded = False
+
+    # ---------- 경로 ----------
+    def object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest
+
+    def variant_path(self, digest: str, width: int, fmt: str) -> Path:
+        return self.root / "variants" / digest[:2] / f"{digest}.{width}.{fmt}"
+
+    def _index_path(self, key: str) -> Path:
+        return self.root / "urls" / f"{key}.json"
+
+    # ---------- 로딩 ----------
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        for sub in ("objects", "urls", "variants", "tmp"):
+            (self.root / sub).mkdir(parents=True, exist_ok=True)
+        # 이전 프로세스가 남긴 미완성 다운로드 정리 (다른 워커가 쓰는 중일 수 있어 1시간 지난 것만)
+        stale_before = time.time() - 3600
+        for path in (self.root / "tmp").iterdir():
+            if path.stat().st_mtime < stale_before:
+                path.unlink(missing_ok=True)
+
+        # 최근 사용 시각(mtime) 순으로 LRU 복원
+        index_files = sorted((self.root / "urls").glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for path in index_files:
+            try:
+                entry = CacheEntry(**json.loads(path.read_text()))
+            except Exception:
+                path.unlink(missing_ok=True)
+                continue
+            if not self.object_path(entry.hash).exists():
+                path.unlink(missing_ok=True)
+                continue
+            self._add(path.stem, entry)
+
+        for path in (self.root / "variants").glob("*/*"):
+            digest = path.name.split(".", 1)[0]
+            if digest in self._refs:
+                self._variant_bytes[digest] = self._variant_bytes.get(digest, 0) + path.stat().st_size
+                self._total += path.stat().st_size
+            else:
+                path.unlink(missing_ok=True)
+        logger.info(f"[ImageCache] 로드 완료: entries={len(self._entries)}, bytes={self._total}")
+
+    def _add(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        refs = self._refs.get(entry.hash, 0)
+        if refs == 0:
+            self._total += entry.size
+        self._refs[entry.hash] = refs + 1
+
+    def _release(self, entry: CacheEntry, keep_hash: Optional[str] = None) -> None:
+        self._refs[entry.hash] -= 1
+        if self._refs[entry.hash] == 0:
+            del self._refs[entry.hash]
+            self._total -= entry.size
+            if entry.hash != keep_hash:
+                self.object_path(entry.hash).unlink(missing_ok=True)
+                self._total -= self._variant_bytes.pop(entry.hash, 0)
+                for path in (self.root / "variants" / entry.hash[:2]).glob(f"{entry.hash}.*"):
+                    path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        # 오래된 순으로 정리하되 응답/변환 중인 원본은 건너뜀 (해제될 때 다시 정리)
+        for key in list(self._entries):
+            if self._total <= self.max_bytes:
+                break
+            entry = self._entries[key]
+            if entry.hash in self._pins:
+                continue
+            del self._entries[key]
+            self._index_path(key).unlink(missing_ok=True)
+            self._release(entry)
+
+    def pin(self, digest: str) -> None:
+        """원본(과 변환본)을 사용하는 동안 용량 정리로 지워지지 않게 고정"""
+        self._pins[digest] = self._pins.get(digest, 0) + 1
+
+    def unpin(self, digest: str) -> None:
+        count = self._pins.get(digest, 0) - 1
+        if count > 0:
+            self._pins[digest] = count
+            return
+        self._pins.pop(digest, None)
+        self._evict()
+
+    # ---------- 조회 / 저장 ----------
+    def get(self, url: str) -> Optional[CacheEntry]:
+        self._load()
+        key = url_key(url)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not self.object_path(entry.hash).exists():
+            # 외부에서 지워진 경우
+            self._release(self._entries.pop(key))
+            return None
+        self._entries.move_to_end(key)
+        try:
+            os.utime(self._index_path(key))
+        except OSError:
+            pass
+        return entry
+
+    def new_temp_file(self):
+        self._load()
+        return tempfile.NamedTemporaryFile(dir=self.root / "tmp", delete=False)
+
+    def persist(self, url: str, temp_path: str, entry: CacheEntry) -> None:
+        """다운로드가 끝난 임시 파일을 내용 주소 경로로 옮기고 URL 인덱스를 기록 (파일 작업만 - 스레드에서 호출)"""
+        target = self.object_path(entry.hash)
+        if target.exists():
+            os.unlink(temp_path)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(temp_path, target)
+        self._index_path(url_key(url)).write_text(json.dumps(asdict(entry)))
+
+    def register(self, url: str, entry: CacheEntry) -> CacheEntry:
+        """persist() 로 기록한 항목을 메모리 인덱스에 등록 (이벤트 루프에서 호출)"""
+        key = url_key(url)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._release(old, keep_hash=entry.hash)
+        self._add(key, entry)
+        self._evict()
+        return entry
+
+    def add_variant(self, digest: str, temp_path: str, width: int, fmt: str) -> Path:
+        """렌더링이 끝난 변환본을 등록 (원본이 이미 지워졌으면 등록하지 않고 경로만 반환)"""
+        target = self.variant_path(digest, width, fmt)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(temp_path, target)
+        if digest in self._refs:
+            size = target.stat().st_size
+            self._variant_bytes[digest] = self._variant_bytes.get(digest, 0) + size
+            self._total += size
+            self._evict()
+        return target
+
+    # ---------- 동시 요청 합치기 (key: URL 또는 변환본 식별자) ----------
+    def inflight(self, key: str) -> Optional[asyncio.Future]:
+        return self._inflight.get(key)
+
+    def begin(self, key: str) -> asyncio.Future:
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        return future
+
+    def finish(self, key: str, result: Any, future: Optional[asyncio.Future] = None) -> None:
+        """대기 중인 요청에 결과 전달 (future 를 주면 그 요청이 시작한 항목일 때만 정리)"""
+        if future is not None and self._inflight.get(key) is not future:
+            return
+        future = self._inflight.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(result)
+
+    @property
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "bytes": self._total, "inflight": len(self._inflight)}
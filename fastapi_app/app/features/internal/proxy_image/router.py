@@ -1,28 +1,297 @@
 # app/features/internal/proxy_image/router.py
 
+import asyncio
+import hashlib
+import logging
+import os
+from typing import Any, AsyncIterator, Literal, Optional
+
 import httpx
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import Response, StreamingResponse
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+
+from app.common.utils.url_utils import is_public_http_url
+from app.core.config import settings
+
+from .cache import CacheEntry, ImageDiskCache
+from .variants import VARIANT_FORMATS, render_variant, snap_width
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+image_cache = ImageDiskCache(
+    root=settings.image_proxy_cache_dir,
+    max_bytes=settings.image_proxy_cache_max_mb * 1024 * 1024,
+    max_object_bytes=settings.image_proxy_max_object_mb * 1024 * 1024,
+)
 
-@router.get("/proxy-image")
-async def proxy_image(url: str = Query(..., description="이미지 원본 URL")):
-    print(f"[proxy_image] 요청 URL: {url}")  # 디버깅 출력
+# 재사용 클라이언트 (서버 종료 시 close_proxy_client)
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=15.0,
+            # 리다이렉트는 따라가지 않음 (_open_source 의 URL 검사를 우회해 내부 주소로 향하는 것 방지)
+            follow_redirects=False,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def close_proxy_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _cache_headers(entry: Optional[CacheEntry] = None) -> dict:
+    headers = {"Cache-Control": f"public, max-age={settings.image_proxy_cache_max_age}"}
+    if entry is not None:
+        headers["ETag"] = entry.etag
+    return headers
+
+
+class _PinnedFileResponse(FileResponse):
+    """캐시 파일 응답 - 전송이 끝나거나 끊길 때까지 원본을 용량 정리에서 제외"""
+
+    def __init__(self, digest: str, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.digest = digest
+        image_cache.pin(digest)
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            image_cache.unpin(self.digest)
+
+
+def _serve_cached(request: Request, entry: CacheEntry) -> Response:
+    # If-None-Match 가 일치하면 본문 없이 304
+    if_none_match = request.headers.get("if-none-match", "")
+    if entry.etag in (tag.strip() for tag in if_none_match.split(",")) or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=_cache_headers(entry))
+    return _PinnedFileResponse(
+        entry.hash,
+        image_cache.object_path(entry.hash),
+        media_type=entry.content_type,
+        headers=_cache_headers(entry),
+    )
+
+
+async def _stream_and_store(
+    url: str, response: httpx.Response, content_type: str, future: Optional[asyncio.Future]
+) -> AsyncIterator[bytes]:
+    """원본 응답을 청크 단위로 그대로 전달하면서 임시 파일에 기록, 끝까지 받으면 캐시에 등록
+
+    future: 이 요청이 선점한 inflight 항목 (끝나면 결과 전달 후 정리)
+    """
+    entry: Optional[CacheEntry] = None
+    digest = hashlib.sha256()
+    size = 0
+    temp = None
+    try:
+        temp = await asyncio.to_thread(image_cache.new_temp_file)
+        async for chunk in response.aiter_bytes():
+            yield chunk
+            size += len(chunk)
+            if temp is not None:
+                if size > image_cache.max_object_bytes:
+                    # 너무 큰 이미지는 캐시하지 않고 전달만
+                    await asyncio.to_thread(_discard_temp, temp)
+                    temp = None
+                    continue
+                await asyncio.to_thread(temp.write, chunk)
+                digest.update(chunk)
+
+        if temp is not None:
+            entry = CacheEntry(hash=digest.hexdigest(), content_type=content_type, size=size)
+            await asyncio.to_thread(_persist_temp, url, temp, entry)
+            temp = None
+            entry = image_cache.register(url, entry)
+            logger.info(f"[proxy_image] 캐시 저장: size={size} url={url}")
+    finally:
+        await response.aclose()
+        if temp is not None:
+            # 중간에 끊긴 경우 (클라이언트 연결 종료 / 원본 오류)
+            _discard_temp(temp)
+        if future is not None:
+            image_cache.finish(url, entry, future)
+
+
+def _discard_temp(temp) -> None:
+    temp.close()
+    os.unlink(temp.name)
+
+
+def _persist_temp(url: str, temp, entry: CacheEntry) -> None:
+    temp.close()
+    image_cache.persist(url, temp.name, entry)
+
+
+async def _open_source(url: str) -> httpx.Response:
+    """원본 요청 (응답 본문은 스트리밍, 200 이 아니면 HTTPException)"""
+    if not await is_public_http_url(url):
+        logger.warning(f"[proxy_image] 허용되지 않는 URL: {url}")
+        raise HTTPException(status_code=400, detail="허용되지 않는 이미지 URL 입니다.")
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            print(f"[proxy_image] 응답 성공: {response.status_code}")
-            return StreamingResponse(
-                response.aiter_bytes(),
-                media_type=response.headers.get("Content-Type", "image/jpeg"),
-            )
+        client = _get_client()
+        response = await client.send(client.build_request("GET", url), stream=True)
     except Exception as e:
-        print(f"[proxy_image] 요청 실패: {e}")
+        logger.warning(f"[proxy_image] 요청 실패: {e} url={url}")
         raise HTTPException(status_code=500, detail=f"이미지 로딩 실패: {e}")
 
+    if response.status_code != 200:
+        await response.aclose()
+        logger.warning(f"[proxy_image] 응답 오류: status={response.status_code} url={url}")
+        raise HTTPException(status_code=500, detail=f"이미지 로딩 실패: status={response.status_code}")
+    return response
+
+
+async def _wait_result(key: str) -> Any:
+    """같은 작업(URL 다운로드 / 변환본 생성)이 진행 중이면 결과를 기다림 (없거나 시간 초과면 None)"""
+    inflight = image_cache.inflight(key)
+    if inflight is None:
+        return None
+    try:
+        return await asyncio.wait_for(asyncio.shield(inflight), timeout=15.0)
+    except asyncio.TimeoutError:
+        return None
+
+
+async def _wait_inflight(url: str) -> Optional[CacheEntry]:
+    return await _wait_result(url)
+
+
+async def _source_entry(url: str) -> CacheEntry:
+    """변환본 생성을 위해 원본 전체를 캐시에 확보 (동시 요청은 한 번만 다운로드)"""
+    entry = image_cache.get(url)
+    if entry is None and await _wait_inflight(url) is not None:
+        # 기다리는 동안 정리됐을 수 있어 파일 존재까지 다시 확인 (없으면 새로 받음)
+        entry = image_cache.get(url)
+    if entry is not None:
+        return entry
+
+    future = image_cache.begin(url) if image_cache.inflight(url) is None else None
+    try:
+        response = await _open_source(url)
+        content_type = response.headers.get("Content-Type", "image/jpeg")
+        async for _ in _stream_and_store(url, response, content_type, None):
+            pass
+        entry = image_cache.get(url)
+    finally:
+        # 실패/취소돼도 대기 중인 요청이 남지 않도록 항상 정리
+        if future is not None:
+            image_cache.finish(url, entry, future)
+
+    if entry is None:
+        raise HTTPException(status_code=500, detail="이미지 로딩 실패: 캐시 저장 불가(용량 초과)")
+    return entry
+
+
+async def _serve_variant(request: Request, url: str, width: int, fmt: str) -> Response:
+    source = await _source_entry(url)
+    # 변환본 등록(add_variant)이 용량 정리를 부르므로 응답을 만들 때까지 원본 고정
+    image_cache.pin(source.hash)
+    try:
+        return await _variant_response(request, source, snap_width(width), fmt)
+    finally:
+        image_cache.unpin(source.hash)
+
+
+async def _variant_response(request: Request, source: CacheEntry, width: int, fmt: str) -> Response:
+    path = image_cache.variant_path(source.hash, width, fmt)
+
+    if not path.exists():
+        key = f"variant:{source.hash}:{width}:{fmt}"
+        if not await _wait_result(key) and not path.exists():
+            future = image_cache.begin(key)
+            rendered = None
+            try:
+                temp_path = await render_variant(
+                    image_cache.object_path(source.hash), image_cache.root / "tmp", width, fmt
+                )
+                if temp_path is not None:
+                    rendered = image_cache.add_variant(source.hash, temp_path, width, fmt)
+            finally:
+                image_cache.finish(key, rendered, future)
+            if rendered is None:
+                # 디코딩 불가 이미지 → 원본 그대로
+                return _serve_cached(request, source)
+
+    if not path.exists():
+        return _serve_cached(request, source)
+
+    etag = f'"{source.hash}-{width}.{fmt}"'
+    headers = {**_cache_headers(), "ETag": etag}
+    if etag in (tag.strip() for tag in request.headers.get("if-none-match", "").split(",")):
+        return Response(status_code=304, headers=headers)
+    return _PinnedFileResponse(source.hash, path, media_type=VARIANT_FORMATS[fmt], headers=headers)
+
+
+@router.get("/proxy-image")
+async def proxy_image(
+    request: Request,
+    url: str = Query(..., description="이미지 원본 URL"),
+    w: Optional[int] = Query(None, ge=1, le=4096, description="리사이즈 폭(px), 허용 폭 중 가장 가까운 값으로 맞춤"),
+    fmt: Optional[Literal["webp", "jpeg"]] = Query(None, description="변환 포맷"),
+):
+    # 0. 리사이즈/포맷 변환 요청
+    if w or fmt:
+        return await _serve_variant(request, url, w or max(settings.image_variant_widths), fmt or "webp")
+
+    # 1. 디스크 캐시 적중 → 원본 요청 없이 응답
+    entry = image_cache.get(url)
+    if entry is not None:
+        return _serve_cached(request, entry)
+
+    # 2. 같은 URL을 이미 받는 중이면 그 결과를 기다림 (실패/캐시 불가 시 직접 요청)
+    inflight = image_cache.inflight(url)
+    future: Optional[asyncio.Future] = None
+    if inflight is not None:
+        try:
+            entry = await asyncio.wait_for(asyncio.shield(inflight), timeout=15.0)
+        except asyncio.TimeoutError:
+            entry = None
+        # 기다리는 동안 정리됐을 수 있어 파일 존재까지 다시 확인
+        if entry is not None and (entry := image_cache.get(url)) is not None:
+            return _serve_cached(request, entry)
+    else:
+        future = image_cache.begin(url)
+
+    # 3. 원본 요청 → 스트리밍 전달 + 캐시 저장 (이후 inflight 정리는 스트림이 맡음)
+    handed_off = False
+    try:
+        response = await _open_source(url)
+        content_type = response.headers.get("Content-Type", "image/jpeg")
+        headers = _cache_headers()
+        if "Content-Length" in response.headers and "Content-Encoding" not in response.headers:
+            headers["Content-Length"] = response.headers["Content-Length"]
+        streaming = StreamingResponse(
+            _stream_and_store(url, response, content_type, future),
+            media_type=content_type,
+            headers=headers,
+            # 본문 전송 전에 연결이 끊겨 스트림이 시작되지 않은 경우 정리
+            background=BackgroundTask(_release_source, url, response, future),
+        )
+        handed_off = True
+        return streaming
+    finally:
+        if future is not None and not handed_off:
+            image_cache.finish(url, None, future)
+
+
+async def _release_source(url: str, response: httpx.Response, future: Optional[asyncio.Future]) -> None:
+    await response.aclose()
+    if future is not None:
+        image_cache.finish(url, None, future)
+
 
 #  OPTIONS 핸들러 추가
 @router.options("/proxy-image")
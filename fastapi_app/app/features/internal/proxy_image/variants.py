@@ -0,0 +1,94 @@
+# app/features/internal/proxy_image/variants.py
+"""
+이미지 프록시 리사이즈/포맷 변환 (Pillow)
+
+- 폭은 VARIANT_WIDTHS 중 요청값 이상인 가장 작은 값으로 맞춤 (캐시 조합 수 제한)
+- 원본보다 크게 늘리지 않음
+- settings.image_max_pixels 를 넘는 이미지는 디코딩하지 않음 (헤더만 읽고 거절)
+- 투명도가 있는 이미지(RGBA/LA/P+transparency)는 WebP 에서 알파 유지, JPEG 은 흰 배경에 합성
+- 디코딩/인코딩은 CPU 작업이라 전용 스레드 풀에서 실행
+"""
+
+import asyncio
+import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image, ImageOps
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Pillow 자체 압축 폭탄 검사도 같은 기준으로 (초과 2배 이상이면 DecompressionBombError)
+Image.MAX_IMAGE_PIXELS = settings.image_max_pixels
+
+VARIANT_FORMATS = {"webp": "image/webp", "jpeg": "image/jpeg"}
+
+_executor = ThreadPoolExecutor(max_workers=settings.image_variant_workers, thread_name_prefix="image-variant")
+
+
+def snap_width(width: int) -> int:
+    widths = sorted(settings.image_variant_widths)
+    for candidate in widths:
+        if width <= candidate:
+            return candidate
+    return widths[-1]
+
+
+def _has_alpha(img: Image.Image) -> bool:
+    return img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+
+
+def _convert_mode(img: Image.Image, fmt: str) -> Image.Image:
+    """포맷에 맞는 모드로 변환 (팔레트/투명 이미지를 RGB 로 바로 바꾸면 투명 영역이 검게 나옴)"""
+    if fmt == "webp":
+        if _has_alpha(img):
+            return img if img.mode == "RGBA" else img.convert("RGBA")
+        return img if img.mode in ("RGB", "L") else img.convert("RGB")
+
+    if _has_alpha(img):
+        rgba = img.convert("RGBA")
+        background = Image.new("RGB", rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
+    return img if img.mode in ("RGB", "L") else img.convert("RGB")
+
+
+def _render(src: Path, dest_dir: Path, width: int, fmt: str) -> Optional[str]:
+    """변환본을 임시 파일로 저장하고 경로를 반환 (디코딩 불가 이미지는 None)"""
+    try:
+        with Image.open(src) as img:
+            # Image.open 은 헤더만 읽음 → 픽셀 수 확인 후 디코딩
+            if img.width * img.height > settings.image_max_pixels:
+                logger.warning(f"[ImageVariant] 픽셀 수 초과로 변환 생략: {img.width}x{img.height} src={src}")
+                return None
+            # JPEG 은 필요한 크기 근처로 축소 디코딩 (회전 EXIF 대비 정사각형 기준)
+            img.draft("RGB", (width, width))
+            out_img = _convert_mode(ImageOps.exif_transpose(img), fmt)
+            if out_img.width > width:
+                height = max(1, round(out_img.height * width / out_img.width))
+                out_img = out_img.resize((width, height), Image.Resampling.LANCZOS)
+
+            with tempfile.NamedTemporaryFile(dir=dest_dir, delete=False) as out:
+                options = {"quality": settings.image_variant_quality}
+                if fmt == "webp":
+                    options["method"] = 4
+                else:
+                    options.update(optimize=True, progressive=True)
+                out_img.save(out, format=fmt.upper(), **options)
+                return out.name
+    except Exception as e:
+        logger.warning(f"[ImageVariant] 변환 실패: {e} src={src}")
+        return None
+
+
+async def render_variant(src: Path, dest_dir: Path, width: int, fmt: str) -> Optional[str]:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, _render, src, dest_dir, width, fmt)
+
+
+def shutdown_executor() -> None:
+    _executor.shutdown(wait=False, cancel_futures=True)
@@ -6,6 +6,7 @@ from playwright.async_api import async_playwright
 from app.common.constants.category import CATEGORY_MAP
 from app.common.logger import get_logger
 from app.common.utils.text_utils import clean_text
+from app.core.config import settings
 
 logger = get_logger(__name__)
 
@@ -22,7 +23,7 @@ async def scrape_titles() -> list[dict]:
             query = f"{display_name} 숏텐츠"
 
             url = (
-                f"https://search.naver.com/search.naver?"
+                f"{settings.naver_search_base_url}/search.naver?"
                 f"category={display_name}&query={query}"
                 f"&sm=svc_clk.entnewsmore&ssc=tab.shortents.all"
             )
@@ -14,6 +14,31 @@ from app.features.internal.fetch_article.scraper.playwright_browser import (
 from app.features.internal.fetch_article.scraper.playwright_browser import (
     recycle_browser as pw_shutdown,  # 서버 종료 시 정리
 )
+from app.features.internal.fetch_image.image_validator import close_probe_client
+from app.features.internal.fetch_image.kakao_client import close_kakao_client
+from app.features.internal.generate_clova_post.jobs import (
+    start_workers as start_generation_workers,
+)
+from app.features.internal.generate_clova_post.jobs import (
+    stop_workers as stop_generation_workers,
+)
+from app.features.internal.generate_clova_post.log_buffer import (
+    start_flusher as start_clova_log_flusher,
+)
+from app.features.internal.generate_clova_post.log_buffer import (
+    stop_flusher as stop_clova_log_flusher,
+)
+from app.features.internal.generate_clova_post.pregenerate import (
+    close_budget_store as close_pregeneration_budget,
+)
+from app.features.internal.keyword_popularity.snapshotter import (
+    start_snapshotter as start_popularity_snapshotter,
+)
+from app.features.internal.keyword_popularity.snapshotter import (
+    stop_snapshotter as stop_popularity_snapshotter,
+)
+from app.features.internal.proxy_image.router import close_proxy_client
+from app.features.internal.proxy_image.variants import shutdown_executor
 
 # 배포 경로 기준 (필요 시 조정)
 # - 로컬에서는 .local.env를 사용하고, 프로드는 .prod.env를 사용하는 구조라면
@@ -51,8 +76,14 @@ async def _on_startup():
             # 예열 실패해도 서버 기동은 진행 (로그는 내부에서 남음)
             pass
 
+    # Clova 생성 잡 워커 풀 + 로그 버퍼 flusher
+    start_generation_workers()
+    start_clova_log_flusher()
+
     if SCHEDULER_ENABLED:
         await _scheduler.start()
+        # 키워드 인기도 스냅샷 (스케줄러를 켠 인스턴스에서만)
+        start_popularity_snapshotter()
 
 
 @app.on_event("shutdown")
@@ -63,12 +94,49 @@ async def _on_shutdown():
     except Exception:
         pass
 
+    # 인기도 스냅샷 정지
+    try:
+        await stop_popularity_snapshotter()
+    except Exception:
+        pass
+
+    # 생성 잡 워커 정지
+    try:
+        await stop_generation_workers()
+    except Exception:
+        pass
+
+    # 사전 생성 예산 카운터(Redis) 연결 정리
+    try:
+        await close_pregeneration_budget()
+    except Exception:
+        pass
+
+    # 남은 Clova 로그 전송 (실패 시 디스크에 저장, 다음 기동 시 복구)
+    try:
+        await stop_clova_log_flusher()
+    except Exception:
+        pass
+
     # Playwright 브라우저/핸들 정리
     try:
         await pw_shutdown()
     except Exception:
         pass
 
+    # Kakao 커넥션 풀 / 검색 결과 캐시 연결 정리
+    try:
+        await close_kakao_client()
+        await close_probe_client()
+    except Exception:
+        pass
+
+    try:
+        await close_proxy_client()
+        shutdown_executor()
+    except Exception:
+        pass
+
 
 @app.get("/")
 def read_root():
@@ -0,0 +1,128 @@
+# 녹화된 HTML 코퍼스로 본문 추출기 오프라인 벤치마크
+#
+# 사용법 (fastapi_app 디렉터리에서):
+#   python -m scripts.bench_extraction [--corpus corpus/html] [--repeat 3] [--concurrency 1] [--json out.json]
+#
+# 출력: 도메인별 페이지 수, 성공률, p50/p95 지연(ms), 전체 pages/sec, 메모리(파이썬 힙 피크 / 프로세스 RSS)
+# 네트워크 접근 없이 HAR 재생으로만 동작하므로 스크래퍼 변경 전후를 같은 조건에서 비교할 수 있습니다.
+import argparse
+import asyncio
+import json
+import resource
+import statistics
+import time
+import tracemalloc
+from collections import defaultdict
+
+from app.features.internal.fetch_article.scraper.blog_scraper import (
+    extract_blog_content,
+)
+from app.features.internal.fetch_article.scraper.html_corpus import (
+    DEFAULT_CORPUS_DIR,
+    CorpusEntry,
+    load_manifest,
+    replaying,
+)
+from app.features.internal.fetch_article.scraper.news_scraper import (
+    extract_news_content,
+)
+from app.features.internal.fetch_article.scraper.playwright_browser import (
+    get_browser,
+    recycle_browser,
+)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+async def run_one(entry: CorpusEntry, corpus_dir: str) -> tuple[CorpusEntry, float, bool]:
+    extract = extract_news_content if entry.kind == "news" else extract_blog_content
+    started = time.perf_counter()
+    async with replaying(entry.url, corpus_dir):
+        content = await extract(entry.url, entry.keyword)
+    return entry, (time.perf_counter() - started) * 1000, bool(content)
+
+
+async def bench(corpus_dir: str, repeat: int, concurrency: int) -> dict:
+    entries = load_manifest(corpus_dir)
+    if not entries:
+        raise SystemExit(f"코퍼스가 비어 있습니다: {corpus_dir} (scripts.record_html_corpus 로 먼저 녹화하세요)")
+
+    await get_browser()  # 브라우저 기동 시간은 측정에서 제외
+    sem = asyncio.Semaphore(concurrency)
+
+    async def guarded(entry: CorpusEntry):
+        async with sem:
+            return await run_one(entry, corpus_dir)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        results = await asyncio.gather(*(guarded(e) for _ in range(repeat) for e in entries))
+    finally:
+        elapsed = time.perf_counter() - started
+        _, peak_py = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        await recycle_browser()
+
+    by_domain: dict[str, dict] = defaultdict(lambda: {"latencies": [], "ok": 0, "total": 0})
+    for entry, ms, ok in results:
+        stat = by_domain[entry.domain]
+        stat["latencies"].append(ms)
+        stat["total"] += 1
+        stat["ok"] += int(ok)
+
+    all_latencies = [ms for _, ms, _ in results]
+    return {
+        "pages": len(results),
+        "elapsed_sec": round(elapsed, 3),
+        "pages_per_sec": round(len(results) / elapsed, 3) if elapsed else 0.0,
+        "p50_ms": round(statistics.median(all_latencies), 1),
+        "p95_ms": round(percentile(all_latencies, 95), 1),
+        "success_rate": round(sum(ok for _, _, ok in results) / len(results), 3),
+        "python_heap_peak_mb": round(peak_py / 1024 / 1024, 2),
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 2),
+        "domains": {
+            domain: {
+                "pages": stat["total"],
+                "success_rate": round(stat["ok"] / stat["total"], 3),
+                "p50_ms": round(statistics.median(stat["latencies"]), 1),
+                "p95_ms": round(percentile(stat["latencies"], 95), 1),
+            }
+            for domain, stat in sorted(by_domain.items())
+        },
+    }
+
+
+def print_report(report: dict) -> None:
+    print(f"{'domain':<24}{'pages':>7}{'success':>9}{'p50(ms)':>10}{'p95(ms)':>10}")
+    for domain, stat in report["domains"].items():
+        print(
+            f"{domain:<24}{stat['pages']:>7}{stat['success_rate']:>9.0%}{stat['p50_ms']:>10.1f}{stat['p95_ms']:>10.1f}"
+        )
+    print("-" * 60)
+    print(
+        f"total pages={report['pages']} pages/sec={report['pages_per_sec']} "
+        f"p50={report['p50_ms']}ms p95={report['p95_ms']}ms success={report['success_rate']:.0%}"
+    )
+    print(f"python heap peak={report['python_heap_peak_mb']}MB max rss={report['max_rss_mb']}MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTML 코퍼스 기반 본문 추출 벤치마크")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS_DIR, help="코퍼스 디렉터리")
+    parser.add_argument("--repeat", type=int, default=1, help="페이지별 반복 횟수")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시 추출 개수")
+    parser.add_argument("--json", dest="json_path", help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    report = asyncio.run(bench(args.corpus, args.repeat, args.concurrency))
+    print_report(report)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,284 @@
+# /generate-clova-post 생성 경로 단계별 지연 벤치마크 (Django 실 서버 + 대역 Clova)
+#
+# 사용법 (fastapi_app 디렉터리에서):
+#   # 0) Django 에 벤치 데이터 시드 (django_app 디렉터리에서, 마지막 줄의 id 목록을 그대로 넘김)
+#   python manage.py seed_bench_data --keywords 50 --users 5 --reset
+#
+#   # 1) 같은 프로세스에서 process_clova_generation 을 동시 실행 (대역 Clova 는 이 스크립트가 띄움)
+#   python -m scripts.bench_generation --keyword-ids 1-50 --user-ids 1-5 [--requests 250] [--concurrency 10] \
+#       [--clova-latency 800:2500] [--clova-decode 0] [--clova-error-rate 0] [--clova-url http://localhost:9100] \
+#       [--clova-repair on] [--django-url http://localhost:8000] [--json bench.json] [--baseline prev.json] [--fail-on-regression 20]
+#
+#   --clova-latency       대역 Clova 지연 "p50:p99" (ms) - scripts.fake_providers 를 같은 이벤트 루프에서 실행
+#   --clova-repair        생성 결과 검증 후 단락 보충 on/off (settings.clova_repair_enabled 를 덮어씀, 결과에 함께 출력)
+#   --clova-url           이미 떠 있는 대역 서버(또는 실제 Clova)를 쓸 때 (이때 --clova-* 지연 옵션은 무시)
+#   --baseline            이전 결과 JSON 과 단계별 p50/p95/p99 비교 출력
+#   --fail-on-regression  어느 단계든 p95 가 baseline 보다 N% 넘게 늘면 종료 코드 1
+#
+# 단계 (서비스 모듈이 import 한 이름을 감싸서 호출별 지연 측정):
+#   context  기존 글 확인(preview) + 기사/이미지 조회 - generation/context/ 1회 왕복으로 합쳐져 있어 한 단계로 잼
+#   clova    Clova 생성 (대기열 대기 + 호출 + 검증/보충 + HTML 변환)
+#   save     글 저장 커밋 (generation/commit/)
+#   log      Clova 로그 일괄 저장 (clova-log/bulk/, 요청 경로 밖에서 flusher 가 batch 단위로 호출)
+#   e2e      요청 1건 전체 (process_clova_generation)
+#
+# 같은 keyword/user 조합은 기존 글을 돌려주므로(from_cache) 조합 수(keyword × user)보다 많이 보내면 캐시 응답이 섞임
+# → 매 실행 전 seed_bench_data --reset 으로 생성 글을 지우면 같은 조건으로 비교 가능
+import argparse
+import asyncio
+import importlib
+import json
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from app.common import metrics
+from app.core.config import settings
+from scripts.load_pipeline import Recorder, percentile
+
+PROBES = [
+    ("app.features.internal.generate_clova_post.service", "fetch_generation_context", "context"),
+    ("app.features.internal.generate_clova_post.service", "generate_clova_post", "clova"),
+    ("app.features.internal.generate_clova_post.service", "commit_generation", "save"),
+    ("app.features.internal.generate_clova_post.log_buffer", "send_clova_logs_bulk", "log"),
+]
+STAGES = ("context", "clova", "save", "log", "e2e")
+PERCENTILES = (50, 95, 99)
+
+
+class StageRecorder(Recorder):
+    def install(self) -> None:
+        for module_name, attr, stage in PROBES:
+            module = importlib.import_module(module_name)
+            setattr(module, attr, self.timed(stage, getattr(module, attr)))
+
+    def summary(self, total_sec: float) -> dict:  # type: ignore[override]
+        stages = {}
+        for stage in STAGES:
+            values = self.latencies.get(stage, [])
+            row: Dict[str, float] = {"calls": len(values), "failures": self.failures.get(stage, 0)}
+            for pct in PERCENTILES:
+                row[f"p{pct}_ms"] = round(percentile(values, pct), 1)
+            row["max_ms"] = round(max(values), 1) if values else 0.0
+            row["calls_per_sec"] = round(len(values) / total_sec, 2) if total_sec else 0.0
+            stages[stage] = row
+        return stages
+
+
+def parse_ids(value: str) -> List[int]:
+    """ "1-3,7" → [1, 2, 3, 7] (seed_bench_data 출력 형식)"""
+    ids: List[int] = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-")
+            ids.extend(range(int(start), int(end) + 1))
+        else:
+            ids.append(int(part))
+    return ids
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ---------- 대역 Clova ----------
+async def start_fake_clova(port: int, latency: str, decode: float, error_rate: float):
+    """scripts.fake_providers 를 같은 이벤트 루프에서 실행하고 (server, task) 반환"""
+    import uvicorn
+
+    from scripts import fake_providers
+
+    p50, p99 = latency.split(":")
+    fake_providers.CONFIG.latency_ms["clova"] = (float(p50), float(p99))
+    fake_providers.CONFIG.clova_decode_ms_per_token = decode
+    fake_providers.CONFIG.error_rate["clova"] = error_rate
+
+    server = uvicorn.Server(uvicorn.Config(fake_providers.app, host="127.0.0.1", port=port, log_level="warning"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.05)
+    return server, task
+
+
+# ---------- 실행 ----------
+async def run_bench(args) -> dict:
+    from app.features.internal.generate_clova_post import log_buffer
+    from app.features.internal.generate_clova_post.schema import (
+        GenerateClovaPostRequest,
+    )
+    from app.features.internal.generate_clova_post.service import (
+        process_clova_generation,
+    )
+
+    keyword_ids, user_ids = parse_ids(args.keyword_ids), parse_ids(args.user_ids)
+    requests = args.requests or len(keyword_ids) * len(user_ids)
+
+    fake = None
+    if args.clova_url:
+        settings.clova_chat_base_url = args.clova_url
+    else:
+        fake = await start_fake_clova(args.fake_port, args.clova_latency, args.clova_decode, args.clova_error_rate)
+        settings.clova_chat_base_url = f"http://127.0.0.1:{args.fake_port}"
+    if args.django_url:
+        settings.django_api_url = args.django_url
+    # 보충 호출 여부에 따라 clova 단계 지연이 달라지므로 실행마다 명시
+    settings.clova_repair_enabled = args.clova_repair == "on"
+
+    recorder = StageRecorder()
+    recorder.install()
+    metrics.reset()
+    log_buffer.start_flusher()
+
+    outcomes: Dict[str, int] = defaultdict(int)
+    sem = asyncio.Semaphore(args.concurrency)
+
+    async def one(i: int) -> None:
+        # keyword 를 먼저 돌리고 한 바퀴마다 user 를 바꿔 (keyword, user) 조합이 겹치지 않게 함
+        payload = GenerateClovaPostRequest(
+            keyword_id=keyword_ids[i % len(keyword_ids)],
+            user_id=user_ids[(i // len(keyword_ids)) % len(user_ids)],
+        )
+        async with sem:
+            started = time.perf_counter()
+            try:
+                result = await process_clova_generation(payload)
+                outcomes[f"{result.status}(cached)" if result.from_cache else result.status] += 1
+            except Exception as e:
+                recorder.failures["e2e"] += 1
+                outcomes[type(e).__name__] += 1
+            recorder.latencies["e2e"].append((time.perf_counter() - started) * 1000)
+
+    started_at = datetime.now(timezone.utc).isoformat()
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        total_sec = time.perf_counter() - started
+        # 남은 로그까지 전송해 log 단계에 포함 (전송 실패분은 spill 파일로)
+        await log_buffer.stop_flusher()
+    finally:
+        if fake is not None:
+            server, task = fake
+            server.should_exit = True
+            await task
+
+    generated = outcomes.get("success", 0)
+    return {
+        "started_at": started_at,
+        "git_commit": _git_commit(),
+        "config": {
+            "requests": requests,
+            "concurrency": args.concurrency,
+            "keywords": len(keyword_ids),
+            "users": len(user_ids),
+            "clova": args.clova_url or {"latency": args.clova_latency, "decode_ms_per_token": args.clova_decode},
+            "clova_generation_mode": settings.clova_generation_mode,
+            "clova_concurrency": settings.clova_concurrency,
+            "clova_qps": settings.clova_qps,
+            "clova_hedge_enabled": settings.clova_hedge_enabled,
+            "clova_repair_enabled": settings.clova_repair_enabled,
+        },
+        "total_sec": round(total_sec, 2),
+        "requests_per_sec": round(requests / total_sec, 3),
+        "generated_per_sec": round(generated / total_sec, 3),
+        "outcomes": dict(outcomes),
+        "stages": recorder.summary(total_sec),
+        "metrics": metrics.snapshot(),
+    }
+
+
+# ---------- 출력 / 비교 ----------
+def print_table(stages: Dict[str, dict]) -> None:
+    print(f"\n{'stage':<10}{'calls':>8}{'fail':>6}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}{'calls/s':>10}")
+    for stage, row in stages.items():
+        print(
+            f"{stage:<10}{row['calls']:>8}{row['failures']:>6}{row['p50_ms']:>10}{row['p95_ms']:>10}"
+            f"{row['p99_ms']:>10}{row['max_ms']:>10}{row['calls_per_sec']:>10}"
+        )
+
+
+def compare(result: dict, baseline: dict) -> Dict[str, float]:
+    """baseline 대비 단계별 변화 출력, p95 가 늘어난 비율(%)을 단계별로 반환"""
+    print(f"\n== baseline 비교 ({baseline.get('git_commit')} {baseline.get('started_at', '')[:19]})")
+    print(f"{'stage':<10}" + "".join(f"{f'p{pct}':>22}" for pct in PERCENTILES))
+    regressions = {}
+    for stage, row in result["stages"].items():
+        base = baseline.get("stages", {}).get(stage)
+        if not base or not row["calls"] or not base.get("calls"):
+            continue
+        cells = []
+        for pct in PERCENTILES:
+            key = f"p{pct}_ms"
+            before, after = base.get(key, 0.0), row[key]
+            change = (after - before) / before * 100 if before else 0.0
+            cells.append(f"{before:>8}→{after:<8}{change:+5.0f}%")
+            if pct == 95:
+                regressions[stage] = change
+        print(f"{stage:<10}" + "".join(f"{cell:>22}" for cell in cells))
+    print(f"throughput {baseline.get('requests_per_sec')} → {result['requests_per_sec']} req/s")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="/generate-clova-post 단계별 지연 벤치마크")
+    parser.add_argument("--keyword-ids", required=True, help='벤치 keyword id 목록 (예: "1-50" 또는 "1,2,3")')
+    parser.add_argument("--user-ids", required=True, help='벤치 user id 목록 (예: "1-5")')
+    parser.add_argument("--requests", type=int, default=0, help="요청 수 (기본: keyword 수 × user 수)")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 사용자 수")
+    parser.add_argument("--clova-latency", default="800:2500", help='대역 Clova 지연 "p50:p99" (ms)')
+    parser.add_argument(
+        "--clova-decode", type=float, default=0.0, help="대역 Clova 출력 토큰(maxTokens)당 추가 지연(ms)"
+    )
+    parser.add_argument("--clova-error-rate", type=float, default=0.0, help="대역 Clova 5xx 응답 비율")
+    parser.add_argument("--fake-port", type=int, default=9150, help="대역 Clova 포트")
+    parser.add_argument("--clova-url", default=None, help="대역 Clova 대신 사용할 Clova base URL")
+    parser.add_argument(
+        "--clova-repair", choices=("on", "off"), default="on", help="생성 결과 검증 후 단락 보충 (clova_repair_enabled)"
+    )
+    parser.add_argument("--django-url", default=None, help="Django base URL (기본: settings.django_api_url)")
+    parser.add_argument("--json", default=None, help="결과를 JSON 파일로 저장")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--fail-on-regression", type=float, default=None, help="p95 가 N%% 넘게 늘면 종료 코드 1")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_bench(args))
+    config = result["config"]
+    print(
+        f"\nmode={config['clova_generation_mode']} clova_concurrency={config['clova_concurrency']} "
+        f"hedge={config['clova_hedge_enabled']} repair={config['clova_repair_enabled']} "
+        f"repair_calls={result['metrics'].get('counters', {}).get('clova_repair_calls', 0)}"
+    )
+    print(
+        f"\ntotal={result['total_sec']}s requests/s={result['requests_per_sec']} "
+        f"generated/s={result['generated_per_sec']} outcomes={result['outcomes']}"
+    )
+    print_table(result["stages"])
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(result, json.load(f))
+        if args.fail_on_regression is not None:
+            worse = {stage: change for stage, change in regressions.items() if change > args.fail_on_regression}
+            if worse:
+                print(f"\n[REGRESSION] p95 {args.fail_on_regression}% 초과 증가: {worse}")
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# html_utils 정제 함수 정합성 검사 + 마이크로벤치마크
+#
+# 사용법 (fastapi_app 디렉터리에서):
+#   python -m scripts.bench_html_clean [--fuzz 5000] [--number 200] [--files samples/*.txt]
+#
+# 1) 골든 샘플 + 랜덤 생성 입력(+ --files 로 지정한 실제 기사 원문)에 대해
+#    clean_html / clean_article_content 결과가
+#    기존 BeautifulSoup 구현(_clean_*_reference)과 완전히 같은지 확인합니다.
+#    마크업이 있는 본문은 lxml 로 파싱하므로, 태그가 깨진 랜덤 입력은 파서 차이로 줄바꿈 위치가 다를 수 있어
+#    차이 건수만 출력합니다 (골든 샘플 / --files 본문은 완전히 같아야 함).
+# 2) 제목/평문 본문/마크업 본문 각각의 호출당 소요 시간(µs)을 기존 구현과 비교합니다.
+import argparse
+import random
+import sys
+import timeit
+
+from app.common.utils.html_utils import (
+    _clean_article_content_reference,
+    _clean_html_reference,
+    clean_article_content,
+    clean_html,
+)
+
+GOLDEN_TITLES = [
+    "손흥민, 시즌 10호골 폭발",
+    "<b>손흥민</b> 결승골… 토트넘 3연승",
+    "&quot;역대급&quot; <b>성수동</b> 팝업 &amp; 맛집 정리",
+    "R&B 가수 컴백 &lt;신곡&gt; 공개",
+    "&#39;<b>뉴진스</b>&#x27; 신곡 &apos;차트 1위&apos;",
+    "a < b 그리고 c > d",
+    "<i>기울임</i> <b>굵게</b>",
+    "&amp",
+    "",
+]
+
+GOLDEN_BODIES = [
+    "첫 줄\n\n   둘째 줄   \r\n\t셋째 줄 넷째 줄\x0b",
+    "  \n \n",
+    "<article><p>본문 1</p><script>x()</script><p>본문 2</p></article>",
+    "<div class='content'><h1>제목</h1><nav>메뉴</nav>내용 &amp; 설명</div>",
+    "<header>헤더</header><p>문단</p><footer>푸터</footer>",
+    "R&B 기사 본문\n다음 줄",
+    "<!DOCTYPE html><html><head><title>제목</title></head><body><header>헤더</header>"
+    "<div class='news content'>본문<br>둘째 &nbsp;줄<!-- 주석 -->끝</div></body></html>",
+    "<div><p>문단</p>꼬리<script>x()</script>이어지는 글</div>",
+    "<table><tr><td>표 1</td><td>표 2</td></tr></table><p>R&B &lt;신곡&gt;</p>",
+    "<article><h2>소제목</h2><p>본문 <a href='#'>링크</a> 이어짐</p></article><article>둘째 기사</article>",
+]
+
+PLAIN_BODY = "\n".join(f"  {i}번째 문단입니다. 기사 본문 내용이 이어집니다.  \n" for i in range(200))
+MARKUP_BODY = "<article>" + "".join(f"<p>{i}번째 문단 &amp; 내용</p>\n" for i in range(200)) + "</article>"
+
+ALPHABET = [
+    "가",
+    "a",
+    " ",
+    "\n",
+    "\r",
+    "\t",
+    "\x0c",
+    "\u2028",
+    "<b>",
+    "</b>",
+    "<p>",
+    "&amp;",
+    "&quot;",
+    "&",
+    "<",
+    ">",
+    "#",
+]
+
+
+def random_input(rng: random.Random) -> str:
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 40)))
+
+
+def check_parity(fuzz: int, files: list[str]) -> int:
+    rng = random.Random(0)
+    titles = GOLDEN_TITLES + [random_input(rng) for _ in range(fuzz)]
+    bodies = GOLDEN_BODIES + [PLAIN_BODY, MARKUP_BODY]
+    fuzz_bodies = [random_input(rng) for _ in range(fuzz)]
+    for path in files:
+        with open(path, encoding="utf-8") as f:
+            bodies.append(f.read())
+
+    failures = 0
+    for text in titles:
+        if clean_html(text) != _clean_html_reference(text):
+            failures += 1
+            print(f"[MISMATCH] clean_html {text!r}")
+    for text in bodies:
+        expected = _clean_article_content_reference(text)
+        if clean_article_content(text) != expected:
+            failures += 1
+            print(f"[MISMATCH] clean_article_content {text[:80]!r}")
+    # 랜덤 본문: 마크업이 없으면 완전히 같아야 하고, 깨진 마크업은 파서 차이 건수만 집계
+    parser_diffs = 0
+    for text in fuzz_bodies:
+        if clean_article_content(text) == _clean_article_content_reference(text):
+            continue
+        if "<" in text or "&" in text:
+            parser_diffs += 1
+        else:
+            failures += 1
+            print(f"[MISMATCH] clean_article_content {text[:80]!r}")
+
+    print(
+        f"정합성: 제목 {len(titles)}건, 본문 {len(bodies) + len(fuzz_bodies)}건, 불일치 {failures}건 "
+        f"(깨진 마크업 파서 차이 {parser_diffs}건)"
+    )
+    return failures
+
+
+def bench(number: int) -> None:
+    cases = [
+        ("title(<b>)", GOLDEN_TITLES[1], clean_html, _clean_html_reference),
+        ("body(plain)", PLAIN_BODY, clean_article_content, _clean_article_content_reference),
+        ("body(markup)", MARKUP_BODY, clean_article_content, _clean_article_content_reference),
+    ]
+    print(f"\n{'case':<16}{'new(µs)':>12}{'old(µs)':>12}{'speedup':>10}")
+    for name, text, new, old in cases:
+        t_new = timeit.timeit(lambda: new(text), number=number) / number * 1e6
+        t_old = timeit.timeit(lambda: old(text), number=number) / number * 1e6
+        print(f"{name:<16}{t_new:>12.1f}{t_old:>12.1f}{t_old / t_new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTML 정제 정합성 검사 및 벤치마크")
+    parser.add_argument("--fuzz", type=int, default=2000, help="랜덤 생성 입력 개수")
+    parser.add_argument("--number", type=int, default=200, help="벤치마크 반복 횟수")
+    parser.add_argument("--files", nargs="*", default=[], help="추가로 비교할 기사 원문 파일")
+    args = parser.parse_args()
+
+    if check_parity(args.fuzz, args.files):
+        sys.exit(1)
+    bench(args.number)
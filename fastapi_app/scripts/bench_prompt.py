@@ -0,0 +1,153 @@
+# 기사 추출 요약 전후 프롬프트 크기 / Clova 지연 벤치마크
+#
+# 사용법 (fastapi_app 디렉터리에서):
+#   # Django 에 저장된 기사로 (content vs condensed_content)
+#   python -m scripts.bench_prompt --keyword-ids 1,2,3 [--clova] [--repeat 2] [--json out.json]
+#
+#   # JSON Lines 파일({"title", "content"} 한 줄에 하나)로 오프라인 측정
+#   python -m scripts.bench_prompt --articles articles.jsonl [--budget 1200] [--clova]
+#
+#   --clova  각 프롬프트로 chat-completions 를 실제 호출해 지연 / promptTokens 비교
+#            (CLOVA_CHAT_BASE_URL 을 scripts.fake_providers 로 바꾸고 --clova-prefill 을 주면 오프라인 재현 가능)
+#
+# 출력: 기사별 프롬프트 글자 수 / 추정 토큰 / 요약 시간(ms), --clova 시 variant 별 p50/p99 지연과 promptTokens 평균
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+import httpx
+
+from app.core.config import settings
+from app.features.internal.django_client import fetch_article_with_images
+from app.features.internal.generate.clova_client import _clova_request
+from app.features.internal.generate_clova_post.condenser import (
+    condense,
+    estimate_tokens,
+)
+from app.features.internal.generate_clova_post.prompt_builder import build_prompt
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+async def load_articles(keyword_ids: Optional[str], articles_path: Optional[str]) -> List[dict]:
+    if articles_path:
+        with open(articles_path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    if not keyword_ids:
+        raise ValueError("--keyword-ids 또는 --articles 중 하나가 필요합니다.")
+    articles = []
+    for keyword_id in [int(k) for k in keyword_ids.split(",")]:
+        data = await fetch_article_with_images(keyword_id)
+        articles.append({"keyword_id": keyword_id, **data})
+    return articles
+
+
+async def call_clova(client: httpx.AsyncClient, prompt: str) -> tuple[float, Optional[int]]:
+    url, headers, body = _clova_request(prompt, uuid4().hex, stream=False)
+    started = time.perf_counter()
+    response = await client.post(url, headers=headers, json=body)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    response.raise_for_status()
+    result = response.json().get("result") or {}
+    prompt_tokens = (result.get("usage") or {}).get("promptTokens") or result.get("inputLength")
+    return elapsed_ms, prompt_tokens
+
+
+async def bench(articles: List[dict], budget: int, use_clova: bool, repeat: int) -> dict:
+    rows = []
+    clova: Dict[str, Dict[str, list]] = {v: {"latency_ms": [], "prompt_tokens": []} for v in ("full", "condensed")}
+
+    async with httpx.AsyncClient(timeout=120) as client:
+        for article in articles:
+            title, content = article["title"], article["content"]
+            started = time.perf_counter()
+            condensed = condense(content, title, token_budget=budget)
+            condense_ms = (time.perf_counter() - started) * 1000
+
+            prompts = {"full": build_prompt(title, content), "condensed": build_prompt(title, condensed)}
+            rows.append(
+                {
+                    "title": title[:20],
+                    "full_chars": len(prompts["full"]),
+                    "condensed_chars": len(prompts["condensed"]),
+                    "full_tokens": estimate_tokens(prompts["full"]),
+                    "condensed_tokens": estimate_tokens(prompts["condensed"]),
+                    "condense_ms": round(condense_ms, 2),
+                    # Django 에 미리 저장된 요약이 있으면 같은지 확인 (설정 변경 후 재계산 필요 여부)
+                    "stored_matches": (
+                        article.get("condensed_content") == condensed if "condensed_content" in article else None
+                    ),
+                }
+            )
+
+            if use_clova:
+                for _ in range(repeat):
+                    for variant, prompt in prompts.items():
+                        latency, tokens = await call_clova(client, prompt)
+                        clova[variant]["latency_ms"].append(latency)
+                        if tokens:
+                            clova[variant]["prompt_tokens"].append(tokens)
+
+    summary = {
+        "articles": len(rows),
+        "budget": budget,
+        "prompt_tokens_mean": {
+            "full": round(statistics.mean(r["full_tokens"] for r in rows), 1),
+            "condensed": round(statistics.mean(r["condensed_tokens"] for r in rows), 1),
+        },
+        "condense_ms_p99": round(percentile([r["condense_ms"] for r in rows], 99), 2),
+    }
+    if use_clova:
+        summary["clova"] = {
+            variant: {
+                "calls": len(data["latency_ms"]),
+                "p50_ms": round(percentile(data["latency_ms"], 50), 1),
+                "p99_ms": round(percentile(data["latency_ms"], 99), 1),
+                "prompt_tokens_mean": (
+                    round(statistics.mean(data["prompt_tokens"]), 1) if data["prompt_tokens"] else None
+                ),
+            }
+            for variant, data in clova.items()
+        }
+    return {"rows": rows, "summary": summary}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="기사 추출 요약 전후 프롬프트 크기 / Clova 지연 벤치마크")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--keyword-ids", help="Django 에서 기사를 가져올 keyword id 목록 (쉼표 구분)")
+    source.add_argument("--articles", help='{"title", "content"} JSON Lines 파일')
+    parser.add_argument("--budget", type=int, default=settings.article_token_budget)
+    parser.add_argument("--clova", action="store_true", help="Clova 를 실제 호출해 지연 비교")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--json", default=None, help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    articles = asyncio.run(load_articles(args.keyword_ids, args.articles))
+    result = asyncio.run(bench(articles, args.budget, args.clova, args.repeat))
+
+    print(f"{'title':<22}{'chars':>14}{'tokens(est)':>16}{'condense_ms':>13}")
+    for row in result["rows"]:
+        print(
+            f"{row['title']:<22}{row['full_chars']:>6} → {row['condensed_chars']:<6}"
+            f"{row['full_tokens']:>7} → {row['condensed_tokens']:<6}{row['condense_ms']:>13}"
+        )
+    print(json.dumps(result["summary"], ensure_ascii=False, indent=2))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,446 @@
+# 부하 테스트용 외부 API 대역 서버 (네이버 검색 / Kakao 이미지 검색 / Clova chat-completions, SSE 스트림 포함)
+#
+# 사용법 (fastapi_app 디렉터리에서):
+#   python -m scripts.fake_providers [--port 9100] \
+#       [--latency naver=80:400,kakao=60:300,clova=3000:9000,page=150:800] \
+#       [--error-rate 0.01 | kakao=0.05,clova=0.02] [--throttle-rate kakao=0.02] [--clova-prefill 400] [--clova-decode 2] [--seed 42]
+#
+#   --latency       제공자별 "p50:p99" (ms). 로그정규분포로 지연을 뽑아 응답 전에 대기
+#   --error-rate    제공자별 5xx 응답 비율 (숫자 하나면 전체 공통)
+#   --throttle-rate 제공자별 429(쿼터 초과) 응답 비율
+#   --clova-prefill Clova 프롬프트 1,000자당 추가 지연(ms) - 프롬프트 길이에 따른 지연 차이 재현용
+#   --clova-decode  Clova 출력 토큰 1개당 추가 지연(ms), 실제 응답 본문 토큰 수(maxTokens 이하)만큼 - 출력 길이에 따른 지연 재현용
+#
+# 앱은 아래처럼 base URL 을 이 서버로 바꿔서 실행합니다 (.env 또는 환경 변수):
+#   NAVER_OPENAPI_BASE_URL=http://localhost:9100
+#   NAVER_SEARCH_BASE_URL=http://localhost:9100
+#   NAVER_BLOG_BASE_URL=http://localhost:9100/blog
+#   KAKAO_API_BASE_URL=http://localhost:9100
+#   CLOVA_CHAT_BASE_URL=http://localhost:9100
+#
+# 응답 본문은 실제 API 형식을 따르고, 기사/블로그 본문에는 검색어를 넣어 관련성 필터를 통과하게 합니다.
+# GET /__stats 로 제공자별 요청 수 / 주입한 오류 수를 확인할 수 있습니다.
+import argparse
+import asyncio
+import json
+import math
+import random
+import struct
+import zlib
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from html import escape
+from typing import Dict, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+
+PROVIDERS = ("naver", "kakao", "clova", "page")
+
+DEFAULT_LATENCY_MS = {
+    "naver": (80.0, 400.0),
+    "kakao": (60.0, 300.0),
+    "clova": (3000.0, 9000.0),
+    "page": (150.0, 800.0),
+}
+
+SUBJECTS = ["아이유", "손흥민", "뉴진스", "삼성전자", "카카오", "제주도", "한강", "서울시", "부산", "챗봇"]
+TOPICS = ["신곡 발표", "경기 결과", "실적 발표", "축제 개막", "신제품 공개", "여행 코스", "할인 행사", "기자회견"]
+
+PARAGRAPHS = [
+    "{q} 소식이 전해지면서 관련 커뮤니티와 SNS 에서 큰 관심을 모으고 있다. 업계 관계자는 이번 발표가 향후 흐름에 적지 않은 영향을 줄 것으로 내다봤다.",
+    "특히 {q} 와 관련해 현장을 찾은 시민들은 기대 이상이라는 반응을 보였다. 일부는 준비 과정이 부족했다는 지적도 내놓았지만 전반적인 평가는 긍정적이다.",
+    "전문가들은 {q} 이슈가 단기간에 끝나지 않을 것이라고 분석한다. 비슷한 사례를 보면 초기 관심이 한동안 이어지다가 구체적인 결과가 나오면서 다시 한 번 주목받는 경우가 많았다.",
+    "한편 {q} 에 대한 공식 입장은 이번 주 중 추가로 발표될 예정이다. 관계 기관은 세부 일정과 후속 조치를 정리해 순차적으로 안내하겠다고 밝혔다.",
+]
+
+# 검증 기준(단락 5개 이상, 단락당 300자 이상, 전체 2,000자 이상 - 공백 제외)을 넘기는 응답 → 보충 호출 없이 통과
+CLOVA_SECTIONS = [
+    (
+        "핵심 요약",
+        "이번 소식의 핵심은 변화의 방향이 분명해졌다는 점입니다. 많은 분들이 궁금해하던 내용이 공식적으로 확인되면서 관심이 더욱 커지고 있습니다. "
+        "그동안 여러 추측이 오갔지만 이번 발표로 큰 줄기가 정리되었고, 관련된 사람들도 각자의 계획을 다시 세우기 시작했습니다. "
+        "특히 일정과 대상이 함께 공개되면서 막연했던 기대가 구체적인 준비로 바뀌는 분위기입니다. "
+        "처음 소식을 접하는 분들도 이해하기 쉽도록 중요한 부분만 골라 차근차근 정리해 보겠습니다. "
+        "아래 내용을 순서대로 읽어 보시면 이번 변화가 왜 주목받는지, 그리고 앞으로 무엇을 눈여겨봐야 하는지 자연스럽게 파악하실 수 있습니다. "
+        "짧게 요약하면 방향은 정해졌고 세부 내용이 하나씩 채워지는 단계라고 볼 수 있습니다. "
+        "이번 변화는 특정 분야에만 머무르지 않고 주변 영역에도 영향을 줄 가능성이 큽니다. "
+        "그래서 직접 관련이 없어 보이는 분들도 큰 흐름 정도는 알아 두시면 나중에 판단할 때 도움이 됩니다. "
+        "이 글에서는 복잡한 용어는 최대한 덜어 내고, 꼭 알아야 할 사실과 그 의미를 중심으로 설명드리겠습니다. "
+        "궁금한 부분이 생기면 해당 단락만 골라 읽으셔도 충분히 이해하실 수 있도록 구성했습니다.",
+    ),
+    (
+        "배경",
+        "이번 결정이 나오기까지는 꽤 오랜 논의가 이어졌습니다. 처음 문제가 제기된 것은 이미 수년 전이었고, 그 뒤로 여러 차례 의견이 모였다가 흩어지기를 반복했습니다. "
+        "환경이 빠르게 바뀌면서 기존 방식으로는 더 이상 대응하기 어렵다는 지적이 많아졌고, 결국 새로운 기준이 필요하다는 데 뜻이 모였습니다. "
+        "그 과정에서 이해관계가 다른 여러 쪽의 입장을 조율하는 일이 가장 어려웠다고 전해집니다. "
+        "일부에서는 속도를 늦추자는 목소리도 있었지만, 더 미루면 부담이 커진다는 판단이 힘을 얻었습니다. "
+        "이런 흐름을 알고 나면 이번 발표가 갑작스러운 결정이 아니라 오랫동안 준비된 결과라는 점을 이해하실 수 있습니다. "
+        "실제로 준비 과정에서 여러 차례 시범 운영이 진행되었고, 그 결과를 바탕으로 세부 기준이 조금씩 다듬어졌습니다. "
+        "시범 운영에 참여한 곳들의 의견을 들어 보면 예상보다 부담이 적었다는 평가와 보완이 필요하다는 지적이 함께 나왔습니다. "
+        "이런 의견이 최종안에 얼마나 반영되었는지가 이번 발표에서 많은 분들이 주목한 부분이기도 합니다. "
+        "결과적으로 처음 제안보다 현실적인 방향으로 조정되었다는 것이 대체적인 평가입니다.",
+    ),
+    (
+        "주요 내용",
+        "발표된 내용을 살펴보면 일정과 규모가 예상보다 구체적입니다. 우선 적용 시점이 명확히 제시되었고, 단계별로 어떤 변화가 생기는지도 함께 안내되었습니다. "
+        "대상 범위는 처음 알려진 것보다 조금 넓어졌으며, 예외가 되는 경우도 따로 정리되어 있어 혼란을 줄이려는 노력이 보입니다. "
+        "관련 업계에서도 이번 결정을 긍정적으로 평가하며 후속 움직임을 준비하고 있습니다. "
+        "다만 세부 기준 일부는 추가 안내가 예정되어 있어 지금 단계에서 모든 것을 단정하기는 어렵습니다. "
+        "직접 영향을 받는 분이라면 공식 안내 자료를 한 번 더 확인하시고, 필요한 준비를 미리 챙겨 두시는 것이 좋겠습니다. "
+        "눈여겨볼 부분은 지원 방안이 함께 마련되었다는 점입니다. "
+        "변화에 따른 부담을 줄이기 위해 안내 창구가 확대되고, 준비 기간 동안 참고할 수 있는 자료도 순차적으로 공개될 예정입니다. "
+        "또한 적용 초기에는 유예 기간을 두어 갑작스러운 혼란이 생기지 않도록 한다는 계획도 포함되어 있습니다. "
+        "이런 보완책 덕분에 현장에서는 준비할 시간이 충분하다는 반응이 나오고 있으며, 관련 문의도 꾸준히 늘고 있습니다. "
+        "세부 일정은 공식 발표를 기준으로 확인하시는 것이 가장 정확합니다.",
+    ),
+    (
+        "반응과 전망",
+        "현장의 반응은 대체로 기대감이 큽니다. 오랫동안 기다려 온 변화라는 평가가 많고, 불확실성이 줄어든 점을 반기는 목소리도 적지 않습니다. "
+        "다만 세부 사항은 앞으로 더 지켜봐야 한다는 의견도 있어 차분하게 흐름을 살펴보는 것이 좋겠습니다. "
+        "전문가들은 초기에는 적응 기간이 필요하겠지만 시간이 지나면 효과가 분명해질 것이라고 내다보고 있습니다. "
+        "비슷한 사례를 먼저 겪은 곳들의 경험을 보면 처음 몇 달 동안 작은 시행착오가 이어지다가 점차 안정되는 경우가 많았습니다. "
+        "앞으로 발표될 후속 조치와 실제 적용 결과에 따라 평가가 달라질 수 있으니 관련 소식을 꾸준히 확인해 보시길 권합니다. "
+        "한편 일부에서는 비용과 절차가 늘어날 수 있다는 우려도 제기하고 있습니다. "
+        "특히 규모가 작은 곳일수록 준비에 필요한 여력이 부족할 수 있어 추가 지원이 필요하다는 목소리가 나옵니다. "
+        "이에 대해 담당 기관은 현장의 의견을 계속 듣고 필요하면 기준을 보완하겠다는 입장을 밝혔습니다. "
+        "결국 이번 변화가 성공적으로 자리 잡을지는 앞으로의 소통과 후속 조치에 달려 있다고 볼 수 있습니다.",
+    ),
+    (
+        "마무리",
+        "지금까지 이번 소식의 핵심과 배경, 주요 내용, 그리고 반응과 전망을 차례로 정리해 보았습니다. "
+        "한 번에 모든 것이 바뀌는 것은 아니지만 방향이 분명해진 만큼 미리 알아 두면 도움이 되는 내용이 많습니다. "
+        "특히 일정과 대상 범위는 개인마다 영향이 다를 수 있으니 본인에게 해당하는 부분을 꼭 확인해 보시기 바랍니다. "
+        "추가 안내가 나오면 달라진 점을 중심으로 다시 정리해 전해 드리겠습니다. "
+        "앞으로의 진행 상황도 꾸준히 정리해 전해 드릴 예정이니 관심 있게 지켜봐 주세요. "
+        "궁금한 점이나 더 알고 싶은 내용이 있다면 댓글로 남겨 주시면 다음 글에서 함께 다루어 보겠습니다. "
+        "정리하자면 이번 발표는 오랜 논의 끝에 나온 결과이고, 앞으로 단계적으로 적용되면서 구체적인 모습이 드러날 것입니다. "
+        "당장 크게 달라지는 점은 많지 않더라도 미리 흐름을 알고 준비해 두면 변화가 시작되었을 때 훨씬 여유롭게 대응하실 수 있습니다. "
+        "주변에 이 소식이 필요한 분이 계시다면 함께 나눠 보셔도 좋겠습니다. "
+        "읽어 주셔서 감사합니다.",
+    ),
+]
+
+
+@dataclass
+class FakeConfig:
+    latency_ms: Dict[str, tuple] = field(default_factory=lambda: dict(DEFAULT_LATENCY_MS))
+    error_rate: Dict[str, float] = field(default_factory=lambda: {p: 0.0 for p in PROVIDERS})
+    throttle_rate: Dict[str, float] = field(default_factory=lambda: {p: 0.0 for p in PROVIDERS})
+    # Clova 입력 처리 시간 (프롬프트 1,000자당 ms, 스트리밍이면 첫 토큰 전에 대기)
+    clova_prefill_ms_per_kchar: float = 0.0
+    # Clova 출력 생성 시간 (출력 토큰 1개당 ms)
+    clova_decode_ms_per_token: float = 0.0
+
+
+CONFIG = FakeConfig()
+STATS: Counter = Counter()
+_rng = random.Random()
+
+# 검색 결과 링크 id → 검색어 (본문 페이지에서 검색어를 다시 넣기 위함)
+_link_queries: "OrderedDict[str, str]" = OrderedDict()
+_LINK_QUERY_MAX = 100_000
+_image_cache: Dict[int, bytes] = {}
+
+app = FastAPI(title="blogi fake providers")
+
+
+# ---------- 지연 / 오류 주입 ----------
+def sample_latency(provider: str) -> float:
+    """p50/p99 에 맞춘 로그정규분포에서 지연(초) 샘플"""
+    p50, p99 = CONFIG.latency_ms[provider]
+    if p50 <= 0:
+        return 0.0
+    sigma = max(0.0, math.log(max(p99, p50) / p50) / 2.326)
+    return _rng.lognormvariate(math.log(p50), sigma) / 1000
+
+
+async def inject(provider: str, delay: Optional[float] = None) -> Optional[str]:
+    """지연 후 주입할 실패 종류("throttle" / "error")를 반환 (정상이면 None)"""
+    STATS[f"{provider}_requests"] += 1
+    await asyncio.sleep(sample_latency(provider) if delay is None else delay)
+    roll = _rng.random()
+    if roll < CONFIG.throttle_rate[provider]:
+        STATS[f"{provider}_throttled"] += 1
+        return "throttle"
+    if roll < CONFIG.throttle_rate[provider] + CONFIG.error_rate[provider]:
+        STATS[f"{provider}_errors"] += 1
+        return "error"
+    return None
+
+
+def _remember(query: str) -> str:
+    link_id = str(_rng.randrange(10**11, 10**12))
+    _link_queries[link_id] = query
+    if len(_link_queries) > _LINK_QUERY_MAX:
+        _link_queries.popitem(last=False)
+    return link_id
+
+
+def _article_text(query: str) -> str:
+    return "\n\n".join(p.format(q=query) for p in PARAGRAPHS)
+
+
+# ---------- 네이버 ----------
+@app.get("/search.naver", response_class=HTMLResponse)
+async def naver_search_page(category: str = "", query: str = ""):
+    """통합검색 숏텐츠 탭 (키워드 수집용) - 호출마다 새 키워드가 섞이도록 번호를 붙임"""
+    failure = await inject("naver")
+    if failure:
+        return HTMLResponse("<html><body>잠시 후 다시 시도해 주세요.</body></html>", status_code=503)
+    spans = "".join(
+        f'<span class="sds-comps-text-type-headline2">{escape(_rng.choice(SUBJECTS))} '
+        f"{escape(_rng.choice(TOPICS))} {_rng.randrange(10000)}</span>"
+        for _ in range(10)
+    )
+    return HTMLResponse(f"<html><body><div>{spans}</div></body></html>")
+
+
+@app.get("/v1/search/{kind}.json")
+async def naver_open_api(kind: str, request: Request, query: str = "", display: int = 3):
+    failure = await inject("naver")
+    if failure == "throttle":
+        return JSONResponse({"errorMessage": "Rate limit exceeded.", "errorCode": "012"}, status_code=429)
+    if failure == "error":
+        return JSONResponse({"errorMessage": "System error.", "errorCode": "SE99"}, status_code=500)
+
+    base = str(request.base_url).rstrip("/")
+    items = []
+    for _ in range(max(1, min(display, 10))):
+        link_id = _remember(query)
+        item = {
+            "title": f"<b>{escape(query)}</b> 관련 소식 정리",
+            "description": f"{escape(query)} 에 대한 최신 내용을 정리했습니다.",
+        }
+        if kind == "blog":
+            item.update(
+                # 앱은 bloggerlink 경로 + link 마지막 경로로 NAVER_BLOG_BASE_URL 아래 원문 링크를 조합
+                link=f"{base}/fakeblog/{link_id}",
+                bloggername="가짜 블로그",
+                bloggerlink=f"{base}/fakeblog",
+                postdate=datetime.now().strftime("%Y%m%d"),
+            )
+        else:
+            item.update(
+                link=f"{base}/news/{link_id}",
+                originallink=f"{base}/news/{link_id}",
+                pubDate=datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S %z"),
+            )
+        items.append(item)
+    return {
+        "lastBuildDate": datetime.now().isoformat(),
+        "total": len(items),
+        "start": 1,
+        "display": len(items),
+        "items": items,
+    }
+
+
+@app.get("/news/{link_id}", response_class=HTMLResponse)
+async def news_page(link_id: str):
+    failure = await inject("page")
+    if failure:
+        return HTMLResponse("<html><body>error</body></html>", status_code=503)
+    query = _link_queries.get(link_id, "오늘의 뉴스")
+    body = "".join(f"<p>{escape(p)}</p>" for p in _article_text(query).split("\n\n"))
+    return HTMLResponse(f"<html><body><div id='dic_area'>{body}</div></body></html>")
+
+
+@app.get("/blog/{blog_id}/{link_id}", response_class=HTMLResponse)
+async def blog_page(blog_id: str, link_id: str):
+    failure = await inject("page")
+    if failure:
+        return HTMLResponse("<html><body>error</body></html>", status_code=503)
+    query = _link_queries.get(link_id, "오늘의 이야기")
+    body = "".join(f"<p>{escape(p)}</p>" for p in _article_text(query).split("\n\n"))
+    return HTMLResponse(f"<html><body><div class='se-main-container'>{body}</div></body></html>")
+
+
+# ---------- Kakao ----------
+def _png(seed: int, width: int = 640, height: int = 400) -> bytes:
+    """seed 별로 무늬가 다른 PNG (이미지 검증의 크기/중복 검사를 통과하도록)"""
+    a, b, c = 1 + seed % 7, 1 + seed % 5, (seed * 37) % 256
+    rows = bytearray()
+    for y in range(height):
+        rows.append(0)
+        for x in range(width):
+            v = (x * a + y * b + c) % 256
+            rows.extend((v, (v + seed * 11) % 256, (255 - v) % 256))
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", ihdr)
+        + chunk(b"IDAT", zlib.compress(bytes(rows), 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+@app.get("/v2/search/image")
+async def kakao_image_search(request: Request, query: str = "", size: int = 3):
+    failure = await inject("kakao")
+    if failure == "throttle":
+        return JSONResponse(
+            {"errorType": "RequestThrottled", "message": "API limit has been exceeded."}, status_code=429
+        )
+    if failure == "error":
+        return JSONResponse({"errorType": "InternalServerError", "message": "internal error"}, status_code=500)
+
+    base = str(request.base_url).rstrip("/")
+    documents = []
+    for _ in range(max(1, min(size, 80))):
+        seed = _rng.randrange(1000)
+        documents.append(
+            {
+                "collection": "news",
+                "thumbnail_url": f"{base}/images/{seed}.png",
+                "image_url": f"{base}/images/{seed}.png",
+                "width": 640,
+                "height": 400,
+                "display_sitename": "가짜뉴스",
+                "doc_url": f"{base}/news/{_remember(query)}",
+                "datetime": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+    return {
+        "meta": {"total_count": len(documents), "pageable_count": len(documents), "is_end": True},
+        "documents": documents,
+    }
+
+
+@app.get("/images/{seed}.png")
+async def image(seed: int):
+    failure = await inject("page")
+    if failure:
+        return Response(status_code=404)
+    if seed not in _image_cache:
+        _image_cache[seed] = await asyncio.to_thread(_png, seed)
+    return Response(_image_cache[seed], media_type="image/png")
+
+
+# ---------- Clova ----------
+def _output_tokens(text: str) -> int:
+    """출력 토큰 수 근사치 (한글 음절 ≈ 0.7, 그 외 공백 아닌 문자 ≈ 0.3)"""
+    return math.ceil(sum(0.7 if "가" <= ch <= "힣" else 0.3 for ch in text if not ch.isspace()))
+
+
+@app.post("/v3/tasks/{task_id}/chat-completions")
+async def clova_chat(task_id: str, request: Request):
+    payload = await request.json()
+    stream = "text/event-stream" in request.headers.get("accept", "")
+    # 스트리밍이면 전체 지연의 10% 를 첫 토큰 전에, 나머지는 토큰 사이에 나눠서 대기
+    prompt = next((m["content"] for m in payload.get("messages", []) if m.get("role") == "user"), "")
+    total = sample_latency("clova")
+    prefill = len(prompt) / 1000 * CONFIG.clova_prefill_ms_per_kchar / 1000
+    content = "\n".join(f"**{title}**\n{body}" for title, body in CLOVA_SECTIONS)
+    # 실제 모델은 maxTokens 에서 멈춤 → 응답 본문 토큰 수와 maxTokens 중 작은 쪽만큼 생성 시간
+    output_tokens = _output_tokens(content)
+    if payload.get("maxTokens"):
+        output_tokens = min(output_tokens, payload["maxTokens"])
+    total += output_tokens * CONFIG.clova_decode_ms_per_token / 1000
+    failure = await inject("clova", delay=prefill + (total * 0.1 if stream else total))
+    if failure == "throttle":
+        return JSONResponse(
+            {"status": {"code": "42901", "message": "Too many requests - rate exceeded"}, "result": None},
+            status_code=429,
+        )
+    if failure == "error":
+        return JSONResponse(
+            {"status": {"code": "50000", "message": "Internal server error"}, "result": None}, status_code=500
+        )
+
+    if stream:
+        return StreamingResponse(_clova_events(content, len(prompt), total * 0.9), media_type="text/event-stream")
+    return {
+        "status": {"code": "20000", "message": "OK"},
+        "result": {
+            "message": {"role": "assistant", "content": content},
+            "inputLength": len(prompt),
+            "outputLength": len(content),
+            "stopReason": "stop_before",
+        },
+    }
+
+
+async def _clova_events(content: str, input_length: int, duration: float):
+    tokens = [content[i : i + 4] for i in range(0, len(content), 4)]
+    gap = duration / max(1, len(tokens))
+    for i, token in enumerate(tokens):
+        data = json.dumps({"message": {"role": "assistant", "content": token}}, ensure_ascii=False)
+        yield f"id: {i}\nevent: token\ndata: {data}\n\n"
+        await asyncio.sleep(gap)
+    result = {
+        "message": {"role": "assistant", "content": content},
+        "inputLength": input_length,
+        "outputLength": len(content),
+        "stopReason": "stop_before",
+    }
+    yield f"id: {len(tokens)}\nevent: result\ndata: {json.dumps(result, ensure_ascii=False)}\n\n"
+
+
+@app.get("/__stats")
+async def stats():
+    return {
+        "stats": dict(STATS),
+        "config": {
+            "latency_ms": CONFIG.latency_ms,
+            "error_rate": CONFIG.error_rate,
+            "throttle_rate": CONFIG.throttle_rate,
+        },
+    }
+
+
+# ---------- CLI ----------
+def parse_rates(value: str) -> Dict[str, float]:
+    """ "0.01" → 전체 공통, "kakao=0.05,clova=0.02" → 제공자별"""
+    if "=" not in value:
+        return {p: float(value) for p in PROVIDERS}
+    rates = {p: 0.0 for p in PROVIDERS}
+    for part in value.split(","):
+        name, rate = part.split("=")
+        rates[name.strip()] = float(rate)
+    return rates
+
+
+def parse_latency(value: str) -> Dict[str, tuple]:
+    latency = dict(DEFAULT_LATENCY_MS)
+    for part in value.split(","):
+        name, spec = part.split("=")
+        p50, p99 = spec.split(":")
+        latency[name.strip()] = (float(p50), float(p99))
+    return latency
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Naver/Kakao/Clova 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency", default="", help='제공자별 "p50:p99" ms (예: clova=3000:9000,kakao=60:300)')
+    parser.add_argument("--error-rate", default="0", help="5xx 비율 (공통 값 또는 provider=rate,...)")
+    parser.add_argument("--throttle-rate", default="0", help="429 비율 (공통 값 또는 provider=rate,...)")
+    parser.add_argument("--clova-prefill", type=float, default=0.0, help="Clova 프롬프트 1,000자당 추가 지연(ms)")
+    parser.add_argument("--clova-decode", type=float, default=0.0, help="Clova 응답 출력 토큰당 추가 지연(ms)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.latency:
+        CONFIG.latency_ms = parse_latency(args.latency)
+    CONFIG.error_rate = parse_rates(args.error_rate)
+    CONFIG.throttle_rate = parse_rates(args.throttle_rate)
+    CONFIG.clova_prefill_ms_per_kchar = args.clova_prefill
+    CONFIG.clova_decode_ms_per_token = args.clova_decode
+    if args.seed is not None:
+        _rng.seed(args.seed)
+
+    print(f"[fake_providers] http://{args.host}:{args.port} latency={CONFIG.latency_ms}")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+# 수집/생성 파이프라인 부하 드라이버 (scripts.fake_providers 와 함께 사용)
+#
+# 사용법 (fastapi_app 디렉터리에서, base URL 을 대역 서버로 바꾼 환경으로):
+#   # 1) 스케줄러 단계(키워드 → 기사 → 이미지)를 같은 프로세스에서 N 사이클 실행
+#   python -m scripts.load_pipeline pipeline [--cycles 3] [--stages keyword,article,image] [--json out.json]
+#
+#   # 2) 실행 중인 FastAPI 의 /generate-clova-post 에 동시 요청
+#   python -m scripts.load_pipeline generate --keyword-ids 1,2,3 --user-ids 1,2 [--requests 100] \
+#       [--concurrency 10] [--fastapi-url http://localhost:8001]
+#   (같은 keyword/user 조합은 기존 글을 돌려주므로 조합 수보다 많이 보내면 캐시 응답(from_cache)이 섞임)
+#
+# 출력: 단계별 호출 수 / 실패 수 / p50 / p99 / max (ms), 단계 처리량(calls/sec), 전체 처리량
+# pipeline 모드는 각 단계의 주요 함수(외부 API 호출, 본문 추출, Django 저장)를 감싸서 호출별 지연을 잽니다.
+import argparse
+import asyncio
+import importlib
+import json
+import statistics
+import time
+from collections import defaultdict
+from functools import wraps
+from typing import Callable, Dict, List
+
+import httpx
+
+from app.common import metrics
+from app.core.config import settings
+
+# (모듈, 함수 이름, 단계 이름) - 사용하는 쪽 모듈의 이름을 감싸야 호출이 잡힘
+PROBES = [
+    ("app.features.internal.scrape_titles.services", "scrape_titles", "keyword.naver_scrape"),
+    ("app.features.internal.scrape_titles.services", "send_keywords_to_django", "keyword.django_save"),
+    ("app.features.internal.fetch_article.services", "fetch_keywords_from_django", "article.django_next"),
+    ("app.features.internal.fetch_article.smart_news_fetcher", "search_news", "article.naver_search"),
+    ("app.features.internal.fetch_article.smart_blog_fetcher", "search_news", "article.naver_search"),
+    ("app.features.internal.fetch_article.smart_news_fetcher", "extract_news_content", "article.extract"),
+    ("app.features.internal.fetch_article.smart_blog_fetcher", "extract_blog_content", "article.extract"),
+    ("app.features.internal.fetch_article.services", "send_articles_to_django", "article.django_save"),
+    ("app.features.internal.fetch_image.service", "_lease_targets", "image.lease"),
+    ("app.features.internal.fetch_image.smart_image_fetcher", "fetch_kakao_images", "image.kakao_search"),
+    ("app.features.internal.fetch_image.service", "validate_candidates", "image.validate"),
+    ("app.features.internal.fetch_image.service", "_collect_one", "image.keyword_total"),
+    ("app.features.internal.fetch_image.service", "_save_batch", "image.django_save"),
+]
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.failures: Dict[str, int] = defaultdict(int)
+
+    def timed(self, stage: str, fn: Callable) -> Callable:
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            except BaseException:
+                self.failures[stage] += 1
+                raise
+            finally:
+                self.latencies[stage].append((time.perf_counter() - started) * 1000)
+
+        return wrapper
+
+    def install(self) -> None:
+        for module_name, attr, stage in PROBES:
+            module = importlib.import_module(module_name)
+            setattr(module, attr, self.timed(stage, getattr(module, attr)))
+
+    def summary(self, wall_sec: Dict[str, float]) -> dict:
+        stages = {}
+        for stage, values in sorted(self.latencies.items()):
+            top = stage.split(".", 1)[0]
+            elapsed = wall_sec.get(top, 0.0)
+            stages[stage] = {
+                "calls": len(values),
+                "failures": self.failures.get(stage, 0),
+                "p50_ms": round(percentile(values, 50), 1),
+                "p99_ms": round(percentile(values, 99), 1),
+                "max_ms": round(max(values), 1),
+                "calls_per_sec": round(len(values) / elapsed, 2) if elapsed else 0.0,
+            }
+        return stages
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+def print_table(title: str, rows: Dict[str, dict]) -> None:
+    print(f"\n== {title}")
+    print(f"{'stage':<24}{'calls':>8}{'fail':>6}{'p50':>10}{'p99':>10}{'max':>10}{'calls/s':>10}")
+    for stage, row in rows.items():
+        print(
+            f"{stage:<24}{row['calls']:>8}{row['failures']:>6}{row['p50_ms']:>10}{row['p99_ms']:>10}"
+            f"{row['max_ms']:>10}{row['calls_per_sec']:>10}"
+        )
+
+
+# ---------- pipeline ----------
+async def run_pipeline(cycles: int, stages: List[str]) -> dict:
+    from app.common import scheduler
+    from app.features.internal.fetch_article.scraper.playwright_browser import (
+        recycle_browser,
+    )
+
+    recorder = Recorder()
+    recorder.install()
+    metrics.reset()
+
+    steps = {"keyword": scheduler.keyword_step, "article": scheduler.article_step, "image": scheduler.image_step}
+    cycle_times: Dict[str, List[float]] = defaultdict(list)
+
+    started = time.perf_counter()
+    try:
+        for cycle in range(cycles):
+            for name in stages:
+                step_started = time.perf_counter()
+                try:
+                    await steps[name]()
+                except Exception as e:
+                    print(f"[cycle {cycle + 1}] {name} 실패: {type(e).__name__}: {e}")
+                cycle_times[name].append(time.perf_counter() - step_started)
+                print(f"[cycle {cycle + 1}] {name} {cycle_times[name][-1]:.1f}s")
+    finally:
+        await recycle_browser()
+    total_sec = time.perf_counter() - started
+
+    wall_sec = {name: sum(times) for name, times in cycle_times.items()}
+    return {
+        "mode": "pipeline",
+        "cycles": cycles,
+        "total_sec": round(total_sec, 2),
+        "step_sec": {
+            name: {"mean": round(statistics.mean(times), 2), "max": round(max(times), 2)}
+            for name, times in cycle_times.items()
+        },
+        "stages": recorder.summary(wall_sec),
+        "articles_per_sec": round(len(recorder.latencies["article.django_save"]) / total_sec, 3),
+        "image_keywords_per_sec": round(len(recorder.latencies["image.keyword_total"]) / total_sec, 3),
+        "metrics": metrics.snapshot(),
+    }
+
+
+# ---------- generate ----------
+async def run_generate(
+    fastapi_url: str, keyword_ids: List[int], user_ids: List[int], requests: int, concurrency: int
+) -> dict:
+    url = f"{fastapi_url.rstrip('/')}/api/v1/internal/generate-clova-post"
+    headers = {"x-internal-secret": settings.internal_secret_key or ""}
+    latencies: List[float] = []
+    outcomes: Dict[str, int] = defaultdict(int)
+    sem = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(timeout=300) as client:
+
+        async def one(i: int) -> None:
+            # keyword 를 먼저 돌리고 한 바퀴마다 user 를 바꿔 (keyword, user) 조합이 겹치지 않게 함
+            payload = {
+                "keyword_id": keyword_ids[i % len(keyword_ids)],
+                "user_id": user_ids[(i // len(keyword_ids)) % len(user_ids)],
+            }
+            async with sem:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(url, json=payload, headers=headers)
+                    body = response.json() if response.status_code == 200 else {}
+                    status = body.get("status") or f"http_{response.status_code}"
+                    outcomes[f"{status}(cached)" if body.get("from_cache") else status] += 1
+                except httpx.HTTPError as e:
+                    outcomes[type(e).__name__] += 1
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        total_sec = time.perf_counter() - started
+
+    failures = sum(count for status, count in outcomes.items() if not status.startswith("success"))
+    return {
+        "mode": "generate",
+        "total_sec": round(total_sec, 2),
+        "requests_per_sec": round(requests / total_sec, 3),
+        "outcomes": dict(outcomes),
+        "stages": {
+            "generate.e2e": {
+                "calls": len(latencies),
+                "failures": failures,
+                "p50_ms": round(percentile(latencies, 50), 1),
+                "p99_ms": round(percentile(latencies, 99), 1),
+                "max_ms": round(max(latencies), 1) if latencies else 0.0,
+                "calls_per_sec": round(len(latencies) / total_sec, 2),
+            }
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="수집/생성 파이프라인 부하 드라이버")
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    p_pipeline = sub.add_parser("pipeline")
+    p_pipeline.add_argument("--cycles", type=int, default=3)
+    p_pipeline.add_argument("--stages", default="keyword,article,image")
+
+    p_generate = sub.add_parser("generate")
+    p_generate.add_argument("--fastapi-url", default="http://localhost:8001")
+    p_generate.add_argument("--keyword-ids", required=True, help="기사가 수집된 keyword id 목록 (쉼표 구분)")
+    p_generate.add_argument("--requests", type=int, default=100)
+    p_generate.add_argument("--concurrency", type=int, default=10)
+    p_generate.add_argument("--user-ids", default="1", help="요청에 사용할 user id 목록 (쉼표 구분)")
+
+    for p in (p_pipeline, p_generate):
+        p.add_argument("--json", default=None, help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    if args.mode == "pipeline":
+        result = asyncio.run(run_pipeline(args.cycles, [s.strip() for s in args.stages.split(",") if s.strip()]))
+        print(
+            f"\ntotal={result['total_sec']}s articles/s={result['articles_per_sec']} "
+            f"image_keywords/s={result['image_keywords_per_sec']}"
+        )
+    else:
+        keyword_ids = [int(k) for k in args.keyword_ids.split(",")]
+        user_ids = [int(u) for u in args.user_ids.split(",")]
+        result = asyncio.run(run_generate(args.fastapi_url, keyword_ids, user_ids, args.requests, args.concurrency))
+        print(f"\ntotal={result['total_sec']}s requests/s={result['requests_per_sec']} outcomes={result['outcomes']}")
+    print_table(result["mode"], result["stages"])
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# 기사/블로그 본문 추출 벤치마크용 HTML 코퍼스 녹화 스크립트
+#
+# 사용법 (fastapi_app 디렉터리에서):
+#   python -m scripts.record_html_corpus urls.tsv [--corpus corpus/html]
+#
+# urls.tsv 형식 (탭 구분, '#'으로 시작하면 주석):
+#   news    손흥민 결승골    https://www.xportsnews.com/article/...
+#   blog    성수동 맛집      https://blog.naver.com/...
+#
+# 실제 extract_news_content / extract_blog_content 를 HAR 녹화 모드로 실행하므로
+# 추출기가 실제로 요청하는 문서/리소스가 그대로 저장됩니다.
+import argparse
+import asyncio
+import sys
+
+from app.features.internal.fetch_article.scraper.blog_scraper import (
+    extract_blog_content,
+)
+from app.features.internal.fetch_article.scraper.html_corpus import (
+    DEFAULT_CORPUS_DIR,
+    CorpusEntry,
+    load_manifest,
+    recording,
+    save_manifest,
+)
+from app.features.internal.fetch_article.scraper.news_scraper import (
+    extract_news_content,
+)
+from app.features.internal.fetch_article.scraper.playwright_browser import (
+    recycle_browser,
+)
+from app.features.internal.fetch_article.scraper.playwright_selectors import (
+    BLOG_DOMAIN_SELECTOR_MAP,
+    DOMAIN_SELECTOR_MAP,
+)
+
+
+def read_targets(path: str) -> list[CorpusEntry]:
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            kind, keyword, url = line.split("\t")
+            if kind not in ("news", "blog"):
+                raise ValueError(f"kind는 news/blog 중 하나여야 합니다: {line!r}")
+            entries.append(CorpusEntry(url=url, kind=kind, keyword=keyword))  # type: ignore[arg-type]
+    return entries
+
+
+async def record(targets: list[CorpusEntry], corpus_dir: str) -> None:
+    existing = {e.url: e for e in load_manifest(corpus_dir)}
+
+    try:
+        for entry in targets:
+            extract = extract_news_content if entry.kind == "news" else extract_blog_content
+            async with recording(entry.url, corpus_dir) as session:
+                content = await extract(entry.url, entry.keyword)
+            entry.contexts = session.opened
+            existing[entry.url] = entry
+            status = f"OK len={len(content)}" if content else "EMPTY"
+            print(f"[RECORD] {entry.domain:<22} {status:<12} har={session.opened} {entry.url}")
+    finally:
+        await recycle_browser()
+        save_manifest(list(existing.values()), corpus_dir)
+
+    # 셀렉터 맵 대비 커버리지 출력
+    recorded = {e.domain for e in existing.values()}
+    missing = sorted((set(DOMAIN_SELECTOR_MAP) | set(BLOG_DOMAIN_SELECTOR_MAP)) - recorded)
+    print(f"\n총 {len(existing)}개 페이지, 도메인 {len(recorded)}개 녹화됨")
+    if missing:
+        print("녹화되지 않은 셀렉터 맵 도메인:", ", ".join(missing))
+    unmapped = sorted(d for d in recorded if d not in DOMAIN_SELECTOR_MAP and d not in BLOG_DOMAIN_SELECTOR_MAP)
+    if unmapped:
+        print("셀렉터 맵에 없는 도메인(기본 셀렉터 사용):", ", ".join(unmapped))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTML 코퍼스(HAR) 녹화")
+    parser.add_argument("targets", help="news/blog<TAB>keyword<TAB>url 형식의 TSV 파일")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS_DIR, help="코퍼스 디렉터리")
+    args = parser.parse_args()
+
+    targets = read_targets(args.targets)
+    if not targets:
+        print("녹화할 대상이 없습니다.")
+        sys.exit(1)
+    asyncio.run(record(targets, args.corpus))
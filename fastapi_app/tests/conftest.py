@@ -0,0 +1,26 @@
+import os
+
+# app.core.config.Settings 필수 값 (테스트는 외부 서비스에 연결하지 않으므로 더미 값)
+_REQUIRED_ENV = {
+    "DJANGO_API_ENDPOINT_KEYWORDS_GET": "/api/internal/keywords/",
+    "DJANGO_API_ENDPOINT_KEYWORDS_POST": "/api/internal/keywords/",
+    "DJANGO_API_ENDPOINT_ARTICLES_POST": "/api/internal/articles/",
+    "KAKAO_REST_API_KEY": "test",
+    "MEDIA_BASE_URL": "http://testserver/media",
+    "DJANGO_SECRET_KEY": "test",
+    "NAVER_CLIENT_ID": "test",
+    "NAVER_CLIENT_SECRET": "test",
+    "CLOVA_API_KEY": "test",
+    "OPENAI_BASE_URL": "http://testserver/v1/openai",
+    "CLOVA_BASE_URL": "http://testserver",
+    "CLOVA_BUCKET_NAME": "test",
+    "CLOVA_DATA_PATH": "test",
+    "CLOVA_STORAGE_ACCESS_KEY": "test",
+    "CLOVA_STORAGE_SECRET_KEY": "test",
+    "CLOVA_TUNED_MODEL_ID": "test",
+    "CLOVA_SYSTEM_PROMPT": "test",
+    "FASTAPI_ORIGIN": "http://testserver",
+}
+
+for key, value in _REQUIRED_ENV.items():
+    os.environ.setdefault(key, value)
@@ -0,0 +1,47 @@
+import time
+
+from app.core.config import settings
+from app.features.internal.generate_clova_post.condenser import (
+    condense,
+    estimate_tokens,
+    split_sentences,
+)
+
+
+def test_short_text_is_returned_as_is():
+    assert condense("  짧은 기사 본문입니다.  ", "기사", token_budget=100) == "짧은 기사 본문입니다."
+    assert condense("", "기사", token_budget=100) == ""
+
+
+def test_picks_sentences_within_budget_in_original_order():
+    sentences = [f"{i}번째 문장은 손흥민 경기 소식을 전합니다." for i in range(30)]
+    result = condense(" ".join(sentences), "손흥민", token_budget=60)
+
+    assert 0 < estimate_tokens(result) <= 60
+    picked = [sentences.index(s) for s in split_sentences(result)]
+    assert picked == sorted(picked)
+
+
+def test_single_sentence_longer_than_budget_keeps_truncated_lead():
+    lead = "가" * 500 + "로 시작하는 아주 긴 첫 문장"
+    text = f"{lead}\n{'나' * 400} 두 번째 문장도 예산보다 깁니다"
+
+    result = condense(text, "키워드", token_budget=50)
+
+    assert result
+    assert lead.startswith(result)
+    assert estimate_tokens(result) <= 50
+
+
+def test_oversized_article_ranks_only_leading_sentences():
+    sentences = [f"{i}번째 문장은 서로 다른 단어 조합 {i % 7}{i % 11} 으로 이어집니다." for i in range(5000)]
+    text = "\n".join(sentences)
+
+    started = time.monotonic()
+    result = condense(text, "문장", token_budget=200)
+    elapsed = time.monotonic() - started
+
+    assert 0 < estimate_tokens(result) <= 200
+    # 순위 계산은 앞쪽 condense_max_sentences 문장만
+    assert all(sentences.index(s) < settings.condense_max_sentences for s in split_sentences(result))
+    assert elapsed < 5
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from app.features.internal.generate.dispatcher import (
+    ClovaDispatcher,
+    ClovaOverloaded,
+    Priority,
+)
+
+
+def make_dispatcher(concurrency: int = 1, max_queue: int = 10) -> ClovaDispatcher:
+    # QPS 토큰은 넉넉하게 (슬롯 대기만 검증)
+    return ClovaDispatcher(concurrency=concurrency, qps=1000, burst=1000, max_queue=max_queue)
+
+
+async def hold(dispatcher: ClovaDispatcher, release: asyncio.Event, priority: Priority = Priority.INTERACTIVE) -> None:
+    async with dispatcher.slot(priority, deadline_sec=5):
+        await release.wait()
+
+
+async def test_waiters_get_slot_in_priority_then_arrival_order():
+    dispatcher = make_dispatcher()
+    release = asyncio.Event()
+    holder = asyncio.create_task(hold(dispatcher, release))
+    await asyncio.sleep(0)
+
+    order: list[str] = []
+
+    async def call(name: str, priority: Priority) -> None:
+        async with dispatcher.slot(priority, deadline_sec=5):
+            order.append(name)
+
+    calls = [
+        asyncio.create_task(call(name, priority))
+        for name, priority in [
+            ("background", Priority.BACKGROUND),
+            ("admin-1", Priority.ADMIN),
+            ("interactive", Priority.INTERACTIVE),
+            ("admin-2", Priority.ADMIN),
+        ]
+    ]
+    await asyncio.sleep(0)
+    assert len(dispatcher._pending()) == 4
+
+    release.set()
+    await asyncio.gather(holder, *calls)
+    assert order == ["interactive", "admin-1", "admin-2", "background"]
+    assert dispatcher.idle_slots() == 1
+
+
+async def test_queue_full_rejects_same_priority_and_preempts_lower():
+    dispatcher = make_dispatcher(max_queue=1)
+    release = asyncio.Event()
+    holder = asyncio.create_task(hold(dispatcher, release))
+    await asyncio.sleep(0)
+    background = asyncio.create_task(hold(dispatcher, release, Priority.BACKGROUND))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ClovaOverloaded, match="queue full"):
+        async with dispatcher.slot(Priority.BACKGROUND, deadline_sec=5):
+            pass
+
+    # 더 높은 우선순위는 가장 낮은 대기자를 밀어내고 들어감
+    interactive = asyncio.create_task(hold(dispatcher, release))
+    await asyncio.sleep(0)
+    with pytest.raises(ClovaOverloaded, match="preempted"):
+        await background
+
+    release.set()
+    await asyncio.gather(holder, interactive)
+    assert dispatcher.idle_slots() == 1
+
+
+async def test_deadline_expiry_raises_and_leaves_queue():
+    dispatcher = make_dispatcher()
+    async with dispatcher.slot(Priority.INTERACTIVE):
+        with pytest.raises(ClovaOverloaded, match="deadline") as exc_info:
+            async with dispatcher.slot(Priority.BACKGROUND, deadline_sec=0.05):
+                pass
+        assert exc_info.value.retry_after >= 1
+        assert dispatcher._pending() == []
+    assert dispatcher.idle_slots() == 1
+
+
+async def test_release_hands_slot_to_waiter():
+    dispatcher = make_dispatcher()
+    release = asyncio.Event()
+    holder = asyncio.create_task(hold(dispatcher, release))
+    await asyncio.sleep(0)
+
+    entered = asyncio.Event()
+    done = asyncio.Event()
+
+    async def waiter() -> None:
+        async with dispatcher.slot(Priority.BACKGROUND, deadline_sec=5):
+            entered.set()
+            await done.wait()
+
+    waiting = asyncio.create_task(waiter())
+    await asyncio.sleep(0)
+    release.set()
+    await holder
+    await asyncio.wait_for(entered.wait(), timeout=1)
+
+    # 슬롯이 비지 않고 대기자에게 그대로 넘어감 → 새 요청이 끼어들 수 없음
+    assert dispatcher._in_flight == 1
+    assert dispatcher.idle_slots() == 0
+
+    done.set()
+    await waiting
+    assert dispatcher._in_flight == 0
+    assert dispatcher.idle_slots() == 1
+
+
+async def test_cancelled_waiter_after_handoff_returns_slot():
+    dispatcher = make_dispatcher()
+    release = asyncio.Event()
+    holder = asyncio.create_task(hold(dispatcher, release))
+    await asyncio.sleep(0)
+
+    waiting = asyncio.create_task(hold(dispatcher, asyncio.Event()))
+    await asyncio.sleep(0)
+    release.set()
+    await holder
+    # 슬롯을 넘겨받은 직후(대기에서 깨어나기 전) 취소
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert dispatcher._in_flight == 0
+    assert dispatcher.idle_slots() == 1
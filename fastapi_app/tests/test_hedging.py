@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.features.internal.generate import hedging
+from app.features.internal.generate.dispatcher import ClovaDispatcher
+from app.features.internal.generate.hedging import HedgePolicy
+
+
+@pytest.fixture(autouse=True)
+def hedge_settings(monkeypatch):
+    monkeypatch.setattr(settings, "clova_hedge_enabled", True)
+    monkeypatch.setattr(settings, "clova_hedge_delay_ms", 20)
+    monkeypatch.setattr(settings, "clova_hedge_budget_pct", 100.0)
+    set_idle_slots(monkeypatch, 4)
+
+
+def set_idle_slots(monkeypatch, slots: int) -> None:
+    dispatcher = ClovaDispatcher(concurrency=slots, qps=1000, burst=1000, max_queue=10)
+    monkeypatch.setattr(hedging, "clova_dispatcher", dispatcher)
+
+
+class FakeAttempt:
+    """호출 순서별 (지연 초, 결과 또는 예외) 를 따라 동작하는 attempt"""
+
+    def __init__(self, *plan) -> None:
+        self.plan = list(plan)
+        self.calls = 0
+        self.cancelled: list[int] = []
+
+    async def __call__(self, started: asyncio.Event):
+        index = self.calls
+        self.calls += 1
+        started.set()
+        delay, outcome = self.plan[index]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(index)
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+async def test_disabled_runs_single_attempt(monkeypatch):
+    monkeypatch.setattr(settings, "clova_hedge_enabled", False)
+    attempt = FakeAttempt((0.05, "primary"), (0, "hedge"))
+
+    assert await HedgePolicy().run(attempt) == "primary"
+    assert attempt.calls == 1
+
+
+async def test_fast_primary_is_not_hedged_and_earns_credit():
+    policy = HedgePolicy()
+    attempt = FakeAttempt((0, "primary"), (0, "hedge"))
+
+    assert await policy.run(attempt) == "primary"
+    assert attempt.calls == 1
+    assert policy._credits == 1.0
+
+
+async def test_first_success_wins_and_other_is_cancelled():
+    attempt = FakeAttempt((1.0, "primary"), (0.01, "hedge"))
+
+    assert await HedgePolicy().run(attempt) == "hedge"
+    await asyncio.sleep(0)
+    assert attempt.calls == 2
+    assert attempt.cancelled == [0]
+
+
+async def test_budget_limits_hedges(monkeypatch):
+    monkeypatch.setattr(settings, "clova_hedge_budget_pct", 50.0)
+    policy = HedgePolicy()
+
+    # 첫 호출: 크레딧 0.5 → 헤지 없음
+    slow = FakeAttempt((0.05, "primary"), (0, "hedge"))
+    assert await policy.run(slow) == "primary"
+    assert slow.calls == 1
+
+    # 둘째 호출: 크레딧 1.0 → 헤지 1회 후 소진
+    slow = FakeAttempt((1.0, "primary"), (0, "hedge"))
+    assert await policy.run(slow) == "hedge"
+    assert policy._credits == 0.0
+
+    # 한가할 때도 크레딧은 상한까지만 쌓임
+    for _ in range(20):
+        await policy.run(FakeAttempt((0, "primary")))
+    assert policy._credits == hedging._BUDGET_BURST
+
+
+async def test_no_hedge_without_idle_slot(monkeypatch):
+    set_idle_slots(monkeypatch, 0)
+    policy = HedgePolicy()
+    attempt = FakeAttempt((0.05, "primary"), (0, "hedge"))
+
+    assert await policy.run(attempt) == "primary"
+    assert attempt.calls == 1
+    # 헤지하지 않았으므로 크레딧은 그대로
+    assert policy._credits == 1.0
+
+
+async def test_failed_primary_falls_back_to_hedge():
+    attempt = FakeAttempt((0.05, RuntimeError("primary failed")), (0.1, "hedge"))
+
+    assert await HedgePolicy().run(attempt) == "hedge"
+    assert attempt.calls == 2
+
+
+async def test_both_failing_raises_primary_error():
+    attempt = FakeAttempt((0.05, RuntimeError("primary failed")), (0.01, RuntimeError("hedge failed")))
+
+    with pytest.raises(RuntimeError, match="primary failed"):
+        await HedgePolicy().run(attempt)
+    assert attempt.calls == 2
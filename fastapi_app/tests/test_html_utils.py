@@ -0,0 +1,30 @@
+import pytest
+
+from app.common.utils.html_utils import (
+    _clean_article_content_reference,
+    clean_article_content,
+    clean_html,
+)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "<article><p>본문 1</p><script>x()</script><p>본문 2</p></article>",
+        "<div class='news content'><h1>제목</h1><nav>메뉴</nav>내용 &amp; 설명</div>",
+        "<html><head><title>제목</title></head><body><header>헤더</header><p>문단</p><!-- 주석 --></body></html>",
+        "<div><p>문단</p>꼬리<script>x()</script>이어지는 글</div>",
+        "<p>문단\x00NULL 문자</p>",
+        "R&B 기사 본문\n다음 줄",
+    ],
+)
+def test_markup_body_matches_beautifulsoup(raw):
+    assert clean_article_content(raw) == _clean_article_content_reference(raw)
+
+
+def test_plain_body_skips_parsing():
+    assert clean_article_content("  첫 줄 \n\n\t둘째 줄\n") == "첫 줄\n둘째 줄"
+
+
+def test_title_tags_and_entities_are_removed():
+    assert clean_html("&quot;<b>성수동</b>&quot; 팝업 &amp; 맛집") == '"성수동" 팝업 & 맛집'
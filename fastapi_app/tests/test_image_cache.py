@@ -0,0 +1,42 @@
+from app.features.internal.proxy_image.cache import CacheEntry, ImageDiskCache
+
+
+def _store(cache: ImageDiskCache, url: str, digest: str, size: int) -> CacheEntry:
+    entry = CacheEntry(hash=digest, content_type="image/jpeg", size=size)
+    temp = cache.new_temp_file()
+    temp.write(b"x" * size)
+    temp.close()
+    cache.persist(url, temp.name, entry)
+    return cache.register(url, entry)
+
+
+def test_lru_evicts_oldest_entry(tmp_path):
+    cache = ImageDiskCache(tmp_path, max_bytes=250, max_object_bytes=1000)
+    _store(cache, "http://a/1", "a" * 64, 100)
+    _store(cache, "http://a/2", "b" * 64, 100)
+    _store(cache, "http://a/3", "c" * 64, 100)
+
+    assert cache.get("http://a/1") is None
+    assert cache.get("http://a/3") is not None
+    assert not cache.object_path("a" * 64).exists()
+
+
+def test_pinned_source_survives_variant_eviction(tmp_path):
+    cache = ImageDiskCache(tmp_path, max_bytes=250, max_object_bytes=1000)
+    source = _store(cache, "http://a/1", "a" * 64, 100)
+    _store(cache, "http://a/2", "b" * 64, 100)
+
+    cache.pin(source.hash)
+    variant = tmp_path / "tmp" / "variant"
+    variant.write_bytes(b"v" * 100)
+    path = cache.add_variant(source.hash, str(variant), 320, "webp")
+
+    # 용량 초과여도 사용 중인 원본/변환본은 남기고 다른 항목을 정리
+    assert path.exists()
+    assert cache.object_path(source.hash).exists()
+    assert cache.get("http://a/2") is None
+
+    cache.unpin(source.hash)
+    _store(cache, "http://a/3", "c" * 64, 100)
+    assert cache.get("http://a/1") is None
+    assert not path.exists()
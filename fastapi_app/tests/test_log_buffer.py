@@ -0,0 +1,95 @@
+import json
+
+import httpx
+import pytest
+
+from app.common.http_client import ApiResponseError
+from app.core.config import settings
+from app.features.internal.generate_clova_post import log_buffer
+
+
+@pytest.fixture(autouse=True)
+def clean_buffer(monkeypatch, tmp_path):
+    log_buffer._buffer.clear()
+    monkeypatch.setattr(settings, "clova_log_batch_size", 2)
+    monkeypatch.setattr(settings, "clova_log_spill_path", str(tmp_path / "spill.jsonl"))
+    monkeypatch.setattr(settings, "clova_log_dead_letter_path", str(tmp_path / "dead_letter.jsonl"))
+    yield
+    log_buffer._buffer.clear()
+
+
+def fake_sender(monkeypatch, errors: list) -> list:
+    """errors 를 앞에서부터 하나씩 발생시키고 (None 이면 성공) 전송된 batch 를 기록"""
+    sent: list = []
+
+    async def send(batch: list) -> None:
+        error = errors.pop(0) if errors else None
+        if error is not None:
+            raise error
+        sent.append([item["keyword_id"] for item in batch])
+
+    monkeypatch.setattr(log_buffer, "send_clova_logs_bulk", send)
+    return sent
+
+
+def record(*keyword_ids: int) -> None:
+    for keyword_id in keyword_ids:
+        log_buffer.record(keyword_id, "success")
+
+
+def buffered_ids() -> list:
+    return [item["keyword_id"] for item in log_buffer._buffer]
+
+
+def read_jsonl(path: str) -> list:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line)["keyword_id"] for line in f]
+
+
+async def test_flush_sends_all_in_batches(monkeypatch):
+    sent = fake_sender(monkeypatch, [])
+    record(1, 2, 3, 4, 5)
+
+    assert await log_buffer.flush() == 5
+    assert sent == [[1, 2], [3, 4], [5]]
+    assert buffered_ids() == []
+
+
+@pytest.mark.parametrize("error", [ApiResponseError(503), ApiResponseError(429), httpx.ConnectError("down")])
+async def test_retryable_failure_requeues_in_order(monkeypatch, error):
+    sent = fake_sender(monkeypatch, [None, error])
+    record(1, 2, 3, 4, 5)
+
+    assert await log_buffer.flush() == 2
+    assert sent == [[1, 2]]
+    # 실패한 batch 는 원래 순서 그대로 앞쪽에, 뒤 batch 는 다음 주기로
+    assert buffered_ids() == [3, 4, 5]
+
+    assert await log_buffer.flush() == 3
+    assert buffered_ids() == []
+
+
+async def test_client_error_dead_letters_batch_and_continues(monkeypatch):
+    sent = fake_sender(monkeypatch, [ApiResponseError(400)])
+    record(1, 2, 3)
+
+    assert await log_buffer.flush() == 1
+    assert sent == [[3]]
+    assert buffered_ids() == []
+    assert read_jsonl(settings.clova_log_dead_letter_path) == [1, 2]
+
+
+async def test_stop_spills_unsent_and_start_restores(monkeypatch):
+    fake_sender(monkeypatch, [ApiResponseError(502)] * 10)
+    record(1, 2, 3)
+
+    await log_buffer.stop_flusher()
+    assert buffered_ids() == []
+    assert read_jsonl(settings.clova_log_spill_path) == [1, 2, 3]
+
+    record(9)
+    log_buffer._load_spill()
+    # 이전 종료 시 남은 로그가 새 로그보다 앞
+    assert buffered_ids() == [1, 2, 3, 9]
+    with pytest.raises(FileNotFoundError):
+        read_jsonl(settings.clova_log_spill_path)
@@ -0,0 +1,30 @@
+from datetime import date
+
+import pytest
+
+from app.core.config import settings
+from app.features.internal.generate_clova_post import pregenerate
+
+
+@pytest.fixture(autouse=True)
+def memory_budget(monkeypatch):
+    monkeypatch.setattr(settings, "redis_url", None)
+    monkeypatch.setattr(settings, "pregeneration_daily_budget", 2)
+    pregenerate._memory_used.clear()
+    yield
+    pregenerate._memory_used.clear()
+
+
+async def test_reserve_budget_stops_at_daily_limit():
+    today = date(2026, 10, 19)
+
+    assert [await pregenerate._reserve_budget(today) for _ in range(3)] == [True, True, False]
+    assert await pregenerate._remaining_budget(today) == 0
+
+
+async def test_budget_resets_on_new_day():
+    for _ in range(2):
+        await pregenerate._reserve_budget(date(2026, 10, 19))
+
+    assert await pregenerate._remaining_budget(date(2026, 10, 20)) == 2
+    assert await pregenerate._reserve_budget(date(2026, 10, 20))
@@ -0,0 +1,27 @@
+import pytest
+
+from app.common.utils.url_utils import is_public_http_url
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "http://127.0.0.1/image.jpg",
+        "http://localhost:8000/image.jpg",
+        "http://10.0.0.5/image.jpg",
+        "http://192.168.0.1/image.jpg",
+        "http://169.254.169.254/latest/meta-data/",
+        "http://[::1]/image.jpg",
+        "http://[::ffff:127.0.0.1]/image.jpg",
+        "file:///etc/passwd",
+        "ftp://8.8.8.8/image.jpg",
+        "http:///image.jpg",
+        "http://8.8.8.8:99999/image.jpg",
+    ],
+)
+async def test_rejects_internal_or_non_http_urls(url):
+    assert not await is_public_http_url(url)
+
+
+async def test_accepts_public_ip():
+    assert await is_public_http_url("https://8.8.8.8/image.jpg")
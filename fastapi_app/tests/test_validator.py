@@ -0,0 +1,117 @@
+from app.core.config import settings
+from app.features.internal.generate.clova_client import _repair_plan
+from app.features.internal.generate_clova_post.validator import (
+    Section,
+    normalize,
+    parse_sections,
+    validate,
+)
+
+
+def _body(chars: int) -> str:
+    return "가" * chars
+
+
+def _article(count: int, chars: int, intro: str = "") -> str:
+    sections = "\n".join(f"**소제목{i}**\n{_body(chars)}" for i in range(count))
+    return f"{intro}\n{sections}" if intro else sections
+
+
+def test_valid_article_has_no_issues():
+    count = settings.clova_min_sections
+    report = validate(_article(count, settings.clova_min_chars // count + 1), record=False)
+
+    assert report.ok
+    assert [s.subtitle for s in report.sections] == [f"소제목{i}" for i in range(count)]
+
+
+def test_short_preamble_is_merged_into_first_section():
+    count = settings.clova_min_sections
+    text = _article(
+        count, settings.clova_min_chars // count + 1, intro="# 블로그 제목\n오늘은 키워드 소식을 정리합니다."
+    )
+
+    sections, malformed = parse_sections(text)
+    report = validate(text, record=False)
+
+    assert not malformed
+    assert len(sections) == count
+    assert sections[0].subtitle == "소제목0"
+    assert sections[0].body.startswith("오늘은 키워드 소식을 정리합니다.")
+    assert "블로그 제목" not in sections[0].body
+    assert report.ok
+    assert all(s.subtitle != "키워드" for s in normalize(report.sections, "키워드"))
+
+
+def test_long_preamble_becomes_untitled_section():
+    text = _article(2, 10, intro=_body(settings.clova_min_section_chars))
+
+    sections, malformed = parse_sections(text)
+
+    assert malformed
+    assert sections[0] == Section(None, _body(settings.clova_min_section_chars))
+    assert normalize(sections, "키워드")[0].subtitle == "키워드"
+
+
+def test_text_without_subtitles_is_malformed():
+    sections, malformed = parse_sections("소제목 없이 쓴 본문입니다.")
+
+    assert malformed
+    assert sections == [Section(None, "소제목 없이 쓴 본문입니다.")]
+
+
+def test_heading_subtitles_are_malformed():
+    sections, malformed = parse_sections("## 첫 단락\n본문\n## 둘째 단락\n본문")
+
+    assert malformed
+    assert [s.subtitle for s in sections] == ["첫 단락", "둘째 단락"]
+
+
+def test_repair_plan_rewrites_short_sections_within_budget(monkeypatch):
+    monkeypatch.setattr(settings, "clova_min_chars", 0)
+    monkeypatch.setattr(settings, "clova_min_sections", 5)
+    monkeypatch.setattr(settings, "clova_min_section_chars", 100)
+    text = "\n".join(f"**소제목{i}**\n{_body(10 if i % 2 else 200)}" for i in range(5))
+    report = validate(text, record=False)
+
+    assert report.short_sections == [1, 3]
+    assert _repair_plan(report, budget=3) == ([1, 3], 0)
+    assert _repair_plan(report, budget=1) == ([1], 0)
+    assert _repair_plan(report, budget=0) == ([], 0)
+
+
+def test_repair_plan_adds_sections_with_outline_call(monkeypatch):
+    monkeypatch.setattr(settings, "clova_min_chars", 0)
+    monkeypatch.setattr(settings, "clova_min_sections", 5)
+    monkeypatch.setattr(settings, "clova_min_section_chars", 100)
+    report = validate(_article(3, 200), record=False)
+
+    assert report.missing_sections == 2
+    # 추가 소제목 1회 + 새 단락 2개
+    assert _repair_plan(report, budget=3) == ([], 2)
+    # 예산이 모자라면 새 단락 수를 줄임
+    assert _repair_plan(report, budget=2) == ([], 1)
+    # 추가 소제목 호출과 새 단락을 함께 할 수 없으면 보충하지 않음
+    assert _repair_plan(report, budget=1) == ([], 0)
+
+
+def test_repair_plan_rewrites_shortest_sections_for_length(monkeypatch):
+    monkeypatch.setattr(settings, "clova_min_chars", 1000)
+    monkeypatch.setattr(settings, "clova_min_sections", 3)
+    monkeypatch.setattr(settings, "clova_min_section_chars", 100)
+    text = "\n".join(f"**소제목{i}**\n{_body(chars)}" for i, chars in enumerate([300, 150, 250]))
+    report = validate(text, record=False)
+
+    # 300자 부족 → 단락 최소 길이 기준 3개, 짧은 순으로
+    assert report.issues["length"] and not report.short_sections
+    assert _repair_plan(report, budget=3) == ([1, 2, 0], 0)
+    assert _repair_plan(report, budget=2) == ([1, 2], 0)
+
+
+def test_fake_clova_response_passes_validation():
+    # 부하 테스트 대역 응답이 보충 호출을 부르지 않아야 벤치 수치에 보충 지연이 섞이지 않음
+    from scripts.fake_providers import CLOVA_SECTIONS
+
+    report = validate("\n".join(f"**{title}**\n{body}" for title, body in CLOVA_SECTIONS), record=False)
+
+    assert report.ok